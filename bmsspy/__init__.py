@@ -103,6 +103,160 @@ print(res_02) #=>
 # }
 ```
 
+Each origin can also start at its own (nonnegative) offset by passing a dictionary of origin id: offset pairs. This is the same as adding a super source with an edge of length offset to each origin without rebuilding the graph:
+
+```python
+res_offsets = bmssp_graph.solve(origin_id={0: 0, 2: 0.5})
+print(res_offsets["distance_matrix"]) #=> [0.0, 1.0, 0.5, 1.5, 2.5]
+```
+
+To find which origin serves each node (eg: assigning territories to thousands of stores), pass `source_label=True`. The label of each node is the origin its shortest path starts from (-1 if unreached) and is filled in during the solve such that no predecessor chains need to be walked:
+
+```python
+res_labels = bmssp_graph.solve(origin_id={0,2}, source_label=True)
+print(res_labels["source_label"]) #=> [0, 0, 2, 2, 2]
+```
+
+To get the distance from every node to a target (eg: a hub) on a directed graph, pass `direction="reverse"`. The reversed graph is built once the first time it is needed and then cached (see `bmssp_graph.reverse`), so later reverse solves cost the same as forward solves:
+
+```python
+res_to_4 = bmssp_graph.solve(origin_id=4, direction="reverse")
+print(res_to_4["distance_matrix"]) #=> [3.0, 3.0, 2.0, 2.0, 0.0]
+```
+
+For single point to point queries on large (eg: road) networks, `solve_pair` runs a bidirectional search that meets in the middle and settles far fewer nodes than a one sided search. It returns the same path and length as `solve(origin_id, destination_id)`:
+
+```python
+res_pair = bmssp_graph.solve_pair(origin_id=0, destination_id=4)
+print(res_pair) #=> {'origin_id': 0, 'destination_id': 4, 'path': [0, 2, 4], 'length': 3.0}
+```
+
+Long distance point to point queries can be sped up further with landmarks (ALT). `build_landmarks` picks landmarks with the farthest point heuristic and precomputes compact (float32) distance tables to and from each of them. Once built, `solve_pair` uses triangle inequality lower bounds from the landmarks to only search towards the destination. The landmark tables are saved and shared along with the graph (see `save` and `to_shared_memory` below):
+
+```python
+bmssp_graph.build_landmarks(num_landmarks=2)
+res_alt = bmssp_graph.solve_pair(origin_id=0, destination_id=4)
+print(res_alt["path"]) #=> [0, 2, 4]
+```
+
+On geographic graphs, node coordinates can be used as the lower bound instead of (or along with) landmarks. `set_coordinates` takes the (latitude, longitude) of each node with `metric="haversine"` (in km) or (x, y) points with `metric="euclidean"` and a declared `scale`: the minimum edge weight per unit of distance (eg: `scale=1/100` for travel times in hours with a top speed of 100 km/h). Every edge weight must be at least `scale` times the distance between its nodes for the shortest path to be returned. Partition nodes from the constant degree conversion use the coordinates of their original node:
+
+```python
+bmssp_graph.set_coordinates([(0, 0), (1, 0), (1, 0), (2, 0), (3, 0)], metric="euclidean", scale=1)
+res_geo = bmssp_graph.solve_pair(origin_id=0, destination_id=4)
+print(res_geo["path"]) #=> [0, 2, 4]
+```
+
+For services that answer many point to point queries on a graph that rarely changes, pass `engine="contraction_hierarchy"`. The first such solve builds a contraction hierarchy (node ordering, shortcuts and upward and downward CSR graphs) that is then cached, saved and shared along with the graph. Each query only searches upward from the origin and the destination and unpacks the shortcuts on the shortest path, so it returns the same `path` and `length` as the default engine. `predecessor` and `distance_matrix` are sparse arrays that only store the nodes on the path. Call `build_contraction_hierarchy` to build it ahead of time (eg: before calling `save`):
+
+```python
+bmssp_graph.build_contraction_hierarchy()
+res_ch = bmssp_graph.solve(origin_id=0, destination_id=4, engine="contraction_hierarchy")
+print(res_ch["path"], res_ch["length"]) #=> [0, 2, 4] 3.0
+```
+
+When only distances are needed at very high query rates, `build_hub_labels` builds hub labels (pruned landmark labeling with hubs ordered by a few BMSSP solves). Each `solve_distance` call then merges two small sorted label arrays without running any search. The labels are flat arrays (offsets, hub ids and float64 distances) that are saved and shared along with the graph, and `get_hub_label_memory_usage` reports their size:
+
+```python
+bmssp_graph.build_hub_labels()
+print(bmssp_graph.solve_distance(origin_id=0, destination_id=4)) #=> 3.0
+print(bmssp_graph.get_hub_label_memory_usage()["total_bytes"]) #=> 352
+```
+
+For small graphs where every pair is needed, `all_pairs` solves every node as an origin (optionally with `processes`) and stores a float32 distance matrix and a predecessor matrix. Distance lookups are O(1) and paths are walked back from the stored predecessors in O(path length) without solving. Pass `path` to write each row to a file as soon as it is solved and memory map the file (see `AllPairs.load`) such that the matrices are never held in memory, and `quantize=True` to store distances as uint16 instead:
+
+```python
+all_pairs = bmssp_graph.all_pairs()
+print(all_pairs.distance(0, 4)) #=> 3.0
+print(all_pairs.path(0, 4)) #=> [0, 2, 4]
+```
+
+When the same origins (eg: airports or depots) are solved repeatedly, `set_solve_cache` stores the predecessor list and distance matrix of each full solve as compact arrays under its origin (or frozen origin set). Later solves from a cached origin, including calls for any `destination_id`, only rebuild the outputs and reconstruct the path. Entries are evicted (least recently used first) by their total size in bytes, the cache is cleared when an edge weight is changed with `update_edge_weight` (eg: for live traffic) and `get_solve_cache_info` reports hits, misses and evictions:
+
+```python
+bmssp_graph.set_solve_cache(max_bytes=64 * 2**20)
+bmssp_graph.solve(origin_id=0)
+res_cached = bmssp_graph.solve(origin_id=0, destination_id=4)
+print(res_cached["path"], bmssp_graph.get_solve_cache_info()["hits"]) #=> [0, 2, 4] 1
+bmssp_graph.update_edge_weight(origin_id=2, destination_id=4, weight=5)
+print(bmssp_graph.solve(origin_id=0, destination_id=4)["path"]) #=> [0, 2, 3, 4]
+bmssp_graph.update_edge_weight(origin_id=2, destination_id=4, weight=2)
+bmssp_graph.set_solve_cache(None)
+```
+
+Concurrent solves (eg: from a thread pool or `asyncio.to_thread`) for the same origin are coalesced with or without the cache: the first one runs the solve and the others wait for it and each return a copy of its result. Calls for different destinations share the full solve of their origin unless `early_termination` is used. This avoids duplicate solves in bursts of identical queries (eg: after `clear_solve_cache`), and `get_solve_coalescing_info` reports the number of `solves` run, the number of `coalesced` calls that waited instead of solving and the number of solves `in_flight`:
+
+```python
+print(bmssp_graph.get_solve_coalescing_info()["coalesced"]) #=> 0
+```
+
+When only the path to a single destination is needed, pass `early_termination=True` to stop as soon as the destination distance is final:
+
+```python
+# The work done scales with the number of nodes closer to the origin than the destination instead of the size of the graph
+# Note: Nodes farther from the origin than the destination are returned as unreached (inf distance and -1 predecessor)
+res_0_4 = bmssp_graph.solve(origin_id=0, destination_id=4, early_termination=True)
+print(res_0_4["path"], res_0_4["length"]) #=> [0, 2, 4] 3.0
+```
+
+To only solve for nodes within a maximum distance of the origin, pass `max_distance`. This is used as the upper bound of the BMSSP recursion such that the work done scales with the number of nodes within `max_distance`:
+
+```python
+# The predecessor and distance_matrix are returned as sparse arrays (see below) that only store the node ids within max_distance
+res_0_bounded = bmssp_graph.solve(origin_id=0, max_distance=1)
+print(res_0_bounded["distance_matrix"]) #=> {0: 0.0, 1: 1.0, 2: 1.0}
+print(res_0_bounded["predecessor"]) #=> {0: -1, 1: 0, 2: 0}
+```
+
+To only store the nodes reached by a solve, pass `sparse=True`. The time and memory used to build the result then scales with the number of nodes reached instead of the size of the graph:
+
+```python
+res_1_sparse = bmssp_graph.solve(origin_id=1, sparse=True)
+# Sparse arrays are dictionaries of node id: value pairs for the reached nodes
+print(res_1_sparse["distance_matrix"]) #=> {1: 0.0, 2: 1.0, 3: 2.0, 4: 3.0}
+# Any other node in the graph returns the dense default (inf for distances and -1 for predecessors)
+print(res_1_sparse["distance_matrix"][0] == float("inf")) #=> True
+# Materialize the full dense list only when needed
+print(res_1_sparse["predecessor"].to_list()) #=> [-1, -1, 1, 2, 2]
+```
+
+To find the k closest nodes from a set of targets, use `solve_nearest`. The solve stops as soon as k of the targets are complete such that the work done scales with the number of nodes closer to the origin than the kth closest target:
+
+```python
+nearest = bmssp_graph.solve_nearest(origin_id=0, target_ids=[1, 3, 4], k=2)
+print(nearest) #=>
+# [
+#     {'destination_id': 1, 'length': 1.0, 'path': [0, 1]},
+#     {'destination_id': 3, 'length': 2.0, 'path': [0, 2, 3]}
+# ]
+```
+
+To compute a many-to-many distance table, use `distance_table`. Each unique origin is solved once and each solve stops as soon as all destinations are complete:
+
+```python
+# Returns one float array (array("d")) row for each origin with one column for each destination
+table = bmssp_graph.distance_table(origin_ids=[0, 1], destination_ids=[3, 4, 0])
+print(table) #=> [array('d', [2.0, 3.0, 0.0]), array('d', [2.0, 3.0, inf])]
+# Optionally solve rows across multiple CPU cores (see solve_many)
+# table = bmssp_graph.distance_table(origin_ids=[0, 1], destination_ids=[3, 4, 0], processes=4)
+```
+
+To solve many queries in a batch, use `solve_many`. Results are yielded lazily (in order) as each query is solved:
+
+```python
+for res in bmssp_graph.solve_many(origin_ids=[0, 1, 2], destination_ids=[4, 4, 4]):
+    print(res["path"], res["length"])
+```
+
+To solve a batch across multiple CPU cores, pass `processes`. Each worker process attaches to the prepared graph in shared memory:
+
+```python
+if __name__ == "__main__":
+    # Use ordered=False to yield results as soon as any worker finishes them
+    for res in bmssp_graph.solve_many(origin_ids=range(5), processes=4, chunk_size=2):
+        print(res["origin_id"], res["distance_matrix"])
+```
+
 By default graphs that are given are converted to constant degree such that worst case asymtotic run times are based on the constant degree converted graphs. Before returning a result, the constant degree conversion is undone such that the results are in the original passed graph format.
 
 Most real world graphs are not constant degree. Converting to constant degree graphs can add substantial operational overhead during pre and post processing as well as during the actual algorithmic runtime.
@@ -113,6 +267,61 @@ To skip the constant degree conversion:
 bmssp_graph = Bmssp(graph=graph, use_constant_degree_graph=False)
 ```
 
+By default edge weights are rounded to `precision` decimal places and solved as `Decimal` values. Small unique increments are added to each edge so that no two paths share the same length.
+
+To solve with plain python integers instead of `Decimal` values:
+```python
+# Set weight_mode="integer"
+# Weights are scaled by 10**precision and the unique path adjustments are stored in the low order digits
+# This returns identical results to the default "decimal" weight_mode
+bmssp_graph = Bmssp(graph=graph, weight_mode="integer")
+```
+
+To keep native float weights without any `precision` rounding:
+```python
+# Set weight_mode="lexicographic"
+# Ties in path length are broken by hop count and then by the last edge id instead of unique path adjustments
+bmssp_graph = Bmssp(graph=graph, weight_mode="lexicographic")
+```
+
+Large graphs can also be loaded from array data (eg: lists, `array.array` or numpy arrays) without building a list of dictionaries:
+```python
+# From scipy style CSR arrays where the edges of node i are at positions indptr[i] to indptr[i + 1]
+bmssp_graph = Bmssp.from_csr(
+    indptr=[0, 2, 4, 6, 7, 7],
+    indices=[1, 2, 2, 3, 3, 4, 4],
+    data=[1, 1, 1, 3, 1, 2, 2],
+)
+# From parallel edge arrays
+bmssp_graph = Bmssp.from_edge_arrays(
+    origins=[0, 0, 1, 1, 2, 2, 3],
+    destinations=[1, 2, 2, 3, 3, 4, 4],
+    weights=[1, 1, 1, 3, 1, 2, 2],
+)
+```
+- Note: These constructors still run in pure python (numpy is never required), so building a graph costs a few seconds per million edges.
+    - Most of this time is spent rounding weights to `precision` and converting to the constant degree graph.
+    - `weight_mode="lexicographic"` skips the rounding and `use_constant_degree_graph=False` skips the conversion if construction time matters most.
+
+To skip graph preparation when restarting a process, save a prepared graph and load it later:
+```python
+bmssp_graph.save("graph.bmssp")
+# The saved arrays are memory mapped such that loading is near instant
+# and multiple processes that load the same file share the same memory
+bmssp_graph = Bmssp.load("graph.bmssp")
+```
+
+To share one prepared graph between multiple worker processes without copying it into each one:
+```python
+# In the parent process
+shared_memory = bmssp_graph.to_shared_memory()
+# In each worker process (only the per solve distance and predecessor arrays are private to each worker)
+bmssp_graph = Bmssp.attach(shared_memory.name)
+# In the parent process once all workers are done
+shared_memory.close()
+shared_memory.unlink()
+```
+
 
 
 ## Development
@@ -161,3 +370,4 @@ Make sure Docker is installed and running.
     - `./utils/prettify.sh`"""
 
 from bmsspy.entrypoint import Bmssp
+from bmsspy.all_pairs import AllPairs
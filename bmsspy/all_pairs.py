@@ -0,0 +1,347 @@
+import os
+from array import array
+from tempfile import TemporaryFile
+
+from bmsspy.helpers.storage import ArrayFileWriter, write_arrays, read_arrays
+
+# The quantized value used for unreachable pairs
+QUANTIZED_INF = 2**16 - 1
+
+
+def get_max_finite_distance(distances) -> float:
+    """
+    Function:
+
+    - Return the largest distance that is not inf (or 0 if there is none).
+    """
+    return max(
+        (distance for distance in distances if distance != float("inf")),
+        default=0,
+    )
+
+
+def quantize_distances(distances, distance_step: float) -> array:
+    """
+    Function:
+
+    - Return distances as a uint16 array of multiples of distance_step where QUANTIZED_INF marks unreachable pairs.
+    """
+    return array(
+        "H",
+        (
+            (
+                round(distance / distance_step)
+                if distance != float("inf")
+                else QUANTIZED_INF
+            )
+            for distance in distances
+        ),
+    )
+
+
+class AllPairs:
+    def __init__(self, metadata: dict, arrays: dict):
+        """
+        Function:
+
+        - Initialize an all pairs distance oracle from the metadata and arrays built by `Bmssp.all_pairs` (or loaded with `AllPairs.load`).
+        - Distances and predecessors are stored as flat row major matrices such that each lookup is O(1)
+          and each path is walked back from the destination in O(path length) without solving.
+
+        Required Arguments:
+
+        - `metadata`
+            - Type: dict
+            - What: A dictionary with the following keys
+                - `graph_len`: The number of nodes in the graph
+                - `distance_step`: The distance of one quantized unit (or None if distances are not quantized)
+        - `arrays`
+            - Type: dict
+            - What: A dictionary with the following keys
+                - `distances`: The distance from origin i to destination j at position i * graph_len + j
+                    - Note: This is a float32 array or (if quantized) a uint16 array where QUANTIZED_INF marks unreachable pairs
+                - `predecessors`: The predecessor of destination j on the shortest path from origin i at position i * graph_len + j (-1 if none)
+
+        Optional Arguments:
+
+        - None
+        """
+        self.graph_len = metadata["graph_len"]
+        self.distance_step = metadata["distance_step"]
+        self.distances = arrays["distances"]
+        self.predecessors = arrays["predecessors"]
+
+    @classmethod
+    def from_rows(cls, rows, quantize: bool = False):
+        """
+        Function:
+
+        - Build an all pairs distance oracle from the distance and predecessor row of each origin.
+
+        Required Arguments:
+
+        - `rows`
+            - Type: iterable of (distance row, predecessor row) tuples
+            - What: The distances from each origin to every node and the predecessor list of each origin in order of origin id
+            - Note: Both full matrices are built in memory (8 bytes per pair plus a second 2 byte per pair copy if quantized).
+                - Use `AllPairs.write_rows` to write rows straight to a file instead.
+
+        Optional Arguments:
+
+        - `quantize`
+            - Type: bool
+            - Default: False
+            - What: Whether to store distances as uint16 multiples of the largest finite distance / (QUANTIZED_INF - 1) instead of float32
+            - Note: This halves the size of the distance matrix at the cost of precision.
+
+        Returns:
+
+        - An AllPairs object
+        """
+        distances = array("f")
+        predecessors = None
+        graph_len = 0
+        for distance_row, predecessor_row in rows:
+            if predecessors is None:
+                graph_len = len(distance_row)
+                predecessors = array("i" if graph_len < 2**31 else "q")
+            distances.extend(distance_row)
+            predecessors.extend(predecessor_row)
+        if predecessors is None:
+            predecessors = array("i")
+        distance_step = None
+        if quantize:
+            distance_step = (
+                get_max_finite_distance(distances) / (QUANTIZED_INF - 1) or 1.0
+            )
+            distances = quantize_distances(distances, distance_step)
+        return cls(
+            metadata={"graph_len": graph_len, "distance_step": distance_step},
+            arrays={"distances": distances, "predecessors": predecessors},
+        )
+
+    @staticmethod
+    def write_rows(
+        path: str, rows, graph_len: int, quantize: bool = False
+    ) -> None:
+        """
+        Function:
+
+        - Write the distance and predecessor row of each origin straight to a file that can be memory mapped by `AllPairs.load`.
+        - Each row is written as soon as it is yielded such that only one row is held in memory at a time.
+            - Note: If quantized, the float32 rows are first written to a temporary file since the largest distance is only known once every row is solved.
+
+        Required Arguments:
+
+        - `path`
+            - Type: str
+            - What: The file path to write to
+        - `rows`
+            - Type: iterable of (distance row, predecessor row) tuples
+            - What: See `AllPairs.from_rows`
+            - Note: Distance rows must be float32 arrays and predecessor rows must be int32 arrays (int64 if graph_len >= 2**31).
+        - `graph_len`
+            - Type: int
+            - What: The number of nodes in the graph (and the length of each row)
+
+        Optional Arguments:
+
+        - `quantize`
+            - Type: bool
+            - Default: False
+            - What: See `AllPairs.from_rows`
+        """
+        metadata = {
+            "all_pairs": True,
+            "graph_len": graph_len,
+            "distance_step": None,
+        }
+        writer = ArrayFileWriter(
+            path=path,
+            metadata=metadata,
+            arrays={
+                "distances": ("H" if quantize else "f", graph_len**2),
+                "predecessors": (
+                    "i" if graph_len < 2**31 else "q",
+                    graph_len**2,
+                ),
+            },
+            # Leave room to replace the None distance_step with a float
+            reserved_len=32 if quantize else 0,
+        )
+        try:
+            if quantize:
+                with TemporaryFile() as distance_file:
+                    max_distance = 0
+                    for distance_row, predecessor_row in rows:
+                        distance_row.tofile(distance_file)
+                        writer.write("predecessors", predecessor_row)
+                        max_distance = max(
+                            max_distance, get_max_finite_distance(distance_row)
+                        )
+                    distance_step = max_distance / (QUANTIZED_INF - 1) or 1.0
+                    distance_file.seek(0)
+                    for _ in range(graph_len):
+                        distance_row = array("f")
+                        distance_row.fromfile(distance_file, graph_len)
+                        writer.write(
+                            "distances",
+                            quantize_distances(distance_row, distance_step),
+                        )
+                writer.set_metadata(
+                    {**metadata, "distance_step": distance_step}
+                )
+            else:
+                for distance_row, predecessor_row in rows:
+                    writer.write("distances", distance_row)
+                    writer.write("predecessors", predecessor_row)
+        except BaseException:
+            # Never leave a partially written file that could be loaded
+            writer.close()
+            os.remove(path)
+            raise
+        writer.close()
+
+    def distance(self, origin_id: int, destination_id: int) -> float:
+        """
+        Function:
+
+        - Return the stored shortest distance from origin_id to destination_id (inf if unreachable).
+            - Note: Distances are stored as float32 (about 7 significant digits).
+            - Note: Quantized distances are within half of `distance_step` of the shortest distance.
+
+        Required Arguments:
+
+        - `origin_id`
+            - Type: int
+            - What: The id of the origin node
+        - `destination_id`
+            - Type: int
+            - What: The id of the destination node
+
+        Optional Arguments:
+
+        - None
+        """
+        distance = self.distances[self._get_position(origin_id, destination_id)]
+        if self.distance_step is None:
+            return distance
+        if distance == QUANTIZED_INF:
+            return float("inf")
+        return distance * self.distance_step
+
+    def path(self, origin_id: int, destination_id: int) -> list[int] | None:
+        """
+        Function:
+
+        - Return the shortest path [origin_id, ..., destination_id] by walking the stored predecessors back from the destination.
+        - This is the same path as `Bmssp.solve(origin_id, destination_id)["path"]`.
+
+        Required Arguments:
+
+        - `origin_id`
+            - Type: int
+            - What: The id of the origin node
+        - `destination_id`
+            - Type: int
+            - What: The id of the destination node
+
+        Optional Arguments:
+
+        - None
+
+        Returns:
+
+        - The shortest path as a list of node ids (or None if the destination is not reachable)
+        """
+        position = self._get_position(origin_id, destination_id)
+        if origin_id != destination_id and self.predecessors[position] == -1:
+            return None
+        row_start = position - destination_id
+        predecessors = self.predecessors
+        output_path = [destination_id]
+        node_idx = destination_id
+        while node_idx != origin_id:
+            node_idx = predecessors[row_start + node_idx]
+            output_path.append(node_idx)
+        output_path.reverse()
+        return output_path
+
+    def save(self, path: str) -> None:
+        """
+        Function:
+
+        - Save the distance and predecessor matrices to a versioned binary file that can be memory mapped by `AllPairs.load`.
+
+        Required Arguments:
+
+        - `path`:
+            - Type: str
+            - What: The file path to save to
+
+        Optional Arguments:
+
+        - None
+        """
+        write_arrays(
+            path=path,
+            metadata={
+                "all_pairs": True,
+                "graph_len": self.graph_len,
+                "distance_step": self.distance_step,
+            },
+            arrays={
+                "distances": self.distances,
+                "predecessors": self.predecessors,
+            },
+        )
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        Function:
+
+        - Load an all pairs distance oracle saved with `AllPairs.save` (or `Bmssp.all_pairs`).
+        - The matrices are memory mapped (read only) such that loading is near instant and
+          multiple processes that load the same file share the same physical memory pages.
+
+        Required Arguments:
+
+        - `path`:
+            - Type: str
+            - What: The file path to load from
+
+        Optional Arguments:
+
+        - None
+
+        Returns:
+
+        - An AllPairs object
+        """
+        metadata, arrays, mapped_file = read_arrays(path)
+        if not metadata.get("all_pairs"):
+            raise ValueError(
+                f"The file at {path} is not a saved bmsspy all pairs oracle"
+            )
+        self = cls(metadata=metadata, arrays=arrays)
+        # Keep the file mapped as long as this object is used
+        self._mapped_file = mapped_file
+        return self
+
+    def _get_position(self, origin_id: int, destination_id: int) -> int:
+        """
+        Function:
+
+        - Validate an origin and destination and return their position in the flat matrices.
+        """
+        if not (
+            isinstance(origin_id, int)
+            and isinstance(destination_id, int)
+            and 0 <= origin_id < self.graph_len
+            and 0 <= destination_id < self.graph_len
+        ):
+            raise ValueError(
+                f"Your provided origin_id ({origin_id}) and destination_id ({destination_id}) must be ints in the range [0, {self.graph_len})"
+            )
+        return origin_id * self.graph_len + destination_id
@@ -0,0 +1,142 @@
+from heapq import heappush, heappop
+
+from bmsspy.helpers.utils import inf
+
+
+class AStarCore:
+    def __init__(
+        self,
+        graph: dict,
+        reverse_graph: dict,
+        origin_id: int,
+        destination_id: int,
+        heuristic,
+    ):
+        """
+        Function:
+
+        - Solve a single point to point query with a goal directed (A*) search that uses a lower bound on the distance from each node to the destination.
+        - Nodes are reopened whenever their distance improves such that the heuristic only needs to be admissible (never more than the true distance).
+        - The search continues until the smallest estimate in the heap is more than the destination distance
+          such that every node on any shortest path is solved exactly (even if the heuristic is not consistent).
+        - The path is chosen with the same unique path length tie-breaking as BmsspCore:
+            - The predecessor of each node on the path is the tight incoming edge with the smallest edge id adjustment (the smallest key).
+
+        Required Arguments:
+
+        - graph:
+            - Type: dict
+            - What: The CSR graph used by BmsspCore (with `indptr`, `indices` and `weights` keys)
+            - Note: The weights must be exact when summed (decimal and integer weight modes).
+        - reverse_graph:
+            - Type: dict
+            - What: The transposed CSR graph with `indptr`, `indices` and `edge_positions` keys
+                - `edge_positions`: The position of each reversed edge in `graph` (used to look up its weight)
+        - origin_id:
+            - Type: int
+            - What: The id of the node to start from (in the used graph)
+        - destination_id:
+            - Type: int
+            - What: The id of the node to end at (in the used graph)
+        - heuristic:
+            - Type: function
+            - What: A function that takes a node id (in the used graph) and returns a lower bound on its distance to the destination in the same units as the weights
+            - Note: Return None if the node can not reach the destination such that it is never searched.
+
+        Attributes (after solving):
+
+        - path_node_ids:
+            - Type: list[int] | None
+            - What: The nodes on the shortest path from origin_id to destination_id in order
+            - Note: None if the destination is not reachable from the origin
+        - path_edge_positions:
+            - Type: list[int] | None
+            - What: The position in `graph` of each edge on the shortest path in order
+        - is_tie_unresolved:
+            - Type: bool
+            - What: Always False since ties are resolved from the exact distances of every node on a shortest path (see BidirectionalCore)
+        - settled_count:
+            - Type: int
+            - What: The number of times a node was settled (including reopened nodes)
+        """
+        self.path_node_ids = None
+        self.path_edge_positions = None
+        self.is_tie_unresolved = False
+        self.settled_count = 0
+        indptr = graph["indptr"]
+        indices = graph["indices"]
+        weights = graph["weights"]
+
+        origin_estimate = heuristic(origin_id)
+        if origin_estimate is None:
+            return
+        distances = {origin_id: 0}
+        # Each node's lower bound is only computed once
+        estimates = {origin_id: origin_estimate}
+        heap = [(origin_estimate, 0, origin_id)]
+        best_distance = inf
+        while heap:
+            estimate, distance, node_idx = heappop(heap)
+            # Every node with an estimate up to the destination distance must be settled
+            if estimate > best_distance:
+                break
+            if distance > distances[node_idx]:
+                continue
+            self.settled_count += 1
+            if node_idx == destination_id:
+                best_distance = distance
+                continue
+            for edge_idx in range(indptr[node_idx], indptr[node_idx + 1]):
+                connection_idx = indices[edge_idx]
+                new_distance = distance + weights[edge_idx]
+                if new_distance < distances.get(connection_idx, inf):
+                    if connection_idx in estimates:
+                        connection_estimate = estimates[connection_idx]
+                    else:
+                        connection_estimate = heuristic(connection_idx)
+                        estimates[connection_idx] = connection_estimate
+                    # Nodes that can not reach the destination are pruned
+                    if connection_estimate is None:
+                        continue
+                    distances[connection_idx] = new_distance
+                    heappush(
+                        heap,
+                        (
+                            new_distance + connection_estimate,
+                            new_distance,
+                            connection_idx,
+                        ),
+                    )
+
+        if best_distance == inf:
+            return
+        # Walk back from the destination along the tight edges with the smallest edge position
+        reverse_indptr = reverse_graph["indptr"]
+        reverse_indices = reverse_graph["indices"]
+        edge_positions = reverse_graph["edge_positions"]
+        path_node_ids = [destination_id]
+        path_edge_positions = []
+        node_idx = destination_id
+        while node_idx != origin_id:
+            node_distance = distances[node_idx]
+            best_edge_idx = None
+            for reverse_edge_idx in range(
+                reverse_indptr[node_idx], reverse_indptr[node_idx + 1]
+            ):
+                connection_idx = reverse_indices[reverse_edge_idx]
+                edge_idx = edge_positions[reverse_edge_idx]
+                if (
+                    connection_idx in distances
+                    and distances[connection_idx] + weights[edge_idx]
+                    == node_distance
+                    and (best_edge_idx is None or edge_idx < best_edge_idx)
+                ):
+                    best_edge_idx = edge_idx
+                    predecessor_idx = connection_idx
+            path_edge_positions.append(best_edge_idx)
+            path_node_ids.append(predecessor_idx)
+            node_idx = predecessor_idx
+        path_edge_positions.reverse()
+        path_node_ids.reverse()
+        self.path_node_ids = path_node_ids
+        self.path_edge_positions = path_edge_positions
@@ -0,0 +1,205 @@
+from heapq import heappush, heappop
+
+from bmsspy.helpers.utils import inf
+
+
+class BidirectionalCore:
+    def __init__(
+        self,
+        graph: dict,
+        reverse_graph: dict,
+        origin_id: int,
+        destination_id: int,
+    ):
+        """
+        Function:
+
+        - Solve a single point to point query with a bidirectional Dijkstra search that meets in the middle.
+        - A forward search from the origin and a backward search from the destination are alternated (always expanding the side with the smaller distance)
+          until the meeting point criterion holds: the smallest forward distance plus the smallest backward distance is more than the best path distance found so far.
+            - Note: The strict criterion ensures that every node on any shortest path is settled by at least one of the searches.
+        - Distances include the counter_value for each edge (as in BmsspCore) such that only paths with the same length and number of edges can tie.
+            - The number of shortest paths (capped at 2) to each settled node is tracked in both searches.
+            - If exactly one shortest path exists, it is the same path that BmsspCore finds.
+            - Otherwise `is_tie_unresolved` is set since picking the same path as BmsspCore needs its edge id tie-breakers for every node on the path.
+
+        Required Arguments:
+
+        - graph:
+            - Type: dict
+            - What: The CSR graph used by BmsspCore (with `indptr`, `indices` and `weights` keys)
+            - Note: The weights must be exact when summed in any order (decimal and integer weight modes).
+        - reverse_graph:
+            - Type: dict
+            - What: The transposed CSR graph with `indptr`, `indices` and `edge_positions` keys
+                - `edge_positions`: The position of each reversed edge in `graph` (used to look up its weight)
+        - origin_id:
+            - Type: int
+            - What: The id of the node to start from (in the used graph)
+        - destination_id:
+            - Type: int
+            - What: The id of the node to end at (in the used graph)
+
+        Attributes (after solving):
+
+        - path_node_ids:
+            - Type: list[int] | None
+            - What: The nodes on the shortest path from origin_id to destination_id in order
+            - Note: None if the destination is not reachable from the origin or if `is_tie_unresolved` is True
+        - path_edge_positions:
+            - Type: list[int] | None
+            - What: The position in `graph` of each edge on the shortest path in order
+        - is_tie_unresolved:
+            - Type: bool
+            - What: Whether more than one shortest path exists
+        - settled_count:
+            - Type: int
+            - What: The number of nodes settled by both searches combined
+        """
+        self.path_node_ids = None
+        self.path_edge_positions = None
+        self.is_tie_unresolved = False
+        self.settled_count = 0
+        if origin_id == destination_id:
+            self.path_node_ids = [origin_id]
+            self.path_edge_positions = []
+            return
+        indptr = graph["indptr"]
+        indices = graph["indices"]
+        weights = graph["weights"]
+        reverse_indptr = reverse_graph["indptr"]
+        reverse_indices = reverse_graph["indices"]
+        edge_positions = reverse_graph["edge_positions"]
+
+        # The distance, shortest path count (capped at 2) and last edge for each node in each direction
+        forward_distances = {origin_id: 0}
+        forward_counts = {origin_id: 1}
+        forward_edges = {origin_id: -1}
+        forward_predecessor = {origin_id: -1}
+        forward_heap = [(0, origin_id)]
+        forward_settled = set()
+        backward_distances = {destination_id: 0}
+        backward_counts = {destination_id: 1}
+        backward_edges = {destination_id: -1}
+        backward_heap = [(0, destination_id)]
+        backward_settled = set()
+        # The best path distance found so far (mu)
+        best_distance = inf
+
+        while forward_heap and backward_heap:
+            forward_distance = forward_heap[0][0]
+            backward_distance = backward_heap[0][0]
+            if forward_distance + backward_distance > best_distance:
+                break
+            if forward_distance <= backward_distance:
+                distance, node_idx = heappop(forward_heap)
+                if node_idx in forward_settled:
+                    continue
+                forward_settled.add(node_idx)
+                node_count = forward_counts[node_idx]
+                for edge_idx in range(indptr[node_idx], indptr[node_idx + 1]):
+                    connection_idx = indices[edge_idx]
+                    new_distance = distance + weights[edge_idx]
+                    connection_distance = forward_distances.get(
+                        connection_idx, inf
+                    )
+                    if new_distance < connection_distance:
+                        forward_distances[connection_idx] = new_distance
+                        forward_counts[connection_idx] = node_count
+                        forward_edges[connection_idx] = edge_idx
+                        forward_predecessor[connection_idx] = node_idx
+                        heappush(forward_heap, (new_distance, connection_idx))
+                        if connection_idx in backward_distances:
+                            best_distance = min(
+                                best_distance,
+                                new_distance
+                                + backward_distances[connection_idx],
+                            )
+                    elif new_distance == connection_distance:
+                        forward_counts[connection_idx] = min(
+                            2, forward_counts[connection_idx] + node_count
+                        )
+            else:
+                distance, node_idx = heappop(backward_heap)
+                if node_idx in backward_settled:
+                    continue
+                backward_settled.add(node_idx)
+                node_count = backward_counts[node_idx]
+                for reverse_edge_idx in range(
+                    reverse_indptr[node_idx], reverse_indptr[node_idx + 1]
+                ):
+                    connection_idx = reverse_indices[reverse_edge_idx]
+                    edge_idx = edge_positions[reverse_edge_idx]
+                    new_distance = distance + weights[edge_idx]
+                    connection_distance = backward_distances.get(
+                        connection_idx, inf
+                    )
+                    if new_distance < connection_distance:
+                        backward_distances[connection_idx] = new_distance
+                        backward_counts[connection_idx] = node_count
+                        backward_edges[connection_idx] = edge_idx
+                        heappush(backward_heap, (new_distance, connection_idx))
+                        if connection_idx in forward_distances:
+                            best_distance = min(
+                                best_distance,
+                                new_distance
+                                + forward_distances[connection_idx],
+                            )
+                    elif new_distance == connection_distance:
+                        backward_counts[connection_idx] = min(
+                            2, backward_counts[connection_idx] + node_count
+                        )
+
+        self.settled_count = len(forward_settled) + len(backward_settled)
+        if best_distance == inf:
+            return
+        # Every shortest path leaves the forward settled nodes (a prefix of the path) exactly once
+        # and the rest of the path is settled by the backward search
+        if destination_id in forward_settled:
+            path_count = forward_counts[destination_id]
+            crossing_edge_idx = -1
+            crossing_node_idx = destination_id
+        else:
+            path_count = 0
+            for node_idx in forward_settled:
+                node_distance = forward_distances[node_idx]
+                for edge_idx in range(indptr[node_idx], indptr[node_idx + 1]):
+                    connection_idx = indices[edge_idx]
+                    if (
+                        connection_idx in forward_settled
+                        or connection_idx not in backward_settled
+                    ):
+                        continue
+                    if (
+                        node_distance
+                        + weights[edge_idx]
+                        + backward_distances[connection_idx]
+                        == best_distance
+                    ):
+                        path_count += (
+                            forward_counts[node_idx]
+                            * backward_counts[connection_idx]
+                        )
+                        crossing_edge_idx = edge_idx
+                        crossing_node_idx = node_idx
+        if path_count != 1:
+            self.is_tie_unresolved = True
+            return
+        # Walk the forward half back to the origin and the backward half on to the destination
+        path_edge_positions = []
+        path_node_ids = [crossing_node_idx]
+        node_idx = crossing_node_idx
+        while forward_edges[node_idx] != -1:
+            path_edge_positions.append(forward_edges[node_idx])
+            node_idx = forward_predecessor[node_idx]
+            path_node_ids.append(node_idx)
+        path_edge_positions.reverse()
+        path_node_ids.reverse()
+        edge_idx = crossing_edge_idx
+        while edge_idx != -1:
+            node_idx = indices[edge_idx]
+            path_edge_positions.append(edge_idx)
+            path_node_ids.append(node_idx)
+            edge_idx = backward_edges[node_idx]
+        self.path_node_ids = path_node_ids
+        self.path_edge_positions = path_edge_positions
@@ -0,0 +1,424 @@
+from array import array
+from heapq import heappush, heappop, heapify
+
+from bmsspy.helpers.utils import inf
+
+
+def build_contraction_hierarchy(
+    graph: dict, witness_settle_limit: int = 64
+) -> dict:
+    """
+    Function:
+
+    - Build a contraction hierarchy for repeated point to point solves (see `ContractionHierarchyCore`).
+    - Nodes are contracted one at a time in order of their edge difference (the number of shortcuts added minus the number of edges removed) plus their number of contracted neighbors.
+        - Priorities are updated lazily: the node with the smallest priority is only contracted if its recomputed priority is still the smallest.
+    - Contracting a node adds a shortcut u -> w for each pair of remaining neighbors u -> node -> w unless a witness search finds a strictly shorter path from u to w that avoids the node.
+        - Note: Shortcuts are kept for witnesses with the same length such that every shortest path is kept in the hierarchy.
+        - Note: Each edge stores the number of shortest paths it represents (capped at 2) such that ties can be detected by the query.
+    - Distances include the counter_value for each edge (as in BmsspCore) such that only paths with the same length and number of edges can tie.
+
+    Required Arguments:
+
+    - `graph`
+        - Type: dict
+        - What: The CSR graph used by BmsspCore (with `indptr`, `indices` and `weights` keys)
+        - Note: The weights must be exact when summed in any order (decimal and integer weight modes).
+
+    Optional Arguments:
+
+    - `witness_settle_limit`
+        - Type: int
+        - Default: 64
+        - What: The maximum number of nodes settled by each witness search
+        - Note: Smaller limits build faster but may add shortcuts that are not needed (which slows down queries).
+
+    Returns:
+
+    - A dictionary of arrays with the following keys
+        - `up_indptr`, `up_indices` and `up_edges`: A CSR graph of the edges to higher ranked nodes and the hierarchy edge id of each
+        - `down_indptr`, `down_indices` and `down_edges`: A CSR graph of the edges from higher ranked nodes (stored at their head) and the hierarchy edge id of each
+        - `edge_first` and `edge_second`: The two hierarchy edges that each shortcut replaces (-1 for edges of the graph)
+        - `edge_position`: The position in `graph` of each edge of the graph (-1 for shortcuts)
+        - `edge_count`: The number of shortest paths that each edge represents (capped at 2)
+        - `edge_weights`: The weight of each edge (see `get_hierarchy_edge_weights`)
+    """
+    indptr = graph["indptr"]
+    indices = graph["indices"]
+    weights = graph["weights"]
+    graph_len = len(indptr) - 1
+
+    edge_first = array("q")
+    edge_second = array("q")
+    edge_position = array("q")
+    edge_count = array("b")
+    edge_weights = []
+    # The edges between nodes that are not contracted yet (neighbor id: hierarchy edge id)
+    out_edges = [{} for _ in range(graph_len)]
+    in_edges = [{} for _ in range(graph_len)]
+
+    def add_edge(tail, head, weight, count, first, second, position):
+        existing_edge_idx = out_edges[tail].get(head)
+        if existing_edge_idx is not None:
+            existing_weight = edge_weights[existing_edge_idx]
+            if existing_weight < weight:
+                return
+            if existing_weight == weight:
+                edge_count[existing_edge_idx] = min(
+                    2, edge_count[existing_edge_idx] + count
+                )
+                return
+        out_edges[tail][head] = len(edge_weights)
+        in_edges[head][tail] = len(edge_weights)
+        edge_first.append(first)
+        edge_second.append(second)
+        edge_position.append(position)
+        edge_count.append(count)
+        edge_weights.append(weight)
+
+    for node_idx in range(graph_len):
+        for edge_idx in range(indptr[node_idx], indptr[node_idx + 1]):
+            # Self loops are never on a shortest path
+            if indices[edge_idx] != node_idx:
+                add_edge(
+                    node_idx,
+                    indices[edge_idx],
+                    weights[edge_idx],
+                    1,
+                    -1,
+                    -1,
+                    edge_idx,
+                )
+
+    def get_shortcuts(node_idx):
+        shortcuts = []
+        node_out_edges = list(out_edges[node_idx].items())
+        for tail, in_edge_idx in in_edges[node_idx].items():
+            in_weight = edge_weights[in_edge_idx]
+            unsettled_heads = {
+                head for head, _ in node_out_edges if head != tail
+            }
+            if not unsettled_heads:
+                continue
+            max_weight = in_weight + max(
+                edge_weights[out_edge_idx] for _, out_edge_idx in node_out_edges
+            )
+            # Witness search from the tail that avoids the contracted node
+            witness_distances = {tail: 0}
+            witness_heap = [(0, tail)]
+            settled_count = 0
+            while witness_heap and settled_count < witness_settle_limit:
+                distance, witness_idx = heappop(witness_heap)
+                if distance > max_weight:
+                    break
+                if distance > witness_distances[witness_idx]:
+                    continue
+                settled_count += 1
+                # Stop once the distance to every head is final
+                unsettled_heads.discard(witness_idx)
+                if not unsettled_heads:
+                    break
+                for connection_idx, edge_idx in out_edges[witness_idx].items():
+                    if connection_idx == node_idx:
+                        continue
+                    new_distance = distance + edge_weights[edge_idx]
+                    if new_distance < witness_distances.get(
+                        connection_idx, inf
+                    ):
+                        witness_distances[connection_idx] = new_distance
+                        heappush(witness_heap, (new_distance, connection_idx))
+            for head, out_edge_idx in node_out_edges:
+                if head == tail:
+                    continue
+                weight = in_weight + edge_weights[out_edge_idx]
+                # Any tentative witness distance is the length of a real path
+                if witness_distances.get(head, inf) < weight:
+                    continue
+                shortcuts.append(
+                    (
+                        tail,
+                        head,
+                        weight,
+                        min(
+                            2,
+                            edge_count[in_edge_idx] * edge_count[out_edge_idx],
+                        ),
+                        in_edge_idx,
+                        out_edge_idx,
+                    )
+                )
+        return shortcuts
+
+    contracted_neighbors = [0] * graph_len
+
+    def get_priority(node_idx, shortcuts):
+        return (
+            len(shortcuts)
+            - len(in_edges[node_idx])
+            - len(out_edges[node_idx])
+            + contracted_neighbors[node_idx]
+        )
+
+    up_edge_lists = [None] * graph_len
+    down_edge_lists = [None] * graph_len
+    priority_heap = [
+        (get_priority(node_idx, get_shortcuts(node_idx)), node_idx)
+        for node_idx in range(graph_len)
+    ]
+    heapify(priority_heap)
+    while priority_heap:
+        _, node_idx = heappop(priority_heap)
+        shortcuts = get_shortcuts(node_idx)
+        priority = get_priority(node_idx, shortcuts)
+        if priority_heap and priority > priority_heap[0][0]:
+            heappush(priority_heap, (priority, node_idx))
+            continue
+        # The remaining edges of a contracted node all connect to higher ranked nodes
+        up_edge_lists[node_idx] = list(out_edges[node_idx].items())
+        down_edge_lists[node_idx] = list(in_edges[node_idx].items())
+        for head, _ in up_edge_lists[node_idx]:
+            del in_edges[head][node_idx]
+        for tail, _ in down_edge_lists[node_idx]:
+            del out_edges[tail][node_idx]
+        for neighbor_idx in set(out_edges[node_idx]) | set(in_edges[node_idx]):
+            contracted_neighbors[neighbor_idx] += 1
+        out_edges[node_idx] = {}
+        in_edges[node_idx] = {}
+        for tail, head, weight, count, first, second in shortcuts:
+            add_edge(tail, head, weight, count, first, second, -1)
+
+    hierarchy = {
+        "edge_first": edge_first,
+        "edge_second": edge_second,
+        "edge_position": edge_position,
+        "edge_count": edge_count,
+        "edge_weights": edge_weights,
+    }
+    for direction, edge_lists in [
+        ("up", up_edge_lists),
+        ("down", down_edge_lists),
+    ]:
+        direction_indptr = array("q", [0])
+        direction_indices = array("q")
+        direction_edges = array("q")
+        for edge_list in edge_lists:
+            for connection_idx, edge_idx in edge_list:
+                direction_indices.append(connection_idx)
+                direction_edges.append(edge_idx)
+            direction_indptr.append(len(direction_indices))
+        hierarchy[direction + "_indptr"] = direction_indptr
+        hierarchy[direction + "_indices"] = direction_indices
+        hierarchy[direction + "_edges"] = direction_edges
+    return hierarchy
+
+
+def get_hierarchy_edge_weights(hierarchy: dict, weights) -> list:
+    """
+    Function:
+
+    - Return the weight of each contraction hierarchy edge from the weights of the graph it was built from.
+    - Each shortcut is added after the two edges it replaces such that all weights are found in a single pass.
+
+    Required Arguments:
+
+    - `hierarchy`
+        - Type: dict
+        - What: The contraction hierarchy (with `edge_first`, `edge_second` and `edge_position` keys) as returned by `build_contraction_hierarchy`
+    - `weights`
+        - Type: list | array
+        - What: The weights of the graph the hierarchy was built from
+
+    Optional Arguments:
+
+    - None
+    """
+    edge_weights = []
+    for first, second, position in zip(
+        hierarchy["edge_first"],
+        hierarchy["edge_second"],
+        hierarchy["edge_position"],
+    ):
+        if position == -1:
+            edge_weights.append(edge_weights[first] + edge_weights[second])
+        else:
+            edge_weights.append(weights[position])
+    return edge_weights
+
+
+class ContractionHierarchyCore:
+    def __init__(
+        self,
+        graph: dict,
+        hierarchy: dict,
+        origin_id: int,
+        destination_id: int,
+    ):
+        """
+        Function:
+
+        - Solve a single point to point query with a bidirectional search on a contraction hierarchy.
+        - The forward search from the origin only follows edges to higher ranked nodes and the backward search from the destination
+          only follows edges from higher ranked nodes such that each search only settles a small number of nodes.
+        - Both searches continue until the smallest distance left in either search is more than the best path distance found so far.
+            - Note: The strict criterion ensures that the highest ranked node of every shortest path is settled by both searches.
+        - The number of shortest paths (capped at 2) is tracked in both searches.
+            - If exactly one shortest path exists, its shortcuts are unpacked into the edges of `graph` and it is the same path that BmsspCore finds.
+            - Otherwise `is_tie_unresolved` is set (see BidirectionalCore).
+
+        Required Arguments:
+
+        - graph:
+            - Type: dict
+            - What: The CSR graph that the hierarchy was built from (with `indptr`, `indices` and `weights` keys)
+        - hierarchy:
+            - Type: dict
+            - What: The contraction hierarchy as returned by `build_contraction_hierarchy`
+        - origin_id:
+            - Type: int
+            - What: The id of the node to start from (in the used graph)
+        - destination_id:
+            - Type: int
+            - What: The id of the node to end at (in the used graph)
+
+        Attributes (after solving):
+
+        - path_node_ids:
+            - Type: list[int] | None
+            - What: The nodes on the shortest path from origin_id to destination_id in order
+            - Note: None if the destination is not reachable from the origin or if `is_tie_unresolved` is True
+        - path_edge_positions:
+            - Type: list[int] | None
+            - What: The position in `graph` of each edge on the shortest path in order
+        - is_tie_unresolved:
+            - Type: bool
+            - What: Whether more than one shortest path exists
+        - settled_count:
+            - Type: int
+            - What: The number of nodes settled by both searches combined
+        """
+        self.path_node_ids = None
+        self.path_edge_positions = None
+        self.is_tie_unresolved = False
+        self.settled_count = 0
+        edge_count = hierarchy["edge_count"]
+        edge_weights = hierarchy["edge_weights"]
+
+        # The distance, shortest path count (capped at 2), hierarchy edge and next node towards the search origin for each node in each direction
+        searches = []
+        for direction, start_idx in [
+            ("up", origin_id),
+            ("down", destination_id),
+        ]:
+            searches.append(
+                {
+                    "indptr": hierarchy[direction + "_indptr"],
+                    "indices": hierarchy[direction + "_indices"],
+                    "edges": hierarchy[direction + "_edges"],
+                    "distances": {start_idx: 0},
+                    "counts": {start_idx: 1},
+                    "edge": {start_idx: -1},
+                    "previous": {start_idx: -1},
+                    "heap": [(0, start_idx)],
+                    "settled": set(),
+                }
+            )
+        forward_search, backward_search = searches
+        # The best path distance found so far (mu)
+        best_distance = inf
+
+        while forward_search["heap"] or backward_search["heap"]:
+            if forward_search["heap"] and (
+                not backward_search["heap"]
+                or forward_search["heap"][0][0] <= backward_search["heap"][0][0]
+            ):
+                search, other_search = forward_search, backward_search
+            else:
+                search, other_search = backward_search, forward_search
+            if search["heap"][0][0] > best_distance:
+                break
+            distance, node_idx = heappop(search["heap"])
+            if node_idx in search["settled"]:
+                continue
+            search["settled"].add(node_idx)
+            if node_idx in other_search["distances"]:
+                best_distance = min(
+                    best_distance,
+                    distance + other_search["distances"][node_idx],
+                )
+            distances = search["distances"]
+            counts = search["counts"]
+            node_count = counts[node_idx]
+            search_indices = search["indices"]
+            search_edges = search["edges"]
+            for idx in range(
+                search["indptr"][node_idx], search["indptr"][node_idx + 1]
+            ):
+                connection_idx = search_indices[idx]
+                edge_idx = search_edges[idx]
+                new_distance = distance + edge_weights[edge_idx]
+                connection_distance = distances.get(connection_idx, inf)
+                if new_distance < connection_distance:
+                    distances[connection_idx] = new_distance
+                    counts[connection_idx] = min(
+                        2, node_count * edge_count[edge_idx]
+                    )
+                    search["edge"][connection_idx] = edge_idx
+                    search["previous"][connection_idx] = node_idx
+                    heappush(search["heap"], (new_distance, connection_idx))
+                elif new_distance == connection_distance:
+                    counts[connection_idx] = min(
+                        2,
+                        counts[connection_idx]
+                        + node_count * edge_count[edge_idx],
+                    )
+
+        self.settled_count = len(forward_search["settled"]) + len(
+            backward_search["settled"]
+        )
+        if best_distance == inf:
+            return
+        # Every shortest path has exactly one highest ranked node where both searches meet
+        path_count = 0
+        for node_idx in forward_search["settled"] & backward_search["settled"]:
+            if (
+                forward_search["distances"][node_idx]
+                + backward_search["distances"][node_idx]
+                == best_distance
+            ):
+                path_count += (
+                    forward_search["counts"][node_idx]
+                    * backward_search["counts"][node_idx]
+                )
+                meeting_idx = node_idx
+        if path_count != 1:
+            self.is_tie_unresolved = True
+            return
+        # Collect the hierarchy edges from the origin up to the meeting node and down to the destination
+        hierarchy_edges = []
+        node_idx = meeting_idx
+        while forward_search["edge"][node_idx] != -1:
+            hierarchy_edges.append(forward_search["edge"][node_idx])
+            node_idx = forward_search["previous"][node_idx]
+        hierarchy_edges.reverse()
+        node_idx = meeting_idx
+        while backward_search["edge"][node_idx] != -1:
+            hierarchy_edges.append(backward_search["edge"][node_idx])
+            node_idx = backward_search["previous"][node_idx]
+        # Unpack each shortcut into the two edges it replaces
+        edge_first = hierarchy["edge_first"]
+        edge_second = hierarchy["edge_second"]
+        edge_position = hierarchy["edge_position"]
+        path_edge_positions = []
+        stack = hierarchy_edges[::-1]
+        while stack:
+            edge_idx = stack.pop()
+            if edge_position[edge_idx] == -1:
+                stack.append(edge_second[edge_idx])
+                stack.append(edge_first[edge_idx])
+            else:
+                path_edge_positions.append(edge_position[edge_idx])
+        indices = graph["indices"]
+        self.path_node_ids = [origin_id] + [
+            indices[edge_idx] for edge_idx in path_edge_positions
+        ]
+        self.path_edge_positions = path_edge_positions
@@ -2,7 +2,7 @@ from heapq import heappush, heappop
 from math import ceil, log
 
 from bmsspy.data_structures.list_data_structure import ListBmsspDataStructure
-from bmsspy.helpers.utils import inf
+from bmsspy.helpers.utils import inf, float_bits
 from bmsspy.helpers.fast import FastSet, FastDict, FastLookup
 
 from decimal import Decimal
@@ -11,38 +11,47 @@ from decimal import Decimal
 class BmsspCore:
     def __init__(
         self,
-        graph: list[dict[int, int | float]],
-        origin_ids: set[int] | int,
-        counter_value: int,
-        edge_adj_graph: list[dict[int, int | float]],
+        graph: dict,
+        origin_ids: set[int] | int | dict[int, int | float | Decimal],
+        counter_value: int | Decimal,
         data_structure=ListBmsspDataStructure,
         pivot_relaxation_steps: int | None = None,
         target_tree_depth: int | None = None,
+        workspace: "BmsspWorkspace | None" = None,
+        destination_id: int | None = None,
+        upper_bound: int | float | Decimal = inf,
+        target_ids: set[int] | None = None,
+        target_count: int = 1,
+        track_source_labels: bool = False,
     ):
         """
         Function:
 
-        - Initialize the BMSSP solver with a graph represented as an adjacency list.
+        - Initialize the BMSSP solver with a graph represented as a CSR (compressed sparse row) graph.
 
         Required Arguments:
 
         - graph:
-            - Type: list[dict[int, int | float]]
-            - Description: The graph is represented as an adjacency list, where each node points to a dictionary of its neighbors and their edge weights.
+            - Type: dict
+            - Description: The graph is represented as a CSR graph with the following keys:
+                - `indptr`: The edges of node i are stored at positions indptr[i] to indptr[i + 1]
+                - `indices`: The destination node id for each edge position
+                - `weights`: The edge weight plus the counter_value for each edge position
+                - `key_weights`: The edge weight plus the counter_value plus a unique edge id adjustment for each edge position
+                    - Note: The largest edge id based adjustment should be less than half of the counter_value
+                    - Note: If the counter_value is an int, it should be at least the number of nodes such that each origin can be given a unique key adjustment
             - Note: This graph should be in a max degree 2 (no more than two in connections and/or no more than two out connections per node) to function correctly.
         - origin_ids:
-            - Type: set[int] | int
+            - Type: set[int] | int | dict[int, int | float | Decimal]
             - What: The IDs of the starting nodes for the BMSSP algorithm.
             - Note: Can be a single integer or a set of integers.
+            - Note: Can also be a dictionary of origin id: initial offset pairs where each origin starts at its (nonnegative) offset instead of zero.
+                - Offsets are in the same units as the graph weights (without any unique path length adjustments).
+                - An origin with a larger offset than its shortest distance from another origin is relaxed like any other node.
         - counter_value:
-            - Type: int
+            - Type: int | Decimal
             - What: The increment value (counter) added to the distance matrix to track how many edges have been traversed (used for unique path lengths).
                 - Note: This should be set such that the maximum possible path length multiplied by counter_value is less than half of a single decimal place at the precision level.
-        - edge_adj_graph:
-            - Type: list[dict[int, int | float]]
-            - What: The adjustment graph used to ensure unique path lengths.
-                - Note: This should include edge id based adjustments.
-                - Note: The largest edge id based adjustment should be less than half of the counter_value
 
         Optional Arguments:
 
@@ -58,30 +67,94 @@ class BmsspCore:
             - Type: int | None
             - Default: int(log(len(graph), 2) ** (2 / 3))
             - What: The target depth of the search tree (t). If None, it will be computed based on the graph size.
+        - workspace:
+            - Type: BmsspWorkspace | None
+            - Default: None
+            - What: A workspace from a previous solve on the same graph to reuse instead of allocating new node sized structures.
+            - Note: If None, a new workspace is created. The workspace used is available as `self.workspace` after solving.
+        - destination_id:
+            - Type: int | None
+            - Default: None
+            - What: If provided, stop solving as soon as the distance to this node is final.
+            - Note: Only nodes that were completed before the destination are guaranteed to have final distances.
+        - upper_bound:
+            - Type: int | float | Decimal
+            - Default: inf
+            - What: An exclusive upper bound (B) on the distances to solve for in the same units as the graph weights.
+            - Note: Only nodes with a distance below this bound are guaranteed to have final distances.
+                The bound is converted to the key units used while solving with `get_key_bound`.
+        - target_ids:
+            - Type: set[int] | None
+            - Default: None
+            - What: If provided, stop solving as soon as the distances to `target_count` of these nodes are final.
+            - Note: The completed targets are available as `self.completed_target_ids` after solving.
+            - Note: Ignored if `destination_id` is provided (which is the same as passing `target_ids={destination_id}` and `target_count=1`).
+        - target_count:
+            - Type: int
+            - Default: 1
+            - What: The number of `target_ids` that must be complete to stop solving.
+        - track_source_labels:
+            - Type: bool
+            - Default: False
+            - What: If True, track the origin id that each node's shortest path starts from in `self.source_label` (-1 if unreached).
+            - Note: Each label is copied from the predecessor whenever a node's predecessor is updated during relaxation.
         """
         #################################
         # Initial checks and data setup
         #################################
-        graph_len = len(graph)
+        graph_len = len(graph["indptr"]) - 1
         if graph_len < 2:
             raise ValueError("Your provided graph must have at least 2 nodes")
         if isinstance(origin_ids, int):
             origin_ids = {origin_ids}
+        if not isinstance(origin_ids, dict):
+            origin_ids = dict.fromkeys(origin_ids, 0)
         self.graph = graph
-        self.counter_and_edge_distance_matrix = [inf] * graph_len
-        self.counter_distance_matrix = [inf] * graph_len
+        self.graph_len = graph_len
+        self.indptr = graph["indptr"]
+        self.indices = graph["indices"]
+        self.weights = graph["weights"]
 
         # Addition: Unique Path Adjustment Setup
-        self.edge_adj_graph = edge_adj_graph
+        # The unique edge id adjustments are folded into key_weights by edge position
+        self.key_weights = graph.get("key_weights")
         self.counter_value = counter_value
 
+        # Addition: Early termination once the destination (or target_count of the target_ids) is complete
+        if destination_id is not None:
+            target_ids = {destination_id}
+            target_count = 1
+        self.target_ids = target_ids
+        self.target_count = target_count
+        self.completed_target_ids = set()
+        self.is_destination_complete = False
+
+        # Addition: Reuse node sized structures from previous solves (reset in O(touched nodes) time)
+        if workspace is None:
+            workspace = BmsspWorkspace(graph_len)
+        elif workspace.graph_len != graph_len:
+            raise ValueError(
+                "Your provided workspace must be created for a graph of the same size"
+            )
+        else:
+            workspace.reset()
+        self.workspace = workspace
+        # Every node that has its distance set is tracked such that the workspace can be reset
+        self.touched_nodes = workspace.touched_nodes
+
         # Addition: Initialize Predecessor array for path reconstruction
-        self.predecessor = [-1] * graph_len
+        self.predecessor = workspace.predecessor
         # Allow for arbitrary data structures
         self.data_structure = data_structure
-        for origin_id in origin_ids:
-            self.counter_and_edge_distance_matrix[origin_id] = Decimal(0)
-            self.counter_distance_matrix[origin_id] = Decimal(0)
+        # Addition: Nearest source (origin) labels that are filled during relaxation
+        self.source_label = None
+        if track_source_labels:
+            self.source_label = workspace.get_matrix("source_label", -1)
+            for origin_id in origin_ids:
+                self.source_label[origin_id] = origin_id
+        self.initialize_distances(origin_ids)
+        # Addition: Distance bounded solves (nodes with a key below this bound are complete after solving)
+        self.upper_bound = self.get_key_bound(upper_bound)
 
         #####################################
         # Practical choices (k and t) based on n
@@ -118,34 +191,100 @@ class BmsspCore:
 
         #################################
         # Create recursion tracking structures to operate in O(1) time
-        # The structures are created in O(n log(n)^(1/3)) time
+        # The structures are created in O(n log(n)^(1/3)) time when the workspace is first used
         #################################
-        self.is_pivot_seen_set = FastSet(len(graph))
+        workspace.set_max_recursion_depth(self.max_recursion_depth)
+        self.is_pivot_seen_set = workspace.is_pivot_seen_set
 
-        self.find_pivots_temp_frontier_set = FastSet(len(graph))
-        self.find_pivots_prev_frontier_set = FastSet(len(graph))
-        self.find_pivots_curr_frontier_set = FastSet(len(graph))
-        self.find_pivots_forest_dict = FastDict(len(graph))
-        self.find_pivots_has_indegree_set = FastSet(len(graph))
-        self.find_pivots_pivots_set = FastSet(len(graph))
+        self.find_pivots_temp_frontier_set = (
+            workspace.find_pivots_temp_frontier_set
+        )
+        self.find_pivots_prev_frontier_set = (
+            workspace.find_pivots_prev_frontier_set
+        )
+        self.find_pivots_curr_frontier_set = (
+            workspace.find_pivots_curr_frontier_set
+        )
+        self.find_pivots_forest_dict = workspace.find_pivots_forest_dict
+        self.find_pivots_has_indegree_set = (
+            workspace.find_pivots_has_indegree_set
+        )
+        self.find_pivots_pivots_set = workspace.find_pivots_pivots_set
 
-        self.base_case_new_frontier_set = FastSet(len(graph))
+        self.base_case_new_frontier_set = workspace.base_case_new_frontier_set
 
-        self.recursive_bmssp_data_struct_lookups = [
-            FastLookup(len(graph)) for _ in range(self.max_recursion_depth)
-        ]
-        self.recursive_bmssp_new_frontier_sets = [
-            FastSet(len(graph)) for _ in range(self.max_recursion_depth)
-        ]
-        self.recursive_bmssp_intermediate_frontier_set = FastSet(len(graph))
+        self.recursive_bmssp_data_struct_lookups = (
+            workspace.recursive_bmssp_data_struct_lookups
+        )
+        self.recursive_bmssp_new_frontier_sets = (
+            workspace.recursive_bmssp_new_frontier_sets
+        )
+        self.recursive_bmssp_intermediate_frontier_set = (
+            workspace.recursive_bmssp_intermediate_frontier_set
+        )
 
         #################################
         # Run the algorithm
         #################################
         # Run the solver algorithm
         upper_bound, frontier = self.recursive_bmssp(
-            self.max_recursion_depth, inf, origin_ids
+            self.max_recursion_depth, self.upper_bound, set(origin_ids)
+        )
+
+    def initialize_distances(
+        self, origin_ids: dict[int, int | float | Decimal]
+    ) -> None:
+        """
+        Function:
+
+        - Create the distance matrices and seed each origin with its initial offset.
+
+        Required Arguments:
+
+        - origin_ids:
+            - Type: dict[int, int | float | Decimal]
+            - What: The IDs of the starting nodes for the BMSSP algorithm and their initial offsets.
+        """
+        self.counter_and_edge_distance_matrix = self.workspace.get_matrix(
+            "counter_and_edge_distance_matrix", inf
+        )
+        self.counter_distance_matrix = self.workspace.get_matrix(
+            "counter_distance_matrix", inf
         )
+        # Seed origins with the same number type as the counter (Decimal or int)
+        number_type = type(self.counter_value)
+        num_origins = len(origin_ids)
+        for origin_rank, (origin_id, offset) in enumerate(origin_ids.items()):
+            offset = number_type(offset)
+            # Addition: Give each origin a unique key adjustment below the counter_value
+            # such that origins with the same offset never tie (every other key includes at least one counter_value)
+            if number_type is int:
+                key_adjustment = self.counter_value * origin_rank // num_origins
+            else:
+                key_adjustment = self.counter_value * origin_rank / num_origins
+            self.counter_and_edge_distance_matrix[origin_id] = (
+                offset + key_adjustment
+            )
+            self.counter_distance_matrix[origin_id] = offset
+            self.touched_nodes.append(origin_id)
+
+    def get_key_bound(
+        self, upper_bound: int | float | Decimal
+    ) -> int | float | Decimal:
+        """
+        Function:
+
+        - Convert an exclusive upper bound on distances into an exclusive upper bound on keys (counter_and_edge_distance_matrix values).
+        - The unique path length adjustments never change which side of a rounded distance bound a key falls on,
+          so the bound is used as is.
+
+        Required Arguments:
+
+        - upper_bound:
+            - Type: int | float | Decimal
+            - What: An exclusive upper bound on distances in the same units as the graph weights.
+        """
+        return upper_bound
 
     def is_pivot(
         self, root: int, forest: dict[int, set[int]], threshold: int
@@ -218,41 +357,7 @@ class BmsspCore:
         # Multi-step limited relaxation from current frontier
         for _ in range(self.pivot_relaxation_steps):
             curr_frontier = self.find_pivots_curr_frontier_set()
-            for prev_frontier_idx in prev_frontier:
-                prev_distance = self.counter_distance_matrix[prev_frontier_idx]
-                for connection_idx, connection_distance in self.graph[
-                    prev_frontier_idx
-                ].items():
-                    # Modification: Use a new get distance function to ensure unique lengths
-                    new_distance = (
-                        prev_distance
-                        + connection_distance
-                        + self.counter_value
-                        + self.edge_adj_graph[prev_frontier_idx][connection_idx]
-                    )
-                    # Important: Allow equality on relaxations
-                    if (
-                        new_distance
-                        <= self.counter_and_edge_distance_matrix[connection_idx]
-                    ):
-                        # Addition: Add predecessor tracking
-                        if (
-                            new_distance
-                            < self.counter_and_edge_distance_matrix[
-                                connection_idx
-                            ]
-                        ):
-                            self.predecessor[connection_idx] = prev_frontier_idx
-                            self.counter_and_edge_distance_matrix[
-                                connection_idx
-                            ] = new_distance
-                            self.counter_distance_matrix[connection_idx] = (
-                                prev_distance
-                                + connection_distance
-                                + self.counter_value
-                            )
-                        if new_distance < upper_bound:
-                            curr_frontier.add(connection_idx)
+            self.relax_find_pivots(upper_bound, prev_frontier, curr_frontier)
             temp_frontier.update(curr_frontier)
             prev_frontier = curr_frontier
             # If the search balloons, take the current frontier as pivots
@@ -264,9 +369,9 @@ class BmsspCore:
         has_indegree = self.find_pivots_has_indegree_set()
         for frontier_idx in temp_frontier:
             # prev_distance = self.counter_distance_matrix[frontier_idx]
-            for connection_idx, connection_distance in self.graph[
-                frontier_idx
-            ].items():
+            for connection_idx in self.indices[
+                self.indptr[frontier_idx] : self.indptr[frontier_idx + 1]
+            ]:
                 # Modification: Use predecessor tracking instead of distance comparison
                 if self.predecessor[connection_idx] == frontier_idx:
                     if connection_idx in temp_frontier:
@@ -290,6 +395,67 @@ class BmsspCore:
 
         return pivots, temp_frontier
 
+    def relax_find_pivots(
+        self,
+        upper_bound: int | float,
+        prev_frontier: set[int],
+        curr_frontier: set[int],
+    ) -> None:
+        """
+        Function:
+
+        - Relax every outgoing edge of prev_frontier as a single step of the find_pivots relaxation.
+        - Adds each relaxed vertex with a distance below upper_bound to curr_frontier.
+
+        Required Arguments:
+
+        - upper_bound:
+            - Type: int | float
+            - What: The upper bound threshold (B)
+        - prev_frontier:
+            - Type: set[int]
+            - What: The vertices to relax outgoing edges from
+        - curr_frontier:
+            - Type: set[int]
+            - What: The set to add newly relaxed vertices to
+        """
+        indptr = self.indptr
+        indices = self.indices
+        key_weights = self.key_weights
+        source_label = self.source_label
+        for prev_frontier_idx in prev_frontier:
+            prev_distance = self.counter_distance_matrix[prev_frontier_idx]
+            for edge_idx in range(
+                indptr[prev_frontier_idx], indptr[prev_frontier_idx + 1]
+            ):
+                connection_idx = indices[edge_idx]
+                # Modification: Use a new get distance function to ensure unique lengths
+                new_distance = prev_distance + key_weights[edge_idx]
+                # Important: Allow equality on relaxations
+                if (
+                    new_distance
+                    <= self.counter_and_edge_distance_matrix[connection_idx]
+                ):
+                    # Addition: Add predecessor tracking
+                    if (
+                        new_distance
+                        < self.counter_and_edge_distance_matrix[connection_idx]
+                    ):
+                        self.predecessor[connection_idx] = prev_frontier_idx
+                        if source_label is not None:
+                            source_label[connection_idx] = source_label[
+                                prev_frontier_idx
+                            ]
+                        self.touched_nodes.append(connection_idx)
+                        self.counter_and_edge_distance_matrix[
+                            connection_idx
+                        ] = new_distance
+                        self.counter_distance_matrix[connection_idx] = (
+                            prev_distance + self.weights[edge_idx]
+                        )
+                    if new_distance < upper_bound:
+                        curr_frontier.add(connection_idx)
+
     def base_case(
         self, upper_bound: int | float, frontier: set[int]
     ) -> tuple[int | float, set[int]]:
@@ -334,39 +500,73 @@ class BmsspCore:
                 new_upper_bound = frontier_distance
                 break
             new_frontier.add(frontier_idx)
-            prev_distance = self.counter_distance_matrix[frontier_idx]
-            for connection_idx, connection_distance in self.graph[
-                frontier_idx
-            ].items():
-                # Modification:
-                new_distance = (
-                    prev_distance
-                    + connection_distance
-                    + self.counter_value
-                    + self.edge_adj_graph[frontier_idx][connection_idx]
-                )
+            # Addition: Stop once enough targets are complete (its parent recursion will break)
+            if self.target_ids is not None and frontier_idx in self.target_ids:
+                self.completed_target_ids.add(frontier_idx)
+                if len(self.completed_target_ids) >= self.target_count:
+                    self.is_destination_complete = True
+                    break
+            self.relax_base_case(upper_bound, frontier_idx, heap)
+
+        return new_upper_bound, new_frontier
+
+    def relax_base_case(
+        self,
+        upper_bound: int | float,
+        frontier_idx: int,
+        heap: list[tuple[int | float, int]],
+    ) -> None:
+        """
+        Function:
+
+        - Relax every outgoing edge of frontier_idx during the base case.
+        - Pushes each relaxed vertex with a distance below upper_bound onto the heap.
+
+        Required Arguments:
+
+        - upper_bound:
+            - Type: int | float
+            - What: The upper bound threshold (B)
+        - frontier_idx:
+            - Type: int
+            - What: The vertex to relax outgoing edges from
+        - heap:
+            - Type: list[tuple[int | float, int]]
+            - What: The base case heap of (distance, vertex) pairs
+        """
+        indices = self.indices
+        key_weights = self.key_weights
+        source_label = self.source_label
+        prev_distance = self.counter_distance_matrix[frontier_idx]
+        for edge_idx in range(
+            self.indptr[frontier_idx], self.indptr[frontier_idx + 1]
+        ):
+            connection_idx = indices[edge_idx]
+            # Modification:
+            new_distance = prev_distance + key_weights[edge_idx]
+            if (
+                new_distance
+                <= self.counter_and_edge_distance_matrix[connection_idx]
+                and new_distance < upper_bound
+            ):
+                # Addition: Add predecessor tracking
                 if (
                     new_distance
-                    <= self.counter_and_edge_distance_matrix[connection_idx]
-                    and new_distance < upper_bound
+                    < self.counter_and_edge_distance_matrix[connection_idx]
                 ):
-                    # Addition: Add predecessor tracking
-                    if (
+                    self.predecessor[connection_idx] = frontier_idx
+                    if source_label is not None:
+                        source_label[connection_idx] = source_label[
+                            frontier_idx
+                        ]
+                    self.touched_nodes.append(connection_idx)
+                    self.counter_and_edge_distance_matrix[connection_idx] = (
                         new_distance
-                        < self.counter_and_edge_distance_matrix[connection_idx]
-                    ):
-                        self.predecessor[connection_idx] = frontier_idx
-                        self.counter_and_edge_distance_matrix[
-                            connection_idx
-                        ] = new_distance
-                        self.counter_distance_matrix[connection_idx] = (
-                            prev_distance
-                            + connection_distance
-                            + self.counter_value
-                        )
-                    heappush(heap, (new_distance, connection_idx))
-
-        return new_upper_bound, new_frontier
+                    )
+                    self.counter_distance_matrix[connection_idx] = (
+                        prev_distance + self.weights[edge_idx]
+                    )
+                heappush(heap, (new_distance, connection_idx))
 
     def recursive_bmssp(
         self, recursion_depth: int, upper_bound: int | float, frontier: set[int]
@@ -457,6 +657,14 @@ class BmsspCore:
 
             # Track results
             new_frontier.update(new_frontier_temp)
+            # Addition: Stop all recursions once enough targets are complete
+            # Note: Nodes returned by an interrupted recursion may not be complete so they are never counted
+            if self.is_destination_complete:
+                break
+            if self.target_ids is not None:
+                self.complete_targets(new_frontier_temp)
+                if self.is_destination_complete:
+                    break
 
             # Step 13: Initialize intermediate_frontier to batch-prepend
             intermediate_frontier = (
@@ -464,52 +672,14 @@ class BmsspCore:
             )
 
             # Step 14–20: relax edges from new_frontier_temp and enqueue into D or intermediate_frontier per their interval
-            for new_frontier_idx in new_frontier_temp:
-                prev_distance = self.counter_distance_matrix[new_frontier_idx]
-                for connection_idx, connection_distance in self.graph[
-                    new_frontier_idx
-                ].items():
-                    new_distance = (
-                        prev_distance
-                        + connection_distance
-                        + self.counter_value
-                        + self.edge_adj_graph[new_frontier_idx][connection_idx]
-                    )
-                    if (
-                        new_distance
-                        <= self.counter_and_edge_distance_matrix[connection_idx]
-                    ):
-                        # Addition: Add predecessor tracking
-                        if (
-                            new_distance
-                            < self.counter_and_edge_distance_matrix[
-                                connection_idx
-                            ]
-                        ):
-                            self.predecessor[connection_idx] = new_frontier_idx
-                            self.counter_and_edge_distance_matrix[
-                                connection_idx
-                            ] = new_distance
-                            self.counter_distance_matrix[connection_idx] = (
-                                prev_distance
-                                + connection_distance
-                                + self.counter_value
-                            )
-                        # Insert based on which interval the new distance falls into
-                        if (
-                            data_struct_frontier_bound_temp
-                            <= new_distance
-                            < upper_bound
-                        ):
-                            data_struct.insert_key_value(
-                                connection_idx, new_distance
-                            )
-                        elif (
-                            completion_bound
-                            <= new_distance
-                            < data_struct_frontier_bound_temp
-                        ):
-                            intermediate_frontier.add(connection_idx)
+            self.relax_recursive_bmssp(
+                upper_bound,
+                data_struct_frontier_bound_temp,
+                completion_bound,
+                new_frontier_temp,
+                data_struct,
+                intermediate_frontier,
+            )
 
             # Step 21: Batch prepend intermediate_frontier plus filtered data_struct_frontier_temp in completion_bound, data_struct_frontier_bound_temp)
             intermediate_frontier.update(
@@ -540,3 +710,399 @@ class BmsspCore:
                 new_frontier.add(v)
 
         return completion_bound, new_frontier
+
+    def complete_targets(self, new_frontier: set[int]) -> None:
+        """
+        Function:
+
+        - Track the target_ids in a set of newly completed vertices and flag the solve as complete once target_count of them are complete.
+
+        Required Arguments:
+
+        - new_frontier:
+            - Type: set[int]
+            - What: The completed vertices returned by a recursive call (U_i)
+        """
+        target_ids = self.target_ids
+        if len(target_ids) < len(new_frontier):
+            self.completed_target_ids.update(
+                target_idx
+                for target_idx in target_ids
+                if target_idx in new_frontier
+            )
+        else:
+            self.completed_target_ids.update(
+                node_idx for node_idx in new_frontier if node_idx in target_ids
+            )
+        if len(self.completed_target_ids) >= self.target_count:
+            self.is_destination_complete = True
+
+    def relax_recursive_bmssp(
+        self,
+        upper_bound: int | float,
+        data_struct_frontier_bound: int | float,
+        completion_bound: int | float,
+        new_frontier: set[int],
+        data_struct,
+        intermediate_frontier: set[int],
+    ) -> None:
+        """
+        Function:
+
+        - Relax every outgoing edge of new_frontier after a recursive BMSSP call (Algorithm 3 steps 14-20).
+        - Enqueues each relaxed vertex into data_struct or intermediate_frontier based on the interval its distance falls into.
+
+        Required Arguments:
+
+        - upper_bound:
+            - Type: int | float
+            - What: The upper bound for the current recursion (B)
+        - data_struct_frontier_bound:
+            - Type: int | float
+            - What: The bound returned by the latest data_struct pull (B_i)
+        - completion_bound:
+            - Type: int | float
+            - What: The bound returned by the latest recursive call (B'_i)
+        - new_frontier:
+            - Type: set[int]
+            - What: The completed vertices returned by the latest recursive call (U_i)
+        - data_struct:
+            - Type: BmsspDataStructure
+            - What: The data structure for the current recursion (D)
+        - intermediate_frontier:
+            - Type: set[int]
+            - What: The set of vertices to batch prepend into data_struct (K)
+        """
+        indptr = self.indptr
+        indices = self.indices
+        key_weights = self.key_weights
+        source_label = self.source_label
+        for new_frontier_idx in new_frontier:
+            prev_distance = self.counter_distance_matrix[new_frontier_idx]
+            for edge_idx in range(
+                indptr[new_frontier_idx], indptr[new_frontier_idx + 1]
+            ):
+                connection_idx = indices[edge_idx]
+                new_distance = prev_distance + key_weights[edge_idx]
+                if (
+                    new_distance
+                    <= self.counter_and_edge_distance_matrix[connection_idx]
+                ):
+                    # Addition: Add predecessor tracking
+                    if (
+                        new_distance
+                        < self.counter_and_edge_distance_matrix[connection_idx]
+                    ):
+                        self.predecessor[connection_idx] = new_frontier_idx
+                        if source_label is not None:
+                            source_label[connection_idx] = source_label[
+                                new_frontier_idx
+                            ]
+                        self.touched_nodes.append(connection_idx)
+                        self.counter_and_edge_distance_matrix[
+                            connection_idx
+                        ] = new_distance
+                        self.counter_distance_matrix[connection_idx] = (
+                            prev_distance + self.weights[edge_idx]
+                        )
+                    # Insert based on which interval the new distance falls into
+                    if data_struct_frontier_bound <= new_distance < upper_bound:
+                        data_struct.insert_key_value(
+                            connection_idx, new_distance
+                        )
+                    elif (
+                        completion_bound
+                        <= new_distance
+                        < data_struct_frontier_bound
+                    ):
+                        intermediate_frontier.add(connection_idx)
+
+
+class BmsspWorkspace:
+    def __init__(self, graph_len: int):
+        """
+        Function:
+
+        - Initialize the node sized structures used by BmsspCore such that they can be reused across solves on the same graph.
+        - Resetting the workspace takes O(touched nodes) time instead of reallocating O(n * max_recursion_depth) state.
+            - The Fast structures are reset in O(1) time using their generation counter (scnt).
+            - The distance and predecessor matrices are reset only at the nodes that were touched by the previous solve.
+
+        Required Arguments:
+
+        - graph_len:
+            - Type: int
+            - What: The number of nodes in the graph
+        """
+        self.graph_len = graph_len
+        self.is_pivot_seen_set = FastSet(graph_len)
+
+        self.find_pivots_temp_frontier_set = FastSet(graph_len)
+        self.find_pivots_prev_frontier_set = FastSet(graph_len)
+        self.find_pivots_curr_frontier_set = FastSet(graph_len)
+        self.find_pivots_forest_dict = FastDict(graph_len)
+        self.find_pivots_has_indegree_set = FastSet(graph_len)
+        self.find_pivots_pivots_set = FastSet(graph_len)
+
+        self.base_case_new_frontier_set = FastSet(graph_len)
+
+        self.recursive_bmssp_data_struct_lookups = []
+        self.recursive_bmssp_new_frontier_sets = []
+        self.recursive_bmssp_intermediate_frontier_set = FastSet(graph_len)
+
+        self.predecessor = [-1] * graph_len
+        # Node indexed matrices by name as (matrix, reset_value) tuples
+        self.matrices = {}
+        # Nodes that may have been changed in any matrix since the last reset (may include duplicates)
+        self.touched_nodes = []
+
+    def set_max_recursion_depth(self, max_recursion_depth: int) -> None:
+        """
+        Function:
+
+        - Ensure that there is a data structure lookup and a new frontier set for each recursion level.
+
+        Required Arguments:
+
+        - max_recursion_depth:
+            - Type: int
+            - What: The maximum recursion depth (l) of the solve
+        """
+        while (
+            len(self.recursive_bmssp_data_struct_lookups) < max_recursion_depth
+        ):
+            self.recursive_bmssp_data_struct_lookups.append(
+                FastLookup(self.graph_len)
+            )
+            self.recursive_bmssp_new_frontier_sets.append(
+                FastSet(self.graph_len)
+            )
+
+    def get_matrix(self, name: str, reset_value) -> list:
+        """
+        Function:
+
+        - Return the node indexed matrix with the given name, creating it filled with `reset_value` if it does not exist yet.
+        - Any node set in the matrix must be added to `touched_nodes` such that it is reset to `reset_value` by `reset`.
+
+        Required Arguments:
+
+        - name:
+            - Type: str
+            - What: The name of the matrix
+        - reset_value:
+            - Type: any
+            - What: The value of every untouched node in the matrix
+        """
+        if name not in self.matrices:
+            self.matrices[name] = ([reset_value] * self.graph_len, reset_value)
+        return self.matrices[name][0]
+
+    def reset(self) -> None:
+        """
+        Function:
+
+        - Reset the predecessor and all matrices at every touched node.
+        """
+        touched_nodes = self.touched_nodes
+        matrices = [(self.predecessor, -1)] + list(self.matrices.values())
+        if len(touched_nodes) > self.graph_len:
+            # Refilling is faster when more entries were touched than there are nodes
+            for matrix, reset_value in matrices:
+                matrix[:] = [reset_value] * self.graph_len
+        else:
+            for matrix, reset_value in matrices:
+                for node_idx in touched_nodes:
+                    matrix[node_idx] = reset_value
+        touched_nodes.clear()
+
+
+class LexicographicBmsspCore(BmsspCore):
+    """
+    A BMSSP solver that keeps native float distances and breaks ties lexicographically instead of adding unique path length adjustments.
+
+    - Distances are stored as floats with the hop count and last edge id kept in parallel arrays.
+    - Ties in distance are broken by the hop count and then by the last edge id.
+    - Each (distance, hop count, last edge id) triple is packed into a single int key for use in the data structures and bounds.
+        - This works since the bits of a nonnegative float have the same ordering as the float itself.
+
+    Required Arguments (differences from BmsspCore):
+
+    - graph:
+        - Type: dict
+        - What: The CSR graph with native float `weights` (no counter_value or unique path length adjustments applied).
+            - Note: `key_weights` are not used since the edge id for each edge is its CSR edge position plus one.
+    - counter_value:
+        - Type: int
+        - What: The hop count increment for each traversed edge (normally 1).
+    """
+
+    def initialize_distances(self, origin_ids: dict[int, int | float]) -> None:
+        num_edges = len(self.indices)
+        # Bit layout for each packed key: [distance bits][hop count bits][edge id bits]
+        # Origins (with a hop count of 0) use the edge id bits for a unique origin rank
+        self.edge_id_bits = (max(num_edges, self.graph_len) + 1).bit_length()
+        self.distance_shift = (
+            self.edge_id_bits
+            + (self.graph_len * self.counter_value).bit_length()
+        )
+        workspace = self.workspace
+        self.counter_distance_matrix = workspace.get_matrix(
+            "counter_distance_matrix", float("inf")
+        )
+        self.counter_and_edge_distance_matrix = workspace.get_matrix(
+            "counter_and_edge_distance_matrix", inf
+        )
+        self.hop_counts = workspace.get_matrix("hop_counts", 0)
+        self.last_edge_ids = workspace.get_matrix("last_edge_ids", 0)
+        for origin_rank, (origin_id, offset) in enumerate(origin_ids.items()):
+            offset = float(offset)
+            self.counter_distance_matrix[origin_id] = offset
+            self.counter_and_edge_distance_matrix[origin_id] = (
+                float_bits(offset) << self.distance_shift
+            ) | origin_rank
+            self.touched_nodes.append(origin_id)
+
+    def get_key_bound(
+        self, upper_bound: int | float | Decimal
+    ) -> int | float | Decimal:
+        # Every key with distance bits below the bound has a distance below the bound
+        if upper_bound == float("inf"):
+            return inf
+        return float_bits(upper_bound) << self.distance_shift
+
+    def relax_find_pivots(
+        self,
+        upper_bound: int | float,
+        prev_frontier: set[int],
+        curr_frontier: set[int],
+    ) -> None:
+        distance_matrix = self.counter_distance_matrix
+        key_matrix = self.counter_and_edge_distance_matrix
+        indptr = self.indptr
+        indices = self.indices
+        weights = self.weights
+        source_label = self.source_label
+        for prev_frontier_idx in prev_frontier:
+            prev_distance = distance_matrix[prev_frontier_idx]
+            new_hops = self.hop_counts[prev_frontier_idx] + self.counter_value
+            for edge_idx in range(
+                indptr[prev_frontier_idx], indptr[prev_frontier_idx + 1]
+            ):
+                connection_idx = indices[edge_idx]
+                new_distance = prev_distance + weights[edge_idx]
+                # Only build the packed key if the float distance could be an improvement
+                if new_distance > distance_matrix[connection_idx]:
+                    continue
+                edge_id = edge_idx + 1
+                new_key = (
+                    (float_bits(new_distance) << self.distance_shift)
+                    | (new_hops << self.edge_id_bits)
+                    | edge_id
+                )
+                # Important: Allow equality on relaxations
+                if new_key <= key_matrix[connection_idx]:
+                    if new_key < key_matrix[connection_idx]:
+                        self.predecessor[connection_idx] = prev_frontier_idx
+                        if source_label is not None:
+                            source_label[connection_idx] = source_label[
+                                prev_frontier_idx
+                            ]
+                        self.touched_nodes.append(connection_idx)
+                        key_matrix[connection_idx] = new_key
+                        distance_matrix[connection_idx] = new_distance
+                        self.hop_counts[connection_idx] = new_hops
+                        self.last_edge_ids[connection_idx] = edge_id
+                    if new_key < upper_bound:
+                        curr_frontier.add(connection_idx)
+
+    def relax_base_case(
+        self,
+        upper_bound: int | float,
+        frontier_idx: int,
+        heap: list[tuple[int | float, int]],
+    ) -> None:
+        distance_matrix = self.counter_distance_matrix
+        key_matrix = self.counter_and_edge_distance_matrix
+        indices = self.indices
+        weights = self.weights
+        source_label = self.source_label
+        prev_distance = distance_matrix[frontier_idx]
+        new_hops = self.hop_counts[frontier_idx] + self.counter_value
+        for edge_idx in range(
+            self.indptr[frontier_idx], self.indptr[frontier_idx + 1]
+        ):
+            connection_idx = indices[edge_idx]
+            new_distance = prev_distance + weights[edge_idx]
+            if new_distance > distance_matrix[connection_idx]:
+                continue
+            edge_id = edge_idx + 1
+            new_key = (
+                (float_bits(new_distance) << self.distance_shift)
+                | (new_hops << self.edge_id_bits)
+                | edge_id
+            )
+            if new_key <= key_matrix[connection_idx] and new_key < upper_bound:
+                if new_key < key_matrix[connection_idx]:
+                    self.predecessor[connection_idx] = frontier_idx
+                    if source_label is not None:
+                        source_label[connection_idx] = source_label[
+                            frontier_idx
+                        ]
+                    self.touched_nodes.append(connection_idx)
+                    key_matrix[connection_idx] = new_key
+                    distance_matrix[connection_idx] = new_distance
+                    self.hop_counts[connection_idx] = new_hops
+                    self.last_edge_ids[connection_idx] = edge_id
+                heappush(heap, (new_key, connection_idx))
+
+    def relax_recursive_bmssp(
+        self,
+        upper_bound: int | float,
+        data_struct_frontier_bound: int | float,
+        completion_bound: int | float,
+        new_frontier: set[int],
+        data_struct,
+        intermediate_frontier: set[int],
+    ) -> None:
+        distance_matrix = self.counter_distance_matrix
+        key_matrix = self.counter_and_edge_distance_matrix
+        indptr = self.indptr
+        indices = self.indices
+        weights = self.weights
+        source_label = self.source_label
+        for new_frontier_idx in new_frontier:
+            prev_distance = distance_matrix[new_frontier_idx]
+            new_hops = self.hop_counts[new_frontier_idx] + self.counter_value
+            for edge_idx in range(
+                indptr[new_frontier_idx], indptr[new_frontier_idx + 1]
+            ):
+                connection_idx = indices[edge_idx]
+                new_distance = prev_distance + weights[edge_idx]
+                if new_distance > distance_matrix[connection_idx]:
+                    continue
+                edge_id = edge_idx + 1
+                new_key = (
+                    (float_bits(new_distance) << self.distance_shift)
+                    | (new_hops << self.edge_id_bits)
+                    | edge_id
+                )
+                if new_key <= key_matrix[connection_idx]:
+                    if new_key < key_matrix[connection_idx]:
+                        self.predecessor[connection_idx] = new_frontier_idx
+                        if source_label is not None:
+                            source_label[connection_idx] = source_label[
+                                new_frontier_idx
+                            ]
+                        self.touched_nodes.append(connection_idx)
+                        key_matrix[connection_idx] = new_key
+                        distance_matrix[connection_idx] = new_distance
+                        self.hop_counts[connection_idx] = new_hops
+                        self.last_edge_ids[connection_idx] = edge_id
+                    # Insert based on which interval the new key falls into
+                    if data_struct_frontier_bound <= new_key < upper_bound:
+                        data_struct.insert_key_value(connection_idx, new_key)
+                    elif (
+                        completion_bound <= new_key < data_struct_frontier_bound
+                    ):
+                        intermediate_frontier.add(connection_idx)
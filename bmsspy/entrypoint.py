@@ -1,23 +1,60 @@
-from .core import BmsspCore
+from .core import BmsspCore, LexicographicBmsspCore, BmsspWorkspace
+from .bidirectional import BidirectionalCore
+from .astar import AStarCore
+from .contraction import (
+    ContractionHierarchyCore,
+    build_contraction_hierarchy,
+    get_hierarchy_edge_weights,
+)
+from .hub_labels import build_hub_labels, query_hub_labels
+from .all_pairs import AllPairs
 from .helpers.utils import (
     input_check,
     reconstruct_path,
-    convert_to_constant_out_degree,
     convert_from_constant_degree,
     inf,
 )
+from .helpers.storage import (
+    write_arrays,
+    read_arrays,
+    write_arrays_to_shared_memory,
+    SharedArrays,
+)
+from .helpers.sparse import SparseArray
+from .helpers.cache import ByteSizeLruCache, SingleFlight
+from .helpers.coordinates import (
+    coordinates_to_arrays,
+    haversine_distance,
+    euclidean_distance,
+)
+from .helpers.csr import (
+    graph_to_csr,
+    csr_to_graph,
+    to_array,
+    edge_arrays_to_csr,
+    csr_to_constant_out_degree,
+    transpose_csr,
+)
 
 from bmsspy.data_structures.list_data_structure import ListBmsspDataStructure
+from array import array
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
 from decimal import Decimal
-from math import ceil, log
+from math import ceil, floor, log, nextafter
+from bisect import bisect_left
+from itertools import accumulate, repeat
+from operator import add, mul
+from threading import Lock
 
 
 class Bmssp:
     def __init__(
         self,
-        graph: list[dict[int, int | float]],
+        graph: list[dict[int, int | float]] | dict,
         precision: int = 6,
         use_constant_degree_graph: bool = True,
+        weight_mode: str = "decimal",
     ):
         """
         Function:
@@ -29,9 +66,11 @@ class Bmssp:
         Required Arguments:
 
         - `graph`:
-            - Type: list of dictionaries
+            - Type: list of dictionaries | dict
             - What: The input graph represented as a list of dictionaries where each index represents a node id.
                     Each dictionary contains neighboring node ids as keys and edge weights as values.
+            - Note: A CSR graph (a dictionary with `indptr`, `indices` and `weights` keys) is also accepted.
+                - See `Bmssp.from_csr` and `Bmssp.from_edge_arrays` to build one from array data.
 
         Optional Arguments:
 
@@ -46,47 +85,609 @@ class Bmssp:
             - What: Whether to convert the input graph to a constant degree graph to match the original BMSSP algorithm requirements.
             - Note: It appears that this is not necessary for solving the algorithm, but is used to achieve big O complexity targets.
                     This is default to True even though it appears to be slower in practice for all the graphs we have tested thus far.
+        - `weight_mode`:
+            - Type: str
+            - Default: "decimal"
+            - What: The number type used for edge weights and distances while solving.
+            - Options:
+                - "decimal": Use Decimal weights with the unique path length adjustments added as small fractional increments.
+                - "integer": Scale weights by 10**precision into plain python ints and store the unique path length adjustments in the low order digits.
+                    - Note: This returns identical results to "decimal" but avoids Decimal arithmetic during the solve.
+                - "lexicographic": Keep native float weights (no precision rounding) and break ties by hop count and then last edge id.
+                    - Note: `precision` is ignored in this mode and results are exact to float precision.
         """
-        self.graph = [
-            {k: round(Decimal(v), precision) for k, v in i.items()}
-            for i in graph
-        ]
+        if weight_mode not in ("decimal", "integer", "lexicographic"):
+            raise ValueError(
+                f"Your provided weight_mode ({weight_mode}) must be one of: decimal, integer, lexicographic"
+            )
         self.precision = precision
         self.use_constant_degree_graph = use_constant_degree_graph
+        self.weight_mode = weight_mode
+
+        if isinstance(graph, dict):
+            csr_graph = {
+                "indptr": to_array("q", graph["indptr"]),
+                "indices": to_array("q", graph["indices"]),
+                "weights": graph["weights"],
+            }
+            if len(csr_graph["indices"]) != len(csr_graph["weights"]):
+                raise ValueError(
+                    "Your provided CSR graph indices and weights must be the same length"
+                )
+        else:
+            csr_graph = graph_to_csr(graph)
+        self._init_lazy_state()
+        self.original_graph_len = len(csr_graph["indptr"]) - 1
+
+        # Round (or convert) each weight to the number type used for this weight mode
+        if self.weight_mode == "lexicographic":
+            csr_graph["weights"] = to_array("d", csr_graph["weights"])
+            zero_weight = 0.0
+        else:
+            csr_graph["weights"] = list(
+                map(
+                    round,
+                    map(Decimal, csr_graph["weights"]),
+                    repeat(precision),
+                )
+            )
+            zero_weight = Decimal(0)
+        self._input_csr_graph = csr_graph
 
         if self.use_constant_degree_graph:
-            self.constant_degree_dict = convert_to_constant_out_degree(self.graph, out_degree=2)
-            self.used_graph = self.constant_degree_dict["graph"]
+            self.constant_degree_dict = csr_to_constant_out_degree(
+                csr_graph, out_degree=2, zero_weight=zero_weight
+            )
+            # Only the idx_map and original_graph_len are needed once the CSR graph is built
+            self.csr_graph = self.constant_degree_dict.pop("graph")
         else:
-            self.used_graph = self.graph
+            self.csr_graph = dict(csr_graph)
+        self._set_unique_path_adjustments()
+
+    def _init_lazy_state(self) -> None:
+        """
+        Function:
+
+        - Set the state that is only built (or filled) once it is used to its empty value.
+        - Called by every constructor (including `Bmssp.load` and `Bmssp.attach`) such that each lazy attribute is always set.
+        """
+        # The input graph is only built as a list of dictionaries if it is accessed (see Bmssp.graph)
+        self._graph = None
+        # Solver workspaces that are not currently in use (see Bmssp.solve)
+        self._workspaces = []
+        # The reversed graph is only built if a reverse solve is requested (see Bmssp.reverse)
+        self._reverse = None
+        # The transposed used graph is only built if a bidirectional solve is requested (see Bmssp.solve_pair)
+        self._reverse_csr_graph = None
+        # Landmark distance tables for goal directed solves (see Bmssp.build_landmarks)
+        self._landmarks = None
+        # Node coordinates for goal directed solves (see Bmssp.set_coordinates)
+        self._coordinates = None
+        # Contraction hierarchy for repeated point to point solves (see Bmssp.build_contraction_hierarchy)
+        self._contraction_hierarchy = None
+        # Hub labels for exact distance queries (see Bmssp.build_hub_labels)
+        self._hub_labels = None
+        # Cached full solve results for repeated origins (see Bmssp.set_solve_cache)
+        self._solve_cache = None
+        # Incremented each time the graph is changed (see Bmssp.update_edge_weight)
+        self._graph_version = 0
+        # Concurrent identical solves share a single solve (see Bmssp.get_solve_coalescing_info)
+        self._single_flight = SingleFlight()
+
+    @classmethod
+    def from_csr(
+        cls,
+        indptr,
+        indices,
+        data,
+        precision: int = 6,
+        use_constant_degree_graph: bool = True,
+        weight_mode: str = "decimal",
+    ):
+        """
+        Function:
+
+        - Create a Bmssp object from scipy style CSR (compressed sparse row) arrays without building any per node dictionaries.
+
+        Required Arguments:
+
+        - `indptr`:
+            - Type: Any sequence or buffer of ints (eg: list, array or numpy array)
+            - What: An array of length num_nodes + 1 where the edges of node i are stored at positions indptr[i] to indptr[i + 1]
+        - `indices`:
+            - Type: Any sequence or buffer of ints
+            - What: The destination node id for each edge position
+        - `data`:
+            - Type: Any sequence or buffer of numbers
+            - What: The edge weight for each edge position
+
+        Optional Arguments:
+
+        - `precision`, `use_constant_degree_graph` and `weight_mode`:
+            - See `Bmssp.__init__`
+
+        Returns:
+
+        - A Bmssp object
+            - Note: The arrays are processed in pure python, so this takes a few seconds per million edges (mostly spent on `precision` rounding and the constant degree conversion).
+        """
+        return cls(
+            graph={
+                "indptr": indptr,
+                "indices": indices,
+                "weights": to_array("d", data),
+            },
+            precision=precision,
+            use_constant_degree_graph=use_constant_degree_graph,
+            weight_mode=weight_mode,
+        )
+
+    @classmethod
+    def from_edge_arrays(
+        cls,
+        origins,
+        destinations,
+        weights,
+        num_nodes: int | None = None,
+        precision: int = 6,
+        use_constant_degree_graph: bool = True,
+        weight_mode: str = "decimal",
+    ):
+        """
+        Function:
+
+        - Create a Bmssp object from parallel edge arrays without building any per node dictionaries.
+
+        Required Arguments:
+
+        - `origins`:
+            - Type: Any sequence or buffer of ints (eg: list, array or numpy array)
+            - What: The origin node id for each edge
+        - `destinations`:
+            - Type: Any sequence or buffer of ints
+            - What: The destination node id for each edge
+        - `weights`:
+            - Type: Any sequence or buffer of numbers
+            - What: The weight for each edge
+
+        Optional Arguments:
+
+        - `num_nodes`:
+            - Type: int | None
+            - Default: None
+            - What: The number of nodes in the graph
+            - Note: If None, this is one more than the largest node id in origins or destinations
+        - `precision`, `use_constant_degree_graph` and `weight_mode`:
+            - See `Bmssp.__init__`
+
+        Returns:
+
+        - A Bmssp object
+            - Note: The arrays are processed in pure python, so this takes a few seconds per million edges (mostly spent on `precision` rounding and the constant degree conversion).
+        """
+        return cls(
+            graph=edge_arrays_to_csr(
+                origins=origins,
+                destinations=destinations,
+                weights=to_array("d", weights),
+                num_nodes=num_nodes,
+            ),
+            precision=precision,
+            use_constant_degree_graph=use_constant_degree_graph,
+            weight_mode=weight_mode,
+        )
+
+    def _set_unique_path_adjustments(self) -> None:
+        """
+        Function:
+
+        - Set the counter_value and replace the rounded weights in `csr_graph` with the weights used while solving.
+        - Called once the rounded (or float) weights for the used graph are stored in `csr_graph["weights"]`.
+        """
+        weights = self.csr_graph["weights"]
 
         ######################
         # Unique Path Length Adjustment Setup
         ######################
-        # Create an adjustment graph to allow for guaranteed unique path lengths
-        # This essentially adds a combination of small increments to each edge weight
+        # Fold a combination of small increments into each edge weight
         #   to ensure that no two paths are measured as the same length
-        num_edges = sum(len(neighbors) for neighbors in self.used_graph)
-        num_nodes = len(self.used_graph)
+        # - weights: The edge weight plus the counter value
+        # - key_weights: The edge weight plus the counter value plus a unique edge id adjustment based on the edge position
+        num_edges = len(weights)
+        num_nodes = len(self.csr_graph["indptr"]) - 1
+        counter_digits = ceil(log(Decimal(num_nodes * 2 + 1), 10))
+        # Enough digits for each edge id and for each origin rank (see BmsspCore.initialize_distances)
+        edge_id_digits = ceil(log(Decimal(max(num_edges, num_nodes) + 1), 10))
+
+        if self.weight_mode == "integer":
+            # Shift every rounded weight left by the digits needed for the counter and edge id
+            # such that both adjustments live in the low order digits of the same int
+            self.weight_scale = 10 ** (counter_digits + edge_id_digits)
+            self.counter_value = 10**edge_id_digits
+            fixed_weights = map(
+                int, map(Decimal.scaleb, weights, repeat(self.precision))
+            )
+            weights = list(
+                map(
+                    add,
+                    map(mul, fixed_weights, repeat(self.weight_scale)),
+                    repeat(self.counter_value),
+                )
+            )
+            self.csr_graph["weights"] = weights
+            self.csr_graph["key_weights"] = list(
+                map(add, weights, range(1, num_edges + 1))
+            )
+        elif self.weight_mode == "lexicographic":
+            # Keep native float weights and track the hop count and edge id tie-breakers
+            # in parallel arrays during the solve (see LexicographicBmsspCore)
+            self.counter_value = 1
+        else:
+            self.counter_value = Decimal(10) ** -(
+                self.precision + counter_digits
+            )
+            edge_id_adjustment_value = Decimal(10) ** -(
+                self.precision + counter_digits + edge_id_digits
+            )
+            weights = list(map(add, weights, repeat(self.counter_value)))
+            self.csr_graph["weights"] = weights
+            # The edge id adjustment of edge i is (i + 1) * edge_id_adjustment_value
+            self.csr_graph["key_weights"] = list(
+                map(
+                    add,
+                    weights,
+                    accumulate(repeat(edge_id_adjustment_value, num_edges)),
+                )
+            )
+
+    def _get_stored_arrays(self) -> tuple[dict, dict]:
+        """
+        Function:
+
+        - Return the metadata and flat arrays needed to rebuild this prepared graph with `Bmssp._from_stored_arrays`.
+        - This includes the used CSR graph, the constant degree idx_map and the unique path length adjustment values
+          such that none of the setup in `Bmssp.__init__` needs to be repeated.
+        """
+        metadata = {
+            "weight_mode": self.weight_mode,
+            "precision": self.precision,
+            "use_constant_degree_graph": self.use_constant_degree_graph,
+            "original_graph_len": self.original_graph_len,
+            "counter_value": str(self.counter_value),
+            "weight_scale": getattr(self, "weight_scale", None),
+        }
+        arrays = {
+            "indptr": to_array("q", self.csr_graph["indptr"]),
+            "indices": to_array("q", self.csr_graph["indices"]),
+        }
+        weights = self.csr_graph["weights"]
+        if self.weight_mode == "lexicographic":
+            arrays["weights"] = to_array("d", weights)
+        elif self.weight_mode == "integer":
+            arrays["fixed_weights"] = array(
+                "q",
+                [
+                    (weight - self.counter_value) // self.weight_scale
+                    for weight in weights
+                ],
+            )
+            # Store the adjusted weights as well when they fit in 64 bits so they can be memory mapped as is
+            try:
+                arrays["weights"] = array("q", weights)
+                arrays["key_weights"] = array(
+                    "q", self.csr_graph["key_weights"]
+                )
+            except OverflowError:
+                arrays.pop("weights", None)
+        else:
+            arrays["fixed_weights"] = array(
+                "q",
+                [
+                    int((weight - self.counter_value).scaleb(self.precision))
+                    for weight in weights
+                ],
+            )
+        if self.use_constant_degree_graph:
+            # The constant degree conversion is not reversible so the input graph is stored as well
+            arrays["idx_map"] = to_array(
+                "q", self.constant_degree_dict["idx_map"]
+            )
+            input_csr_graph = self.input_csr_graph
+            arrays["input_indptr"] = to_array("q", input_csr_graph["indptr"])
+            arrays["input_indices"] = to_array("q", input_csr_graph["indices"])
+            if self.weight_mode == "lexicographic":
+                arrays["input_weights"] = to_array(
+                    "d", input_csr_graph["weights"]
+                )
+            else:
+                arrays["input_fixed_weights"] = array(
+                    "q",
+                    [
+                        int(weight.scaleb(self.precision))
+                        for weight in input_csr_graph["weights"]
+                    ],
+                )
+        if self._landmarks is not None:
+            for key, values in self._landmarks.items():
+                arrays["landmark_" + key] = values
+        if self._coordinates is not None:
+            metadata["coordinate_metric"] = self._coordinates["metric"]
+            metadata["coordinate_scale"] = self._coordinates["scale"]
+            arrays["coordinate_x"] = self._coordinates["x"]
+            arrays["coordinate_y"] = self._coordinates["y"]
+        if self._contraction_hierarchy is not None:
+            # Hierarchy weights are rebuilt from the used graph weights when loading
+            for key, values in self._contraction_hierarchy.items():
+                if key != "edge_weights":
+                    arrays["contraction_" + key] = values
+        if self._hub_labels is not None:
+            for key, values in self._hub_labels.items():
+                arrays["hub_label_" + key] = values
+        return metadata, arrays
+
+    @classmethod
+    def _from_stored_arrays(cls, metadata: dict, arrays: dict):
+        """
+        Function:
+
+        - Create a Bmssp object from the metadata and arrays returned by `Bmssp._get_stored_arrays`.
+        - The arrays are used in place (without copying) where possible.
+        """
+        self = cls.__new__(cls)
+        self.precision = metadata["precision"]
+        self.use_constant_degree_graph = metadata["use_constant_degree_graph"]
+        self.weight_mode = metadata["weight_mode"]
+        self.original_graph_len = metadata["original_graph_len"]
+        self._stored_arrays = arrays
+        self._init_lazy_state()
+        self._input_csr_graph = None
+        self.csr_graph = {
+            "indptr": arrays["indptr"],
+            "indices": arrays["indices"],
+        }
+        if self.use_constant_degree_graph:
+            self.constant_degree_dict = {
+                "idx_map": arrays["idx_map"],
+                "original_graph_len": self.original_graph_len,
+            }
+        if self.weight_mode == "lexicographic":
+            self.csr_graph["weights"] = arrays["weights"]
+            self.counter_value = int(metadata["counter_value"])
+        elif self.weight_mode == "integer":
+            self.counter_value = int(metadata["counter_value"])
+            self.weight_scale = metadata["weight_scale"]
+            if "key_weights" in arrays:
+                self.csr_graph["weights"] = arrays["weights"]
+                self.csr_graph["key_weights"] = arrays["key_weights"]
+            else:
+                # Weights that do not fit in 64 bits are rebuilt from the fixed point weights
+                weights = [
+                    weight * self.weight_scale + self.counter_value
+                    for weight in arrays["fixed_weights"]
+                ]
+                self.csr_graph["weights"] = weights
+                self.csr_graph["key_weights"] = [
+                    weight + edge_idx + 1
+                    for edge_idx, weight in enumerate(weights)
+                ]
+        else:
+            self.csr_graph["weights"] = [
+                Decimal(weight).scaleb(-self.precision)
+                for weight in arrays["fixed_weights"]
+            ]
+            self._set_unique_path_adjustments()
+        if "landmark_ids" in arrays:
+            self._landmarks = {
+                key: arrays["landmark_" + key]
+                for key in ["ids", "forward", "reverse"]
+            }
+        if "coordinate_x" in arrays:
+            self._coordinates = {
+                "x": arrays["coordinate_x"],
+                "y": arrays["coordinate_y"],
+                "metric": metadata["coordinate_metric"],
+                "scale": metadata["coordinate_scale"],
+            }
+        if "contraction_edge_count" in arrays:
+            self._contraction_hierarchy = {
+                key[len("contraction_") :]: values
+                for key, values in arrays.items()
+                if key.startswith("contraction_")
+            }
+            self._contraction_hierarchy["edge_weights"] = (
+                get_hierarchy_edge_weights(
+                    self._contraction_hierarchy, self.csr_graph["weights"]
+                )
+            )
+        if "hub_label_out_offsets" in arrays:
+            self._hub_labels = {
+                key[len("hub_label_") :]: values
+                for key, values in arrays.items()
+                if key.startswith("hub_label_")
+            }
+        return self
+
+    def save(self, path: str) -> None:
+        """
+        Function:
+
+        - Save the prepared graph to a versioned binary file that can be memory mapped by `Bmssp.load`.
+        - This stores the used CSR graph, the constant degree idx_map and the unique path length adjustment values
+          such that none of the setup in `Bmssp.__init__` needs to be repeated when loading.
+
+        Required Arguments:
+
+        - `path`:
+            - Type: str
+            - What: The file path to save to
+
+        Optional Arguments:
+
+        - None
+        """
+        metadata, arrays = self._get_stored_arrays()
+        write_arrays(path=path, metadata=metadata, arrays=arrays)
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        Function:
+
+        - Load a prepared graph saved with `Bmssp.save`.
+        - The graph arrays are memory mapped (read only) such that loading is near instant and
+          multiple processes that load the same file share the same physical memory pages.
+            - Note: Decimal weights can not be memory mapped so they are rebuilt from stored fixed point weights when `weight_mode="decimal"`.
+            - Note: When `weight_mode="integer"`, weights that do not fit in 64 bits are rebuilt from stored fixed point weights as well.
+
+        Required Arguments:
+
+        - `path`:
+            - Type: str
+            - What: The file path to load from
+
+        Optional Arguments:
+
+        - None
+
+        Returns:
+
+        - A Bmssp object
+        """
+        metadata, arrays, mapped_file = read_arrays(path)
+        self = cls._from_stored_arrays(metadata=metadata, arrays=arrays)
+        # Keep the mapped file (and the arrays that view it) alive as long as this object is used
+        self._mapped_file = mapped_file
+        return self
+
+    def to_shared_memory(self, name: str | None = None) -> SharedMemory:
+        """
+        Function:
+
+        - Copy the prepared graph into a new shared memory block that other processes can attach to with `Bmssp.attach`.
+
+        Required Arguments:
+
+        - None
+
+        Optional Arguments:
+
+        - `name`:
+            - Type: str | None
+            - Default: None
+            - What: The name of the shared memory block to create
+            - Note: If None, a unique name is generated
+
+        Returns:
+
+        - The created SharedMemory object
+            - Note: Pass `shared_memory.name` to `Bmssp.attach` in each worker process.
+            - Note: The caller owns the shared memory block and must call `close()` and `unlink()` on it once all workers are done.
+        """
+        metadata, arrays = self._get_stored_arrays()
+        return write_arrays_to_shared_memory(
+            metadata=metadata, arrays=arrays, name=name
+        )
+
+    @classmethod
+    def attach(cls, name: str):
+        """
+        Function:
+
+        - Attach to a prepared graph placed in shared memory with `Bmssp.to_shared_memory`.
+        - The graph arrays are read only views of the shared memory block such that all attached processes share the same physical memory pages.
+          Only the per solve distance and predecessor arrays are private to each process.
+            - Note: Decimal weights can not be shared so each process rebuilds them from stored fixed point weights when `weight_mode="decimal"`.
+            - Note: When `weight_mode="integer"`, weights that do not fit in 64 bits are rebuilt in each process as well.
+
+        Required Arguments:
+
+        - `name`:
+            - Type: str
+            - What: The name of the shared memory block to attach to
+
+        Optional Arguments:
+
+        - None
+
+        Returns:
+
+        - A Bmssp object
+        """
+        shared_arrays = SharedArrays(name=name)
+        self = cls._from_stored_arrays(
+            metadata=shared_arrays.metadata, arrays=shared_arrays.arrays
+        )
+        # Keep the shared memory block attached as long as this object is used
+        self._shared_arrays = shared_arrays
+        return self
+
+    @property
+    def input_csr_graph(self) -> dict:
+        """
+        The input graph (with rounded weights) as a CSR graph before any constant degree conversion.
+
+        - Note: For loaded graphs, this is built from the stored arrays the first time it is accessed.
+        """
+        if self._input_csr_graph is None:
+            prefix = "input_" if self.use_constant_degree_graph else ""
+            arrays = self._stored_arrays
+            if self.weight_mode == "lexicographic":
+                weights = arrays[prefix + "weights"]
+            else:
+                weights = [
+                    Decimal(weight).scaleb(-self.precision)
+                    for weight in arrays[prefix + "fixed_weights"]
+                ]
+            self._input_csr_graph = {
+                "indptr": arrays[prefix + "indptr"],
+                "indices": arrays[prefix + "indices"],
+                "weights": weights,
+            }
+        return self._input_csr_graph
+
+    @property
+    def graph(self) -> list[dict[int, int | float]]:
+        """
+        The input graph (with rounded weights) represented as a list of dictionaries.
+
+        - Note: This is built from `input_csr_graph` the first time it is accessed.
+        - Note: Changing this graph does not change the solved graph. Use `Bmssp.update_edge_weight` instead.
+        """
+        if self._graph is None:
+            self._graph = csr_to_graph(self.input_csr_graph)
+        return self._graph
 
-        self.counter_value = Decimal(10) ** -(self.precision + ceil(log(Decimal(num_nodes * 2 + 1), 10)))
-        edge_id_adjustment_value = Decimal(10) ** -(self.precision + ceil(log(Decimal(num_nodes * 2 + 1), 10)) + ceil(log(Decimal(num_edges + 1), 10)))
+    @property
+    def reverse(self) -> "Bmssp":
+        """
+        A Bmssp object for the reversed input graph (every edge i -> j replaced by j -> i) used for `direction="reverse"` solves.
 
-        # Store a set of adjustment values to be used during BMSSP solving
-        edge_id_value = Decimal(0.0)
-        self.edge_adj_graph = [{} for _ in range(len(self.used_graph))]
-        for node_idx, node_neighbors in enumerate(self.used_graph):
-            for neighbor in node_neighbors:
-                edge_id_value += edge_id_adjustment_value
-                self.edge_adj_graph[node_idx][neighbor] = edge_id_value
+        - Note: This is built (with its own unique path length adjustments for the reversed edges) the first time it is accessed and then cached.
+        """
+        if self._reverse is None:
+            self._reverse = Bmssp(
+                graph=transpose_csr(self.input_csr_graph),
+                precision=self.precision,
+                use_constant_degree_graph=self.use_constant_degree_graph,
+                weight_mode=self.weight_mode,
+            )
+            # The reverse of the reversed graph is this graph
+            self._reverse._reverse = self
+        return self._reverse
 
     def solve(
         self,
-        origin_id: int | set[int],
+        origin_id: int | set[int] | dict[int, int | float],
         destination_id: int = None,
         data_structure=ListBmsspDataStructure,
         pivot_relaxation_steps: int | None = None,
         target_tree_depth: int | None = None,
+        early_termination: bool = False,
+        max_distance: int | float | None = None,
+        sparse: bool = False,
+        source_label: bool = False,
+        direction: str = "forward",
+        engine: str = "bmssp",
     ):
         """
         Function:
@@ -95,13 +696,24 @@ class Bmssp:
         - Return a dictionary of various path information including:
             - `id_path`: A list of node ids in the order they are visited
             - `path`: A list of node dictionaries (lat + long) in the order they are visited
+        - Note: If a solve cache is set (see `Bmssp.set_solve_cache`), the full solve of each origin is cached such that later calls with the same origin
+          (for any destination) are answered from the cache without solving.
+            - Note: The cache is not used if `max_distance`, `sparse` or `source_label` is provided or if `engine` is not "bmssp".
+            - Note: With the cache set, `early_termination` is not used since a cache miss always runs the full solve.
+        - Note: Concurrent calls (eg: from a thread pool or `asyncio.to_thread`) with the same origin wait for a single solve and each return a copy of its result
+          (see `Bmssp.get_solve_coalescing_info`).
+            - Note: Calls with a `destination_id` share the full solve of their origin unless `early_termination` is used, in which case only calls with the same destination are shared.
+            - Note: Calls are only shared if they use the same `max_distance`, `sparse` and `source_label` arguments.
 
         Required Arguments:
 
         - `origin_id`
-            - Type: int | set of int
+            - Type: int | set of int | dict of int: int | float
             - What: The id of the origin node from the graph dictionary to start the shortest path from
             - Note: If you pass a set, only the first id in the set will be checked for input validation
+            - Note: If you pass a dictionary of origin id: offset pairs, each origin starts at its (nonnegative) offset instead of zero
+                - This is the same as adding a super source with an edge of length offset to each origin without rebuilding the graph
+                - Returned distances include the offset of the origin each path starts from
         - `destination_id`
             - Type: int | None
             - What: The id of the destination node from the graph dictionary to end the shortest path at
@@ -118,6 +730,57 @@ class Bmssp:
             - Type: int | None
             - Default: int(log(len(graph), 2) ** (2 / 3))
             - What: The target depth of the search tree (t). If None, it will be computed based on the graph size.
+        - early_termination:
+            - Type: bool
+            - Default: False
+            - What: Whether to stop solving as soon as the distance to `destination_id` is final.
+            - Note: This only has an effect if `destination_id` is provided.
+            - Note: The work done scales with the number of nodes closer to the origin than the destination instead of the size of the graph.
+            - Note: Only nodes that are at most as far from the origin as the destination are returned with their distances and predecessors.
+                All other nodes are returned as unreached (an inf distance and a -1 predecessor) even if they are connected to the origin.
+        - max_distance:
+            - Type: int | float | None
+            - Default: None
+            - What: If provided, only solve for nodes with a shortest distance less than or equal to this distance.
+            - Note: This is used as the upper bound (B) of the top level BMSSP recursion such that the work done scales with the number of nodes within this distance.
+            - Note: If provided, `predecessor` and `distance_matrix` are returned as sparse arrays (see `sparse`) that only store the node ids within this distance.
+            - Note: If `destination_id` is not within this distance, `path` is None and `length` is inf.
+        - sparse:
+            - Type: bool
+            - Default: False
+            - What: Whether to return `predecessor` and `distance_matrix` as sparse arrays that only store the nodes reached by the solve.
+            - Note: Each sparse array is a dictionary of node id: value pairs that returns the dense default (inf or -1) for any other node id in the graph.
+                - Use `to_list()` to materialize the full dense list.
+            - Note: The time and memory used to build the result scales with the number of nodes reached instead of the size of the graph.
+        - source_label:
+            - Type: bool
+            - Default: False
+            - What: Whether to also return `source_label`, the origin id that the shortest path to each node starts from.
+            - Note: This is most useful with a set (or dictionary) of origins to assign every node to its nearest origin (eg: store territories) in a single solve.
+            - Note: Labels are filled in by the solver during relaxation such that no predecessor chains need to be walked.
+            - Note: Unreached nodes have a label of -1. If `sparse` or `max_distance` is used, `source_label` is also a sparse array.
+        - direction:
+            - Type: str
+            - Default: "forward"
+            - What: The direction to follow edges in
+            - Options:
+                - "forward": Solve for the distances from the origin to every node.
+                - "reverse": Solve for the distances from every node to the origin (eg: how far every node is from a hub on a directed graph).
+                    - Note: This solves on the reversed graph (see `Bmssp.reverse`), which is built and cached the first time it is used.
+                    - Note: `predecessor` holds the next node on the shortest path to the origin and `path` is [origin_id, ..., destination_id] in the reversed graph.
+                        Reverse `path` to get the path from destination_id to origin_id in this graph.
+        - engine:
+            - Type: str
+            - Default: "bmssp"
+            - What: The solver to use
+            - Options:
+                - "bmssp": Solve with BMSSP.
+                - "contraction_hierarchy": Solve a single point to point query with a bidirectional search on a contraction hierarchy (see `Bmssp.build_contraction_hierarchy`).
+                    - Note: This is meant for answering many point to point queries on a graph that rarely changes.
+                    - Note: The hierarchy is built the first time it is used and then cached (and saved with the graph).
+                    - Note: This requires a single integer `origin_id` and `destination_id`. Other optional arguments (except `direction`) are not used.
+                    - Note: `predecessor` and `distance_matrix` are returned as sparse arrays (see `sparse`) that only store the nodes on `path`.
+                    - Note: This returns the same `path` and `length` as the "bmssp" engine (see `Bmssp.solve_pair`).
 
         Returns:
 
@@ -128,71 +791,2251 @@ class Bmssp:
             - `distance_matrix`: The distance matrix from the origin node to all other nodes
             - `path`: The shortest path from origin_id to destination_id (or None)
             - `length`: The length of the shortest path from origin_id to destination_id (or None)
+            - `source_label`: The origin id that the shortest path to each node starts from (only if `source_label` is True)
         """
-        if isinstance(origin_id, set):
-            if len(origin_id) < 1:
-                raise ValueError(
-                    "Your provided origin_id set must have at least 1 node"
-                )
-            origin_id_check = next(iter(origin_id))
+        if self._check_direction(direction) == "reverse":
+            return self.reverse.solve(
+                origin_id=origin_id,
+                destination_id=destination_id,
+                data_structure=data_structure,
+                pivot_relaxation_steps=pivot_relaxation_steps,
+                target_tree_depth=target_tree_depth,
+                early_termination=early_termination,
+                max_distance=max_distance,
+                sparse=sparse,
+                source_label=source_label,
+                engine=engine,
+            )
+        if self._check_engine(engine) == "contraction_hierarchy":
+            return self._solve_contraction_hierarchy(
+                origin_id=origin_id, destination_id=destination_id
+            )
+        if (
+            self._solve_cache is not None
+            and max_distance is None
+            and not sparse
+            and not source_label
+        ):
+            return self._solve_cached(
+                origin_id=origin_id,
+                destination_id=destination_id,
+                data_structure=data_structure,
+                pivot_relaxation_steps=pivot_relaxation_steps,
+                target_tree_depth=target_tree_depth,
+            )
+        self._input_check(origin_id=origin_id, destination_id=destination_id)
+        if early_termination and destination_id is not None:
+            # Early terminated solves are only final up to their destination
+            solve_destination_id = destination_id
         else:
-            origin_id_check = origin_id
-        # Input Validation (Uses original graph and not used_graph to ensure validity)
-        input_check(
-            graph=self.graph,
-            origin_id=origin_id_check,
-            destination_id=destination_id,
-        )
+            # Full solves are shared by calls for any destination
+            solve_destination_id = None
 
-        # Run the BMSSP Algorithm to relax as many edges as possible.
-        solver = BmsspCore(
-            graph=self.used_graph,
-            origin_ids=origin_id,
-            counter_value=self.counter_value,
-            edge_adj_graph=self.edge_adj_graph,
-            data_structure=data_structure,
-            pivot_relaxation_steps=pivot_relaxation_steps,
-            target_tree_depth=target_tree_depth,
-        )
-        if destination_id is not None:
-            if solver.counter_distance_matrix[destination_id] == float("inf"):
-                raise Exception(
-                    "Something went wrong, the origin and destination nodes are not connected."
+        def solve_query() -> dict:
+            workspace = self._get_workspace()
+            try:
+                return self._solve(
+                    workspace=workspace,
+                    origin_id=origin_id,
+                    destination_id=solve_destination_id,
+                    data_structure=data_structure,
+                    pivot_relaxation_steps=pivot_relaxation_steps,
+                    target_tree_depth=target_tree_depth,
+                    early_termination=early_termination,
+                    max_distance=max_distance,
+                    sparse=sparse,
+                    source_label=source_label,
                 )
+            finally:
+                self._workspaces.append(workspace)
 
-        if self.use_constant_degree_graph:
-            converted_outputs = convert_from_constant_degree(
-                distance_matrix=solver.counter_distance_matrix,
-                predecessor_matrix=solver.predecessor,
-                constant_degree_dict=self.constant_degree_dict,
+        output, is_shared = self._single_flight.run(
+            (
+                "solve",
+                self._get_origin_key(origin_id),
+                solve_destination_id,
+                max_distance,
+                sparse,
+                source_label,
+            ),
+            solve_query,
+        )
+        if is_shared:
+            output = self._copy_solve_output(output, origin_id)
+        if destination_id is not None and solve_destination_id is None:
+            self._set_solve_destination(output, destination_id, max_distance)
+        return output
+
+    def solve_many(
+        self,
+        origin_ids,
+        destination_ids=None,
+        data_structure=ListBmsspDataStructure,
+        pivot_relaxation_steps: int | None = None,
+        target_tree_depth: int | None = None,
+        early_termination: bool = False,
+        max_distance: int | float | None = None,
+        sparse: bool = False,
+        source_label: bool = False,
+        direction: str = "forward",
+        engine: str = "bmssp",
+        processes: int = 1,
+        chunk_size: int = 1,
+        ordered: bool = True,
+    ):
+        """
+        Function:
+
+        - Solve a batch of queries and yield each result as soon as it is solved.
+        - All queries share one solver workspace and results are yielded lazily such that
+          long batches never hold more than one distance matrix in memory at once (unless the caller keeps them).
+        - Optionally fan the queries out across a pool of worker processes that attach to this graph in shared memory (see `Bmssp.attach`).
+
+        Required Arguments:
+
+        - `origin_ids`
+            - Type: iterable of (int | set of int)
+            - What: The origin id (or set of origin ids) for each query
+                - See `origin_id` in `Bmssp.solve`
+
+        Optional Arguments:
+
+        - `destination_ids`
+            - Type: iterable of (int | None) | None
+            - Default: None
+            - What: The destination id for each query
+            - Note: If provided, this must be the same length as `origin_ids`
+            - Note: If None, no destination is used for any query
+        - `data_structure`, `pivot_relaxation_steps`, `target_tree_depth`, `early_termination`, `max_distance`, `sparse`, `source_label`, `direction` and `engine`:
+            - See `Bmssp.solve`
+        - `processes`
+            - Type: int
+            - Default: 1
+            - What: The number of worker processes to solve with
+            - Note: If 1, all queries are solved in the current process
+            - Note: If more than 1, this must be called from a `if __name__ == "__main__":` block on platforms that spawn new processes (eg: Windows and MacOS)
+        - `chunk_size`
+            - Type: int
+            - Default: 1
+            - What: The number of queries sent to a worker process at a time
+            - Note: Only used if `processes` is more than 1
+        - `ordered`
+            - Type: bool
+            - Default: True
+            - What: Whether to yield results in the same order as the queries
+            - Note: If False, results are yielded as soon as any worker process finishes them
+                - Use `origin_id` and `destination_id` in each result to match it to its query
+            - Note: Only used if `processes` is more than 1
+
+        Returns:
+
+        - A generator that yields one dictionary for each query
+            - See the returns of `Bmssp.solve`
+        """
+        if self._check_direction(direction) == "reverse":
+            yield from self.reverse.solve_many(
+                origin_ids=origin_ids,
+                destination_ids=destination_ids,
+                data_structure=data_structure,
+                pivot_relaxation_steps=pivot_relaxation_steps,
+                target_tree_depth=target_tree_depth,
+                early_termination=early_termination,
+                max_distance=max_distance,
+                sparse=sparse,
+                source_label=source_label,
+                engine=engine,
+                processes=processes,
+                chunk_size=chunk_size,
+                ordered=ordered,
             )
-            predecessor = converted_outputs["predecessor_matrix"]
-            distance_matrix = converted_outputs["distance_matrix"]
+            return
+        if self._check_engine(engine) == "contraction_hierarchy":
+            # Build the hierarchy once up front such that worker processes share it
+            self._get_contraction_hierarchy()
+        if destination_ids is None:
+            queries = ((origin_id, None) for origin_id in origin_ids)
         else:
-            predecessor = solver.predecessor
-            distance_matrix = solver.counter_distance_matrix
+            queries = zip(origin_ids, destination_ids, strict=True)
+        if processes > 1:
+            yield from self._map_in_processes(
+                worker=_solve_worker_query,
+                queries=queries,
+                worker_kwargs={
+                    "data_structure": data_structure,
+                    "pivot_relaxation_steps": pivot_relaxation_steps,
+                    "target_tree_depth": target_tree_depth,
+                    "early_termination": early_termination,
+                    "max_distance": max_distance,
+                    "sparse": sparse,
+                    "source_label": source_label,
+                    "engine": engine,
+                },
+                processes=processes,
+                chunk_size=chunk_size,
+                ordered=ordered,
+            )
+            return
+        workspace = self._get_workspace()
+        try:
+            for origin_id, destination_id in queries:
+                if engine == "contraction_hierarchy":
+                    yield self._solve_contraction_hierarchy(
+                        origin_id=origin_id, destination_id=destination_id
+                    )
+                    continue
+                yield self._solve(
+                    workspace=workspace,
+                    origin_id=origin_id,
+                    destination_id=destination_id,
+                    data_structure=data_structure,
+                    pivot_relaxation_steps=pivot_relaxation_steps,
+                    target_tree_depth=target_tree_depth,
+                    early_termination=early_termination,
+                    max_distance=max_distance,
+                    sparse=sparse,
+                    source_label=source_label,
+                )
+        finally:
+            self._workspaces.append(workspace)
 
-        # Remove counter values from distance matrix
-        distance_matrix = [
-            float(round(i, self.precision)) if i != inf else i
-            for i in distance_matrix
-        ]
+    def _map_in_processes(
+        self,
+        worker,
+        queries,
+        worker_kwargs: dict,
+        processes: int,
+        chunk_size: int,
+        ordered: bool,
+    ):
+        """
+        Function:
 
-        return {
-            "origin_id": (
-                origin_id if isinstance(origin_id, int) else list(origin_id)
-            ),
-            "destination_id": destination_id,
-            "predecessor": predecessor,
-            "distance_matrix": distance_matrix,
-            "path": (
-                reconstruct_path(
-                    destination_id=destination_id, predecessor=predecessor
-                )
-                if destination_id
-                else None
-            ),
-            "length": (
-                distance_matrix[destination_id] if destination_id else None
-            ),
-        }
+        - Run a worker function on each query in a pool of worker processes and yield each result.
+        - The graph is placed in shared memory once and each worker attaches to it when it starts
+          such that workers do not copy or rebuild the prepared graph.
+        - The worker function is called with each query and can access the attached graph and `worker_kwargs` in `_solve_worker_state`.
+        - See `Bmssp.solve_many` for the other arguments.
+        """
+        shared_memory = self.to_shared_memory()
+        try:
+            with Pool(
+                processes=processes,
+                initializer=_init_solve_worker,
+                initargs=(shared_memory.name, worker_kwargs),
+            ) as pool:
+                map_queries = pool.imap if ordered else pool.imap_unordered
+                yield from map_queries(worker, queries, chunksize=chunk_size)
+        finally:
+            shared_memory.close()
+            shared_memory.unlink()
+
+    def update_edge_weight(
+        self,
+        origin_id: int,
+        destination_id: int,
+        weight: int | float,
+    ) -> None:
+        """
+        Function:
+
+        - Change the weight of the edge from origin_id to destination_id in place (eg: for live traffic updates) without rebuilding the graph.
+        - The weight is rounded (or converted) and adjusted for unique path lengths the same way as when the graph is built.
+            - Note: If there are multiple edges from origin_id to destination_id, all of them are changed.
+            - Note: Cached solve results (see `Bmssp.set_solve_cache`) are cleared and the reversed graph (see `Bmssp.reverse`) is rebuilt when it is next used.
+            - Note: Landmarks, contraction hierarchies and hub labels depend on every edge weight so they are removed and must be built again.
+            - Note: For graphs from `Bmssp.load` or `Bmssp.attach`, the weights are copied the first time they are changed such that the file or shared memory is not changed.
+
+        Required Arguments:
+
+        - `origin_id`
+            - Type: int
+            - What: The id of the node the edge starts at
+        - `destination_id`
+            - Type: int
+            - What: The id of the node the edge ends at
+        - `weight`
+            - Type: int | float
+            - What: The new (nonnegative) weight of the edge
+
+        Optional Arguments:
+
+        - None
+
+        Returns:
+
+        - None
+        """
+        input_check(
+            graph=range(self.original_graph_len),
+            origin_id=origin_id,
+            destination_id=destination_id,
+        )
+        if not 0 <= weight < float("inf"):
+            raise ValueError(
+                f"Your provided weight ({weight}) must be nonnegative and finite"
+            )
+        input_csr_graph = self.input_csr_graph
+        edge_positions = [
+            edge_idx
+            for edge_idx in range(
+                input_csr_graph["indptr"][origin_id],
+                input_csr_graph["indptr"][origin_id + 1],
+            )
+            if input_csr_graph["indices"][edge_idx] == destination_id
+        ]
+        if not edge_positions:
+            raise ValueError(
+                f"There is no edge from node ({origin_id}) to node ({destination_id}) in the graph"
+            )
+        # Stored (memory mapped or shared) arrays are read only or shared with other processes so they are copied before they are changed
+        for csr_graph, key in [
+            (input_csr_graph, "weights"),
+            (self.csr_graph, "weights"),
+            (self.csr_graph, "key_weights"),
+        ]:
+            if isinstance(csr_graph.get(key), memoryview):
+                csr_graph[key] = list(csr_graph[key])
+
+        if self.weight_mode == "lexicographic":
+            input_weight = float(weight)
+            used_weight = input_weight
+        else:
+            input_weight = round(Decimal(weight), self.precision)
+            if self.weight_mode == "integer":
+                used_weight = (
+                    int(input_weight.scaleb(self.precision)) * self.weight_scale
+                    + self.counter_value
+                )
+            else:
+                used_weight = input_weight + self.counter_value
+        weights = self.csr_graph["weights"]
+        key_weights = self.csr_graph.get("key_weights")
+        for edge_idx in edge_positions:
+            input_csr_graph["weights"][edge_idx] = input_weight
+            used_edge_idx = self._get_used_edge_position(
+                origin_id, edge_idx - input_csr_graph["indptr"][origin_id]
+            )
+            if used_edge_idx is None:
+                continue
+            if key_weights is not None:
+                # Keep the unique edge id adjustment of the edge
+                key_weights[used_edge_idx] = used_weight + (
+                    key_weights[used_edge_idx] - weights[used_edge_idx]
+                )
+            weights[used_edge_idx] = used_weight
+        self._mark_graph_changed()
+
+    def set_solve_cache(self, max_bytes: int | None = 64 * 2**20) -> None:
+        """
+        Function:
+
+        - Set (or remove) a least recently used cache of full solve results for `Bmssp.solve`.
+        - The predecessor list and distance matrix of each full solve are stored as compact arrays under its origin id (or frozen origin set)
+          such that repeated solves from the same origins (eg: airports or depots) only rebuild the outputs and reconstruct the path.
+            - Note: Entries are evicted (least recently used first) by their total size in bytes instead of their count.
+            - Note: The cache is cleared when the graph is changed (see `Bmssp.update_edge_weight`) or with `Bmssp.clear_solve_cache`.
+            - Note: The cache is not saved or shared with the graph.
+        - Concurrent solves that miss the cache for the same origin wait for a single full solve (see `Bmssp.get_solve_coalescing_info`).
+
+        Required Arguments:
+
+        - None
+
+        Optional Arguments:
+
+        - `max_bytes`
+            - Type: int | None
+            - Default: 64 * 2**20 (64 MiB)
+            - What: The largest total number of bytes of cached arrays
+            - Note: Each entry uses about 8 to 16 bytes per node in the graph.
+            - Note: If None, the cache is removed.
+
+        Returns:
+
+        - None
+        """
+        if max_bytes is None:
+            self._solve_cache = None
+            return
+        self._solve_cache = {
+            "cache": ByteSizeLruCache(max_bytes=max_bytes),
+            "graph_version": self._graph_version,
+            # Incremented on each clear such that solves that were running during a clear are not cached
+            "generation": 0,
+            # Guards the graph version, generation and clears against concurrent solves
+            "lock": Lock(),
+        }
+
+    def clear_solve_cache(self) -> None:
+        """
+        Function:
+
+        - Remove every cached solve result (see `Bmssp.set_solve_cache`).
+        - Note: This is done automatically when the graph is changed with `Bmssp.update_edge_weight`.
+        """
+        solve_cache = self._solve_cache
+        if solve_cache is not None:
+            with solve_cache["lock"]:
+                self._clear_solve_cache(solve_cache)
+
+    def get_solve_cache_info(self) -> dict:
+        """
+        Function:
+
+        - Report the state of the solve cache (see `Bmssp.set_solve_cache`).
+
+        Required Arguments:
+
+        - None
+
+        Optional Arguments:
+
+        - None
+
+        Returns:
+
+        - A dictionary with the following keys
+            - `hits`: The number of solves answered from the cache
+            - `misses`: The number of solves that were not cached
+            - `evictions`: The number of entries removed to stay within `max_bytes`
+            - `entries`: The number of cached origins
+            - `bytes`: The total number of bytes of cached arrays
+            - `max_bytes`: The largest total number of bytes of cached arrays
+        """
+        if self._solve_cache is None:
+            raise ValueError(
+                "A solve cache has not been set. Call Bmssp.set_solve_cache first."
+            )
+        return self._solve_cache["cache"].get_info()
+
+    def get_solve_coalescing_info(self) -> dict:
+        """
+        Function:
+
+        - Report how many concurrent `Bmssp.solve` calls were coalesced (single flight) to watch how much duplicate work is saved.
+        - Concurrent calls with the same origin (eg: in bursts after `Bmssp.clear_solve_cache`) wait for the first one to finish solving
+          and each return a copy of its result instead of solving again.
+            - Note: If the shared solve raises an error, every waiting call raises the same error.
+
+        Required Arguments:
+
+        - None
+
+        Optional Arguments:
+
+        - None
+
+        Returns:
+
+        - A dictionary with the following keys
+            - `solves`: The number of solves run (including cache misses)
+            - `coalesced`: The number of calls that waited for a concurrent solve instead of solving again
+            - `in_flight`: The number of solves currently running
+        """
+        single_flight_info = self._single_flight.get_info()
+        return {
+            "solves": single_flight_info["calls"],
+            "coalesced": single_flight_info["coalesced"],
+            "in_flight": single_flight_info["in_flight"],
+        }
+
+    def build_landmarks(
+        self, num_landmarks: int = 8, start_id: int = 0
+    ) -> None:
+        """
+        Function:
+
+        - Pick landmarks and precompute the distances from and to each of them for goal directed (ALT) point to point solves (see `Bmssp.solve_pair`).
+        - Landmarks are picked with the farthest point heuristic:
+            - Each landmark is the node with the largest round trip distance (to and from) to its closest previously picked landmark (or to `start_id` for the first landmark).
+            - If no other node has a finite round trip distance, a node that is not connected to any picked landmark is picked instead.
+        - Each landmark takes one forward and one reverse solve (see `direction` in `Bmssp.solve`).
+        - The distance tables are stored as float32 arrays (8 bytes per landmark per node) and are saved with `Bmssp.save` and shared with `Bmssp.to_shared_memory`.
+
+        Required Arguments:
+
+        - None
+
+        Optional Arguments:
+
+        - `num_landmarks`
+            - Type: int
+            - Default: 8
+            - What: The number of landmarks to pick
+            - Note: More landmarks give tighter lower bounds (fewer searched nodes) at the cost of more memory and work per searched node.
+        - `start_id`
+            - Type: int
+            - Default: 0
+            - What: The node to pick the first landmark relative to
+
+        Returns:
+
+        - None
+        """
+        if not isinstance(num_landmarks, int) or num_landmarks < 1:
+            raise ValueError("Your provided num_landmarks must be at least 1")
+        self._input_check(origin_id=start_id, destination_id=None)
+        graph_len = self.original_graph_len
+        landmark_ids = array("q")
+        forward = array("f")
+        reverse = array("f")
+        # The round trip distance from each node to its closest landmark (or the start node)
+        closest_distances = None
+        next_id = start_id
+        for landmark_idx in range(min(num_landmarks, graph_len) + 1):
+            forward_distances = [
+                float(distance)
+                for distance in self.solve(next_id)["distance_matrix"]
+            ]
+            reverse_distances = [
+                float(distance)
+                for distance in self.solve(next_id, direction="reverse")[
+                    "distance_matrix"
+                ]
+            ]
+            # The start node is only used to pick the first landmark
+            if landmark_idx > 0:
+                landmark_ids.append(next_id)
+                forward.extend(forward_distances)
+                reverse.extend(reverse_distances)
+            round_trip_distances = [
+                forward_distance + reverse_distance
+                for forward_distance, reverse_distance in zip(
+                    forward_distances, reverse_distances
+                )
+            ]
+            if closest_distances is None:
+                closest_distances = round_trip_distances
+            else:
+                closest_distances = list(
+                    map(min, closest_distances, round_trip_distances)
+                )
+            # Prefer the farthest connected node and then any node that is not connected
+            next_id = max(
+                range(graph_len),
+                key=lambda node_idx: (
+                    0 < closest_distances[node_idx] < float("inf"),
+                    closest_distances[node_idx] == float("inf"),
+                    closest_distances[node_idx],
+                ),
+            )
+            if closest_distances[next_id] == 0:
+                # Every node is already a landmark (or the start node) or at zero distance from one
+                break
+        self._landmarks = {
+            "ids": landmark_ids,
+            "forward": forward,
+            "reverse": reverse,
+        }
+
+    def set_coordinates(
+        self,
+        coordinates,
+        metric: str = "haversine",
+        scale: int | float = 1,
+    ) -> None:
+        """
+        Function:
+
+        - Set the coordinates of each node for goal directed (A*) point to point solves (see `Bmssp.solve_pair`).
+        - The distance between two nodes with the given metric multiplied by `scale` is used as a lower bound on the shortest path length between them.
+            - Note: Partition nodes from the constant degree conversion use the coordinates of their original node.
+            - Note: The coordinates are saved with `Bmssp.save` and shared with `Bmssp.to_shared_memory`.
+
+        Required Arguments:
+
+        - `coordinates`
+            - Type: Any sequence of (x, y) pairs or dictionaries with `latitude` and `longitude` keys
+            - What: The coordinates of each node in order of node id
+            - Note: For the haversine metric, each pair is (latitude, longitude) in degrees.
+            - Note: Dictionaries (eg: scgraph geograph nodes) are converted to (latitude, longitude) pairs.
+
+        Optional Arguments:
+
+        - `metric`
+            - Type: str
+            - Default: "haversine"
+            - What: The distance metric to use
+            - Options:
+                - "haversine": The great circle distance in kilometers
+                - "euclidean": The straight line distance in coordinate units
+        - `scale`
+            - Type: int | float
+            - Default: 1
+            - What: The minimum edge weight per unit of metric distance
+            - Note: This must be declared such that every edge weight (rounded to `precision`) is at least `scale` times the metric distance between its nodes.
+                    Otherwise the heuristic may overestimate and a longer path may be returned.
+            - Note: For example, if weights are travel times in hours and no edge can be traveled faster than 100 km/h, use `scale=1/100`.
+
+        Returns:
+
+        - None
+        """
+        if metric not in ("haversine", "euclidean"):
+            raise ValueError(
+                f"Your provided metric ({metric}) must be one of: haversine, euclidean"
+            )
+        if not 0 <= scale < float("inf"):
+            raise ValueError(
+                "Your provided scale must be a nonnegative finite number"
+            )
+        x_values, y_values = coordinates_to_arrays(coordinates)
+        if len(x_values) != self.original_graph_len:
+            raise ValueError(
+                "Your provided coordinates must have one entry for each node in the graph"
+            )
+        self._coordinates = {
+            "x": x_values,
+            "y": y_values,
+            "metric": metric,
+            "scale": float(scale),
+        }
+
+    def build_contraction_hierarchy(
+        self, witness_settle_limit: int = 64
+    ) -> None:
+        """
+        Function:
+
+        - Build a contraction hierarchy of the used graph for fast repeated point to point solves (see `engine` in `Bmssp.solve` and `Bmssp.solve_pair`).
+        - Nodes are contracted in order of importance (edge difference) and shortcuts are added to keep the distances between the remaining nodes.
+        - Queries then search upward from the origin and the destination on the upward and downward CSR graphs and unpack the shortcuts on the shortest path.
+            - Note: Building the hierarchy takes much longer than a single solve, so this is meant for graphs that answer many point to point queries between changes.
+            - Note: The hierarchy is saved with `Bmssp.save` and shared with `Bmssp.to_shared_memory`.
+            - Note: This is not supported when `weight_mode="lexicographic"` since float sums depend on their order.
+
+        Required Arguments:
+
+        - None
+
+        Optional Arguments:
+
+        - `witness_settle_limit`
+            - Type: int
+            - Default: 64
+            - What: The maximum number of nodes settled by each witness search that checks if a shortcut is needed
+            - Note: Smaller limits build faster but may add shortcuts that are not needed (which slows down queries).
+
+        Returns:
+
+        - None
+        """
+        if self.weight_mode == "lexicographic":
+            raise ValueError(
+                "Contraction hierarchies are not supported when weight_mode is lexicographic"
+            )
+        if (
+            not isinstance(witness_settle_limit, int)
+            or witness_settle_limit < 1
+        ):
+            raise ValueError(
+                f"Your provided witness_settle_limit ({witness_settle_limit}) must be a positive int"
+            )
+        self._contraction_hierarchy = build_contraction_hierarchy(
+            graph=self.csr_graph, witness_settle_limit=witness_settle_limit
+        )
+
+    def build_hub_labels(self, num_samples: int = 16) -> None:
+        """
+        Function:
+
+        - Build hub labels (a two hop cover) of the input graph for exact distance queries in microseconds (see `Bmssp.solve_distance`).
+        - Hubs are ordered by importance: the number of nodes below each node in the shortest path trees of `num_samples` BMSSP solves (ties are broken by degree).
+        - The labels are then built with pruned landmark labeling: a pruned Dijkstra search from (and to) each hub in order
+          that only labels the nodes whose distance is not already given by the labels of more important hubs.
+            - Note: Building the labels takes much longer than a single solve and label sizes grow with the graph (see `Bmssp.get_hub_label_memory_usage`),
+                    so this is meant for mid-size graphs that answer many distance queries between changes.
+            - Note: Labels are stored as flat arrays (offsets, sorted hub ids and float64 distances) that are saved with `Bmssp.save` and shared with `Bmssp.to_shared_memory`.
+
+        Required Arguments:
+
+        - None
+
+        Optional Arguments:
+
+        - `num_samples`
+            - Type: int
+            - Default: 16
+            - What: The number of (evenly spaced) origins to solve from when ordering hubs
+            - Note: More samples order hubs better (smaller labels) at the cost of more solves.
+
+        Returns:
+
+        - None
+        """
+        if not isinstance(num_samples, int) or num_samples < 1:
+            raise ValueError(
+                f"Your provided num_samples ({num_samples}) must be a positive int"
+            )
+        input_csr_graph = self.input_csr_graph
+        if self.weight_mode == "lexicographic":
+            weights = input_csr_graph["weights"]
+            convert_distance = None
+        else:
+            # Search with fixed point ints such that pruning is exact
+            weights = [
+                int(weight.scaleb(self.precision))
+                for weight in input_csr_graph["weights"]
+            ]
+            precision_scale = 10**self.precision
+            convert_distance = lambda i: i / precision_scale
+        label_graph = {
+            "indptr": input_csr_graph["indptr"],
+            "indices": input_csr_graph["indices"],
+            "weights": weights,
+        }
+        self._hub_labels = build_hub_labels(
+            graph=label_graph,
+            reverse_graph=transpose_csr(label_graph),
+            order=self._get_hub_order(num_samples),
+            convert_distance=convert_distance,
+        )
+
+    def solve_distance(self, origin_id: int, destination_id: int) -> float:
+        """
+        Function:
+
+        - Return the shortest distance from origin_id to destination_id with the hub labels (see `Bmssp.build_hub_labels`).
+        - This merges two sorted label arrays such that no search is run.
+            - Note: This returns the same distance as `Bmssp.solve(origin_id, destination_id)["length"]`
+                    (to float precision when `weight_mode="lexicographic"`).
+
+        Required Arguments:
+
+        - `origin_id`
+            - Type: int
+            - What: The id of the origin node
+        - `destination_id`
+            - Type: int
+            - What: The id of the destination node
+
+        Optional Arguments:
+
+        - None
+
+        Returns:
+
+        - The length of the shortest path from origin_id to destination_id (inf if the destination is not reachable)
+        """
+        if self._hub_labels is None:
+            raise ValueError(
+                "Hub labels have not been built. Call Bmssp.build_hub_labels first."
+            )
+        if not isinstance(origin_id, int) or not isinstance(
+            destination_id, int
+        ):
+            raise ValueError(
+                "Your provided origin_id and destination_id must both be integers"
+            )
+        self._input_check(origin_id=origin_id, destination_id=destination_id)
+        distance = query_hub_labels(
+            hub_labels=self._hub_labels,
+            origin_id=origin_id,
+            destination_id=destination_id,
+        )
+        if self.weight_mode == "lexicographic" or distance == float("inf"):
+            return distance
+        # Remove any float error from summing the two label distances
+        return round(distance, self.precision)
+
+    def get_hub_label_memory_usage(self) -> dict:
+        """
+        Function:
+
+        - Report the size of the hub labels (see `Bmssp.build_hub_labels`) to judge whether they fit in memory.
+
+        Required Arguments:
+
+        - None
+
+        Optional Arguments:
+
+        - None
+
+        Returns:
+
+        - A dictionary with the following keys
+            - `num_entries`: The total number of (hub id, distance) entries in all in and out labels
+            - `average_label_size`: The average number of entries in each in and out label
+            - `max_label_size`: The largest number of entries in any in or out label
+            - `array_bytes`: A dictionary of the number of bytes used by each flat label array
+            - `total_bytes`: The total number of bytes used by all label arrays
+        """
+        if self._hub_labels is None:
+            raise ValueError(
+                "Hub labels have not been built. Call Bmssp.build_hub_labels first."
+            )
+        array_bytes = {
+            key: len(values) * values.itemsize
+            for key, values in self._hub_labels.items()
+        }
+        label_sizes = [
+            offsets[node_idx + 1] - offsets[node_idx]
+            for offsets in [
+                self._hub_labels["out_offsets"],
+                self._hub_labels["in_offsets"],
+            ]
+            for node_idx in range(len(offsets) - 1)
+        ]
+        num_entries = len(self._hub_labels["out_hubs"]) + len(
+            self._hub_labels["in_hubs"]
+        )
+        return {
+            "num_entries": num_entries,
+            "average_label_size": num_entries / max(1, len(label_sizes)),
+            "max_label_size": max(label_sizes, default=0),
+            "array_bytes": array_bytes,
+            "total_bytes": sum(array_bytes.values()),
+        }
+
+    def solve_pair(
+        self,
+        origin_id: int,
+        destination_id: int,
+    ) -> dict:
+        """
+        Function:
+
+        - Solve for the shortest path between a single origin and destination with a bidirectional search that meets in the middle.
+        - A forward search from the origin and a backward search from the destination are alternated until the standard meeting point criterion holds.
+            - Note: On large (eg: road) networks, this settles far fewer nodes than a one sided search that stops at the destination.
+        - If landmarks were built with `Bmssp.build_landmarks`, a goal directed (ALT) search that uses triangle inequality lower bounds from the landmarks is used instead.
+            - Note: This searches even fewer nodes on long distance queries and also returns the same `path` and `length` (including ties) as `Bmssp.solve`.
+        - If coordinates were set with `Bmssp.set_coordinates`, the same goal directed search is used with the coordinate distance as a lower bound as well.
+        - If a contraction hierarchy was built with `Bmssp.build_contraction_hierarchy`, a bidirectional search on the hierarchy is used instead.
+            - Note: This only settles the few nodes that are ranked higher than the origin or destination along their shortest paths.
+        - This returns the same `path` and `length` as `Bmssp.solve(origin_id, destination_id)`.
+            - Note: Both searches use the weights with the counter_value (as the forward solve does) such that only paths with the same length and number of edges can tie.
+            - Note: The backward search uses the transposed used graph, which is built and cached the first time it is needed.
+            - Note: If more than one shortest path exists (a tie), an early terminated forward solve is used to apply the same edge id tie-breakers as `Bmssp.solve`.
+            - Note: When `weight_mode="lexicographic"`, float sums depend on their order such that they can not be split between two searches.
+                    Here an early terminated forward solve is always used.
+
+        Required Arguments:
+
+        - `origin_id`
+            - Type: int
+            - What: The id of the origin node to start the shortest path from
+        - `destination_id`
+            - Type: int
+            - What: The id of the destination node to end the shortest path at
+
+        Optional Arguments:
+
+        - None
+
+        Returns:
+
+        - A dictionary with the following keys
+            - `origin_id`: The id of the origin node
+            - `destination_id`: The id of the destination node
+            - `path`: The shortest path [origin_id, ..., destination_id]
+            - `length`: The length of the shortest path
+        """
+        path, distances = self._solve_pair(
+            origin_id=origin_id, destination_id=destination_id
+        )
+        return {
+            "origin_id": origin_id,
+            "destination_id": destination_id,
+            "path": path,
+            "length": distances[-1],
+        }
+
+    def _solve_pair(self, origin_id: int, destination_id: int) -> tuple:
+        """
+        Function:
+
+        - Solve a single point to point query (see `Bmssp.solve_pair`).
+        - Return the shortest path and the distance from the origin to each node on it.
+        """
+        if not isinstance(origin_id, int) or not isinstance(
+            destination_id, int
+        ):
+            raise ValueError(
+                "Your provided origin_id and destination_id must both be integers"
+            )
+        self._input_check(origin_id=origin_id, destination_id=destination_id)
+        solver = None
+        if self.weight_mode != "lexicographic":
+            if self._contraction_hierarchy is not None:
+                solver = ContractionHierarchyCore(
+                    graph=self.csr_graph,
+                    hierarchy=self._contraction_hierarchy,
+                    origin_id=origin_id,
+                    destination_id=destination_id,
+                )
+            elif self._landmarks is not None or self._coordinates is not None:
+                solver = AStarCore(
+                    graph=self.csr_graph,
+                    reverse_graph=self._get_reverse_csr_graph(),
+                    origin_id=origin_id,
+                    destination_id=destination_id,
+                    heuristic=self._get_pair_heuristic(destination_id),
+                )
+            else:
+                solver = BidirectionalCore(
+                    graph=self.csr_graph,
+                    reverse_graph=self._get_reverse_csr_graph(),
+                    origin_id=origin_id,
+                    destination_id=destination_id,
+                )
+        if solver is None or solver.is_tie_unresolved:
+            output = self.solve(
+                origin_id=origin_id,
+                destination_id=destination_id,
+                early_termination=True,
+            )
+            return output["path"], [
+                output["distance_matrix"][node_idx]
+                for node_idx in output["path"]
+            ]
+        if solver.path_node_ids is None:
+            raise Exception(
+                "Something went wrong, the origin and destination nodes are not connected."
+            )
+        # Sum the path weights in order (as the forward solve does) and remove the counter values
+        weights = self.csr_graph["weights"]
+        distance = Decimal(0) if self.weight_mode == "decimal" else 0
+        node_distances = {origin_id: distance}
+        predecessor = {origin_id: -1}
+        for edge_idx, prev_node_idx, node_idx in zip(
+            solver.path_edge_positions,
+            solver.path_node_ids,
+            solver.path_node_ids[1:],
+        ):
+            distance += weights[edge_idx]
+            node_distances[node_idx] = distance
+            predecessor[node_idx] = prev_node_idx
+        path = self._reconstruct_path(destination_id, predecessor)
+        # Original nodes keep their ids in the constant degree graph and every path enters a node at its original id
+        convert_distance = self._get_distance_converter()
+        return path, [
+            convert_distance(node_distances[node_idx]) for node_idx in path
+        ]
+
+    def _solve_contraction_hierarchy(
+        self, origin_id: int, destination_id: int
+    ) -> dict:
+        """
+        Function:
+
+        - Solve a single point to point query with the contraction hierarchy engine (see `engine` in `Bmssp.solve`).
+        """
+        if not isinstance(origin_id, int) or not isinstance(
+            destination_id, int
+        ):
+            raise ValueError(
+                "Your provided origin_id and destination_id must both be integers when using the contraction_hierarchy engine"
+            )
+        self._get_contraction_hierarchy()
+        path, distances = self._solve_pair(
+            origin_id=origin_id, destination_id=destination_id
+        )
+        unreached_distance = (
+            float("inf") if self.weight_mode == "lexicographic" else inf
+        )
+        return {
+            "origin_id": origin_id,
+            "destination_id": destination_id,
+            "predecessor": SparseArray(
+                zip(path, [-1] + path[:-1]),
+                default=-1,
+                size=self.original_graph_len,
+            ),
+            "distance_matrix": SparseArray(
+                zip(path, distances),
+                default=unreached_distance,
+                size=self.original_graph_len,
+            ),
+            "path": path,
+            "length": distances[-1],
+        }
+
+    def _get_contraction_hierarchy(self) -> dict | None:
+        """
+        Function:
+
+        - Return the contraction hierarchy of the used graph (built with the default settings the first time it is needed).
+        - Returns None when `weight_mode="lexicographic"` since point to point solves then always use an early terminated forward solve.
+        """
+        if (
+            self._contraction_hierarchy is None
+            and self.weight_mode != "lexicographic"
+        ):
+            self.build_contraction_hierarchy()
+        return self._contraction_hierarchy
+
+    def solve_nearest(
+        self,
+        origin_id: int | set[int] | dict[int, int | float],
+        target_ids,
+        k: int,
+        data_structure=ListBmsspDataStructure,
+        pivot_relaxation_steps: int | None = None,
+        target_tree_depth: int | None = None,
+        return_paths: bool = True,
+    ) -> list[dict]:
+        """
+        Function:
+
+        - Find the k targets that are closest to the origin.
+        - The solve stops as soon as the distances to k of the targets are final such that the work done scales
+          with the number of nodes closer to the origin than the kth closest target instead of the size of the graph.
+
+        Required Arguments:
+
+        - `origin_id`
+            - Type: int | set of int | dict of int: int | float
+            - What: The id of the origin node (or a set of origin node ids) to start from
+            - Note: See `origin_id` in `Bmssp.solve` for using a dictionary of origin id: offset pairs
+        - `target_ids`
+            - Type: iterable of int
+            - What: The ids of the candidate target nodes
+        - `k`
+            - Type: int
+            - What: The number of closest targets to return
+
+        Optional Arguments:
+
+        - `data_structure`, `pivot_relaxation_steps` and `target_tree_depth`:
+            - See `Bmssp.solve`
+        - `return_paths`
+            - Type: bool
+            - Default: True
+            - What: Whether to reconstruct the path from the origin to each returned target
+
+        Returns:
+
+        - A list of up to k dictionaries in order of increasing distance with the following keys
+            - `destination_id`: The id of the target node
+            - `length`: The length of the shortest path from the origin to the target
+            - `path`: The shortest path from the origin to the target (or None if `return_paths` is False)
+            - Note: Fewer than k dictionaries are returned if fewer than k targets are reachable from the origin.
+        """
+        self._input_check(origin_id=origin_id, destination_id=None)
+        target_ids = self._target_ids_check(target_ids)
+        if not isinstance(k, int) or k < 1:
+            raise ValueError(f"Your provided k ({k}) must be a positive int")
+
+        workspace = self._get_workspace()
+        try:
+            solver = self._get_core()(
+                graph=self.csr_graph,
+                origin_ids=self._get_origin_ids(origin_id),
+                counter_value=self.counter_value,
+                data_structure=data_structure,
+                pivot_relaxation_steps=pivot_relaxation_steps,
+                target_tree_depth=target_tree_depth,
+                workspace=workspace,
+                target_ids=target_ids,
+                target_count=k,
+            )
+            # Unique path lengths (keys) break any ties in distance
+            key_matrix = solver.counter_and_edge_distance_matrix
+            if solver.is_destination_complete:
+                # Targets in a temporary frontier (W) can be complete before they are returned in a completed set (U)
+                # so include every target that is no further than the furthest completed target
+                key_bound = max(
+                    key_matrix[target_id]
+                    for target_id in solver.completed_target_ids
+                )
+                reached_ids = [
+                    target_id
+                    for target_id in target_ids
+                    if key_matrix[target_id] <= key_bound
+                ]
+            else:
+                # The whole graph was solved so every reached target is complete
+                reached_ids = [
+                    target_id
+                    for target_id in target_ids
+                    if solver.counter_distance_matrix[target_id] != float("inf")
+                ]
+            nearest_ids = sorted(reached_ids, key=key_matrix.__getitem__)[:k]
+            convert_distance = self._get_distance_converter()
+            return [
+                {
+                    "destination_id": target_id,
+                    "length": (
+                        convert_distance(
+                            solver.counter_distance_matrix[target_id]
+                        )
+                        if convert_distance
+                        else solver.counter_distance_matrix[target_id]
+                    ),
+                    "path": (
+                        self._reconstruct_path(
+                            destination_id=target_id,
+                            predecessor=solver.predecessor,
+                        )
+                        if return_paths
+                        else None
+                    ),
+                }
+                for target_id in nearest_ids
+            ]
+        finally:
+            self._workspaces.append(workspace)
+
+    def distance_table(
+        self,
+        origin_ids,
+        destination_ids,
+        data_structure=ListBmsspDataStructure,
+        pivot_relaxation_steps: int | None = None,
+        target_tree_depth: int | None = None,
+        processes: int = 1,
+        chunk_size: int = 1,
+    ) -> list[array]:
+        """
+        Function:
+
+        - Compute the shortest path length from every origin to every destination.
+        - Each unique origin is solved once (sharing one solver workspace) and each solve stops as soon as
+          the distances to all destinations are final.
+        - Only the destination distances are converted such that no full graph distance lists are built.
+
+        Required Arguments:
+
+        - `origin_ids`
+            - Type: iterable of int
+            - What: The origin id for each row of the table
+        - `destination_ids`
+            - Type: iterable of int
+            - What: The destination id for each column of the table
+
+        Optional Arguments:
+
+        - `data_structure`, `pivot_relaxation_steps` and `target_tree_depth`:
+            - See `Bmssp.solve`
+        - `processes` and `chunk_size`:
+            - See `Bmssp.solve_many`
+            - Note: Each chunk is a number of unique origins (rows)
+
+        Returns:
+
+        - A list with one row for each origin where each row is a float array (array("d")) with one distance for each destination
+            - Note: Destinations that can not be reached from an origin have an inf distance
+            - Note: Rows for repeated origins are copies of the same solved row
+        """
+        origin_ids = list(origin_ids)
+        for origin_id in origin_ids:
+            self._input_check(origin_id=origin_id, destination_id=None)
+        destination_ids = list(destination_ids)
+        self._target_ids_check(destination_ids)
+        # Solve each unique origin once
+        unique_origin_ids = list(dict.fromkeys(origin_ids))
+        solve_kwargs = {
+            "destination_ids": destination_ids,
+            "data_structure": data_structure,
+            "pivot_relaxation_steps": pivot_relaxation_steps,
+            "target_tree_depth": target_tree_depth,
+        }
+        if processes > 1:
+            unique_rows = list(
+                self._map_in_processes(
+                    worker=_distance_table_worker_row,
+                    queries=unique_origin_ids,
+                    worker_kwargs=solve_kwargs,
+                    processes=processes,
+                    chunk_size=chunk_size,
+                    ordered=True,
+                )
+            )
+        else:
+            workspace = self._get_workspace()
+            try:
+                unique_rows = [
+                    self._solve_distance_table_row(
+                        workspace=workspace, origin_id=origin_id, **solve_kwargs
+                    )
+                    for origin_id in unique_origin_ids
+                ]
+            finally:
+                self._workspaces.append(workspace)
+        rows = dict(zip(unique_origin_ids, unique_rows))
+        output = []
+        used_origin_ids = set()
+        for origin_id in origin_ids:
+            # Copy rows for repeated origins such that each row can be modified independently
+            if origin_id in used_origin_ids:
+                output.append(array("d", rows[origin_id]))
+            else:
+                output.append(rows[origin_id])
+                used_origin_ids.add(origin_id)
+        return output
+
+    def all_pairs(
+        self,
+        path: str | None = None,
+        quantize: bool = False,
+        data_structure=ListBmsspDataStructure,
+        pivot_relaxation_steps: int | None = None,
+        target_tree_depth: int | None = None,
+        processes: int = 1,
+        chunk_size: int = 1,
+    ) -> AllPairs:
+        """
+        Function:
+
+        - Solve every node as an origin and store the distance and predecessor of every (origin, destination) pair in an all pairs distance oracle.
+        - Distances are then looked up in O(1) with `AllPairs.distance` and paths are walked back from the stored predecessors in O(path length) with `AllPairs.path`.
+            - Note: This stores two graph_len x graph_len matrices (8 bytes per pair or 6 if quantized) so it is meant for small graphs (eg: up to about 10k nodes).
+            - Note: Each row is converted to compact arrays as soon as it is solved such that full distance lists are never held for more than one origin at a time.
+
+        Required Arguments:
+
+        - None
+
+        Optional Arguments:
+
+        - `path`
+            - Type: str | None
+            - Default: None
+            - What: A file path to save the oracle to
+            - Note: If provided, each row is written to the file as soon as it is solved (see `AllPairs.write_rows`) and the file is then memory mapped and returned (see `AllPairs.load`) such that the matrices are never held in memory.
+            - Note: If None, both matrices are built in memory.
+        - `quantize`
+            - Type: bool
+            - Default: False
+            - What: Whether to store distances as uint16 multiples of the largest distance / 65534 instead of float32
+            - Note: Quantized distances are within half of `distance_step` of the shortest distance.
+        - `data_structure`, `pivot_relaxation_steps` and `target_tree_depth`:
+            - See `Bmssp.solve`
+        - `processes` and `chunk_size`:
+            - See `Bmssp.solve_many`
+            - Note: Each chunk is a number of origins (rows)
+
+        Returns:
+
+        - An AllPairs object
+        """
+        origin_ids = range(self.original_graph_len)
+        solve_kwargs = {
+            "data_structure": data_structure,
+            "pivot_relaxation_steps": pivot_relaxation_steps,
+            "target_tree_depth": target_tree_depth,
+        }
+        if processes > 1:
+            rows = self._map_in_processes(
+                worker=_all_pairs_worker_row,
+                queries=origin_ids,
+                worker_kwargs=solve_kwargs,
+                processes=processes,
+                chunk_size=chunk_size,
+                ordered=True,
+            )
+            workspace = None
+        else:
+            workspace = self._get_workspace()
+            rows = (
+                self._solve_all_pairs_row(
+                    workspace=workspace,
+                    origin_id=origin_id,
+                    **solve_kwargs,
+                )
+                for origin_id in origin_ids
+            )
+        try:
+            if path is None:
+                return AllPairs.from_rows(rows=rows, quantize=quantize)
+            AllPairs.write_rows(
+                path=path,
+                rows=rows,
+                graph_len=self.original_graph_len,
+                quantize=quantize,
+            )
+        finally:
+            if workspace is not None:
+                self._workspaces.append(workspace)
+        return AllPairs.load(path)
+
+    def _solve_all_pairs_row(
+        self,
+        workspace: BmsspWorkspace,
+        origin_id: int,
+        data_structure,
+        pivot_relaxation_steps: int | None,
+        target_tree_depth: int | None,
+    ) -> tuple[array, array]:
+        """
+        Function:
+
+        - Solve a single origin and return its distances (float32) and predecessors as compact arrays.
+        - See `Bmssp.all_pairs` for the arguments.
+        """
+        output = self._solve(
+            workspace=workspace,
+            origin_id=origin_id,
+            destination_id=None,
+            data_structure=data_structure,
+            pivot_relaxation_steps=pivot_relaxation_steps,
+            target_tree_depth=target_tree_depth,
+            early_termination=False,
+        )
+        return (
+            array("f", output["distance_matrix"]),
+            array(
+                "i" if self.original_graph_len < 2**31 else "q",
+                output["predecessor"],
+            ),
+        )
+
+    def _solve_distance_table_row(
+        self,
+        workspace: BmsspWorkspace,
+        origin_id: int,
+        destination_ids: list[int],
+        data_structure,
+        pivot_relaxation_steps: int | None,
+        target_tree_depth: int | None,
+    ) -> array:
+        """
+        Function:
+
+        - Solve a single origin until all destinations are complete and return the destination distances as a float array.
+        - See `Bmssp.distance_table` for the arguments.
+        """
+        target_ids = set(destination_ids)
+        solver = self._get_core()(
+            graph=self.csr_graph,
+            origin_ids=self._get_origin_ids(origin_id),
+            counter_value=self.counter_value,
+            data_structure=data_structure,
+            pivot_relaxation_steps=pivot_relaxation_steps,
+            target_tree_depth=target_tree_depth,
+            workspace=workspace,
+            target_ids=target_ids,
+            target_count=len(target_ids),
+        )
+        distance_matrix = solver.counter_distance_matrix
+        convert_distance = self._get_distance_converter()
+        if convert_distance is None:
+            return array("d", [distance_matrix[idx] for idx in destination_ids])
+        row = array("d", bytes(8 * len(destination_ids)))
+        for column_idx, destination_id in enumerate(destination_ids):
+            distance = distance_matrix[destination_id]
+            row[column_idx] = (
+                convert_distance(distance) if distance != inf else float("inf")
+            )
+        return row
+
+    def _get_workspace(self) -> BmsspWorkspace:
+        """
+        Function:
+
+        - Return a solver workspace from a previous solve (if one is not in use by another solve) or create a new one.
+        - The caller must return the workspace to `self._workspaces` once it is no longer used.
+        """
+        try:
+            return self._workspaces.pop()
+        except IndexError:
+            return BmsspWorkspace(len(self.csr_graph["indptr"]) - 1)
+
+    def _input_check(
+        self,
+        origin_id: int | set[int] | dict[int, int | float],
+        destination_id: int | None,
+    ) -> None:
+        """
+        Function:
+
+        - Validate the origin and destination ids of a query.
+        - Uses the original graph length and not the used graph length to ensure validity.
+        """
+        if isinstance(origin_id, dict):
+            if len(origin_id) < 1:
+                raise ValueError(
+                    "Your provided origin_id dictionary must have at least 1 node"
+                )
+            for origin_idx, offset in origin_id.items():
+                if not isinstance(origin_idx, int) or not (
+                    0 <= origin_idx < self.original_graph_len
+                ):
+                    raise ValueError(
+                        f"Origin node ({origin_idx}) is not in the graph"
+                    )
+                if not 0 <= offset < float("inf"):
+                    raise ValueError(
+                        f"Your provided offset ({offset}) for origin node ({origin_idx}) must be nonnegative and finite"
+                    )
+            origin_id_check = next(iter(origin_id))
+        elif isinstance(origin_id, set):
+            if len(origin_id) < 1:
+                raise ValueError(
+                    "Your provided origin_id set must have at least 1 node"
+                )
+            origin_id_check = next(iter(origin_id))
+        else:
+            origin_id_check = origin_id
+        input_check(
+            graph=range(self.original_graph_len),
+            origin_id=origin_id_check,
+            destination_id=destination_id,
+        )
+
+    def _get_origin_ids(
+        self, origin_id: int | set[int] | dict[int, int | float]
+    ) -> int | set[int] | dict:
+        """
+        Function:
+
+        - Return the origin ids to pass to the BMSSP core.
+        - Offsets in an origin id: offset dictionary are rounded (the same way as the edge weights) and converted to the number type used while solving.
+        """
+        if not isinstance(origin_id, dict):
+            return origin_id
+        if self.weight_mode == "lexicographic":
+            return {
+                origin_idx: float(offset)
+                for origin_idx, offset in origin_id.items()
+            }
+        offsets = {
+            origin_idx: round(Decimal(offset), self.precision)
+            for origin_idx, offset in origin_id.items()
+        }
+        if self.weight_mode == "integer":
+            return {
+                origin_idx: int(offset.scaleb(self.precision))
+                * self.weight_scale
+                for origin_idx, offset in offsets.items()
+            }
+        return offsets
+
+    def _get_reverse_csr_graph(self) -> dict:
+        """
+        Function:
+
+        - Return the transposed used graph for backward searches (built once and then cached).
+        - Each reversed edge stores its position in `csr_graph` as `edge_positions` such that both search directions use the same weights.
+        """
+        if self._reverse_csr_graph is None:
+            reverse_csr_graph = transpose_csr(
+                {
+                    "indptr": self.csr_graph["indptr"],
+                    "indices": self.csr_graph["indices"],
+                    "weights": array(
+                        "q", range(len(self.csr_graph["indices"]))
+                    ),
+                }
+            )
+            reverse_csr_graph["edge_positions"] = reverse_csr_graph.pop(
+                "weights"
+            )
+            self._reverse_csr_graph = reverse_csr_graph
+        return self._reverse_csr_graph
+
+    def _get_hub_order(self, num_samples: int) -> list[int]:
+        """
+        Function:
+
+        - Return every node id in order of decreasing importance for hub labeling (see `Bmssp.build_hub_labels`).
+        - The importance of a node is the total number of nodes below it in the shortest path trees of BMSSP solves from evenly spaced origins.
+        - Ties (eg: nodes that are leaves in every tree) are broken by the total in and out degree and then by node id.
+        """
+        graph_len = self.original_graph_len
+        importance = [0] * graph_len
+        origin_ids = list(
+            range(0, graph_len, max(1, ceil(graph_len / num_samples)))
+        )
+        for output in self.solve_many(origin_ids):
+            predecessor = output["predecessor"]
+            children = [[] for _ in range(graph_len)]
+            for node_idx, predecessor_idx in enumerate(predecessor):
+                if predecessor_idx != -1:
+                    children[predecessor_idx].append(node_idx)
+            # Walk the tree in breadth first order such that children are counted before their parents when reversed
+            tree_order = [output["origin_id"]]
+            for node_idx in tree_order:
+                tree_order.extend(children[node_idx])
+            subtree_sizes = [1] * graph_len
+            for node_idx in reversed(tree_order):
+                importance[node_idx] += subtree_sizes[node_idx]
+                if predecessor[node_idx] != -1:
+                    subtree_sizes[predecessor[node_idx]] += subtree_sizes[
+                        node_idx
+                    ]
+        input_csr_graph = self.input_csr_graph
+        indptr = input_csr_graph["indptr"]
+        degree = [
+            indptr[node_idx + 1] - indptr[node_idx]
+            for node_idx in range(graph_len)
+        ]
+        for node_idx in input_csr_graph["indices"]:
+            degree[node_idx] += 1
+        return sorted(
+            range(graph_len),
+            key=lambda node_idx: (-importance[node_idx], -degree[node_idx]),
+        )
+
+    def _get_pair_heuristic(self, destination_id: int):
+        """
+        Function:
+
+        - Return a function that gives a lower bound (in solver units) on the distance from a node in the used graph to destination_id.
+        - Uses the largest bound from the landmarks (see `Bmssp.build_landmarks`) and the coordinates (see `Bmssp.set_coordinates`) that are available.
+        - The function returns None if the node can not reach the destination.
+        """
+        if self._coordinates is None:
+            return self._get_landmark_heuristic(destination_id)
+        coordinate_heuristic = self._get_coordinate_heuristic(destination_id)
+        if self._landmarks is None:
+            return coordinate_heuristic
+        landmark_heuristic = self._get_landmark_heuristic(destination_id)
+
+        def heuristic(node_idx: int):
+            landmark_bound = landmark_heuristic(node_idx)
+            if landmark_bound is None:
+                return None
+            return max(landmark_bound, coordinate_heuristic(node_idx))
+
+        return heuristic
+
+    def _get_coordinate_heuristic(self, destination_id: int):
+        """
+        Function:
+
+        - Return a function that gives a lower bound (in solver units) on the distance from a node in the used graph to destination_id using the node coordinates.
+        """
+        x_values = self._coordinates["x"]
+        y_values = self._coordinates["y"]
+        # Reduce each bound by a small relative margin to cover float rounding in the metric
+        scale = self._coordinates["scale"] * (1 - 2**-40)
+        get_distance = (
+            haversine_distance
+            if self._coordinates["metric"] == "haversine"
+            else euclidean_distance
+        )
+        destination_x = x_values[destination_id]
+        destination_y = y_values[destination_id]
+        idx_map = (
+            self.constant_degree_dict["idx_map"]
+            if self.use_constant_degree_graph
+            else None
+        )
+        convert_lower_bound = self._get_lower_bound_converter()
+
+        def heuristic(node_idx: int):
+            # Partition nodes use the coordinates of their original node
+            if idx_map is not None:
+                node_idx = idx_map[node_idx]
+            return convert_lower_bound(
+                get_distance(
+                    x_values[node_idx],
+                    y_values[node_idx],
+                    destination_x,
+                    destination_y,
+                )
+                * scale
+            )
+
+        return heuristic
+
+    def _get_landmark_heuristic(self, destination_id: int):
+        """
+        Function:
+
+        - Return a function that gives a lower bound (in solver units) on the distance from a node in the used graph to destination_id using the landmark distance tables.
+        - For each landmark L, the triangle inequality gives:
+            - distance(node, destination) >= distance(L, destination) - distance(L, node)
+            - distance(node, destination) >= distance(node, L) - distance(destination, L)
+        - The function returns None if a landmark shows that the node can not reach the destination.
+        """
+        graph_len = self.original_graph_len
+        forward = self._landmarks["forward"]
+        reverse = self._landmarks["reverse"]
+        num_landmarks = len(self._landmarks["ids"])
+        # The forward and reverse table offset for each landmark and its distances from and to the destination
+        landmark_rows = [
+            (
+                landmark_idx * graph_len,
+                forward[landmark_idx * graph_len + destination_id],
+                reverse[landmark_idx * graph_len + destination_id],
+            )
+            for landmark_idx in range(num_landmarks)
+        ]
+        idx_map = (
+            self.constant_degree_dict["idx_map"]
+            if self.use_constant_degree_graph
+            else None
+        )
+        convert_lower_bound = self._get_lower_bound_converter()
+        # The float32 tables have a relative error of at most 2**-24 so each bound is reduced by a slightly larger margin
+        margin = 2**-22
+        unreachable = float("inf")
+
+        def heuristic(node_idx: int):
+            # Partition nodes can reach their original node (and all of its edges) at zero weight
+            if idx_map is not None:
+                node_idx = idx_map[node_idx]
+            lower_bound = 0.0
+            for (
+                offset,
+                destination_forward,
+                destination_reverse,
+            ) in landmark_rows:
+                node_forward = forward[offset + node_idx]
+                node_reverse = reverse[offset + node_idx]
+                if node_forward != unreachable:
+                    if destination_forward == unreachable:
+                        # The landmark reaches the node but not the destination
+                        return None
+                    lower_bound = max(
+                        lower_bound,
+                        destination_forward
+                        - node_forward
+                        - (destination_forward + node_forward) * margin,
+                    )
+                if destination_reverse != unreachable:
+                    if node_reverse == unreachable:
+                        # The destination reaches the landmark but the node does not
+                        return None
+                    lower_bound = max(
+                        lower_bound,
+                        node_reverse
+                        - destination_reverse
+                        - (node_reverse + destination_reverse) * margin,
+                    )
+            return convert_lower_bound(lower_bound)
+
+        return heuristic
+
+    def _check_engine(self, engine: str) -> str:
+        """
+        Function:
+
+        - Validate the engine of a query and return it.
+        """
+        if engine not in ("bmssp", "contraction_hierarchy"):
+            raise ValueError(
+                f"Your provided engine ({engine}) must be one of: bmssp, contraction_hierarchy"
+            )
+        return engine
+
+    def _check_direction(self, direction: str) -> str:
+        """
+        Function:
+
+        - Validate the direction of a query and return it.
+        """
+        if direction not in ("forward", "reverse"):
+            raise ValueError(
+                f"Your provided direction ({direction}) must be one of: forward, reverse"
+            )
+        return direction
+
+    def _target_ids_check(self, target_ids) -> set[int]:
+        """
+        Function:
+
+        - Validate a collection of target (or destination) ids and return them as a set.
+        """
+        target_ids = set(target_ids)
+        for target_id in target_ids:
+            if not isinstance(target_id, int) or not (
+                0 <= target_id < self.original_graph_len
+            ):
+                raise ValueError(
+                    f"Target node ({target_id}) is not in the graph"
+                )
+        return target_ids
+
+    def _get_core(self) -> type[BmsspCore]:
+        """
+        Function:
+
+        - Return the BMSSP core class used for this weight mode.
+        """
+        if self.weight_mode == "lexicographic":
+            return LexicographicBmsspCore
+        return BmsspCore
+
+    def _get_distance_converter(self):
+        """
+        Function:
+
+        - Return a function that removes the unique path length adjustments from a solver distance and returns it as a float.
+        - Returns None if solver distances are already native floats (lexicographic mode).
+        """
+        if self.weight_mode == "integer":
+            # The counter and edge id adjustments are always below the weight scale
+            # so floor division drops them exactly
+            weight_scale = self.weight_scale
+            precision_scale = 10**self.precision
+            return lambda i: (i // weight_scale) / precision_scale
+        elif self.weight_mode == "lexicographic":
+            # Distances are already native floats without any tie-breakers
+            return None
+        precision = self.precision
+        return lambda i: float(round(i, precision))
+
+    def _get_lower_bound_converter(self):
+        """
+        Function:
+
+        - Return a function that converts a (float) lower bound on a distance into a lower bound in solver units.
+        - The bound is rounded down to the weight precision such that it is exact in solver units and never more than the solver distance.
+        - Returns None if solver distances are already native floats (lexicographic mode).
+        """
+        precision = self.precision
+        precision_scale = 10**precision
+        if self.weight_mode == "integer":
+            weight_scale = self.weight_scale
+            return lambda i: floor(i * precision_scale) * weight_scale
+        elif self.weight_mode == "lexicographic":
+            return None
+        return lambda i: Decimal(floor(i * precision_scale)).scaleb(-precision)
+
+    def _reconstruct_path(
+        self, destination_id: int, predecessor: list[int]
+    ) -> list[int]:
+        """
+        Function:
+
+        - Reconstruct the path to destination_id from a solver predecessor list for the used graph.
+        - Partition nodes from the constant degree conversion are mapped back to their original node ids.
+        """
+        if not self.use_constant_degree_graph:
+            return reconstruct_path(
+                destination_id=destination_id, predecessor=predecessor
+            )
+        idx_map = self.constant_degree_dict["idx_map"]
+        output_path = [destination_id]
+        node_idx = predecessor[destination_id]
+        while node_idx != -1:
+            # Every path enters a node at its original id and then walks its partitions in order
+            if idx_map[node_idx] != output_path[-1]:
+                output_path.append(idx_map[node_idx])
+            node_idx = predecessor[node_idx]
+        output_path.reverse()
+        return output_path
+
+    def _solve_cached(
+        self,
+        origin_id: int | set[int] | dict[int, int | float],
+        destination_id: int | None,
+        data_structure,
+        pivot_relaxation_steps: int | None,
+        target_tree_depth: int | None,
+    ) -> dict:
+        """
+        Function:
+
+        - Solve a single query from the solve cache (see `Bmssp.set_solve_cache`) or run and cache the full solve of its origin.
+        - See `Bmssp.solve` for the arguments and returns.
+        """
+        self._input_check(origin_id=origin_id, destination_id=destination_id)
+        solve_cache = self._solve_cache
+        cache = solve_cache["cache"]
+        with solve_cache["lock"]:
+            if solve_cache["graph_version"] != self._graph_version:
+                # The graph was changed so every cached result is stale
+                self._clear_solve_cache(solve_cache)
+                solve_cache["graph_version"] = self._graph_version
+            # Only cache the result if the cache is not cleared (or the graph changed) before it is stored
+            generation = solve_cache["generation"]
+        cache_key = self._get_origin_key(origin_id)
+
+        def solve_origin() -> tuple:
+            workspace = self._get_workspace()
+            try:
+                output = self._solve(
+                    workspace=workspace,
+                    origin_id=origin_id,
+                    destination_id=None,
+                    data_structure=data_structure,
+                    pivot_relaxation_steps=pivot_relaxation_steps,
+                    target_tree_depth=target_tree_depth,
+                    early_termination=False,
+                )
+            finally:
+                self._workspaces.append(workspace)
+            cached = (
+                array(
+                    "i" if self.original_graph_len < 2**31 else "q",
+                    output["predecessor"],
+                ),
+                array("d", output["distance_matrix"]),
+            )
+            with solve_cache["lock"]:
+                if (
+                    generation == solve_cache["generation"]
+                    and solve_cache["graph_version"] == self._graph_version
+                ):
+                    cache.put(
+                        cache_key,
+                        cached,
+                        num_bytes=sum(
+                            len(values) * values.itemsize for values in cached
+                        ),
+                    )
+            return output, cached
+
+        output = None
+        cached = cache.get(cache_key)
+        if cached is None:
+            # Concurrent misses for the same origin wait for a single solve
+            (output, cached), is_shared = self._single_flight.run(
+                ("cache", cache_key), solve_origin
+            )
+            if is_shared:
+                # The output lists are shared so each call builds its own from the cached arrays
+                output = None
+        if output is not None:
+            predecessor = output["predecessor"]
+            distance_matrix = output["distance_matrix"]
+        else:
+            predecessor = cached[0].tolist()
+            distance_matrix = cached[1].tolist()
+            if self.weight_mode != "lexicographic":
+                # Unreached nodes have a Decimal inf distance (as in an uncached solve)
+                float_inf = float("inf")
+                distance_matrix = [
+                    inf if distance == float_inf else distance
+                    for distance in distance_matrix
+                ]
+        if destination_id is not None:
+            if distance_matrix[destination_id] == inf:
+                raise Exception(
+                    "Something went wrong, the origin and destination nodes are not connected."
+                )
+            path = reconstruct_path(
+                destination_id=destination_id, predecessor=cached[0]
+            )
+            length = distance_matrix[destination_id]
+        else:
+            path = None
+            length = None
+        return {
+            "origin_id": (
+                origin_id
+                if isinstance(origin_id, (int, dict))
+                else list(origin_id)
+            ),
+            "destination_id": destination_id,
+            "predecessor": predecessor,
+            "distance_matrix": distance_matrix,
+            "path": path,
+            "length": length,
+        }
+
+    def _get_used_edge_position(
+        self, node_idx: int, edge_offset: int
+    ) -> int | None:
+        """
+        Function:
+
+        - Return the position in `csr_graph` of the edge at edge_offset in the edges of node_idx in `input_csr_graph`.
+        - Returns None if the edge was replaced by a zero weight partition edge in the constant degree graph (a self loop from the last partition).
+        """
+        if not self.use_constant_degree_graph:
+            return self.csr_graph["indptr"][node_idx] + edge_offset
+        # See csr_to_constant_out_degree for the partition layout (with out_degree=2 each partition holds one input edge)
+        input_indptr = self.input_csr_graph["indptr"]
+        degree = input_indptr[node_idx + 1] - input_indptr[node_idx]
+        if degree <= 2:
+            return self.csr_graph["indptr"][node_idx] + edge_offset
+        if edge_offset == 0:
+            partition_idx = node_idx
+        else:
+            # Partition nodes are appended in order of their original node after all original nodes
+            idx_map = self.constant_degree_dict["idx_map"]
+            partition_idx = (
+                bisect_left(
+                    idx_map,
+                    node_idx,
+                    lo=self.original_graph_len,
+                )
+                + edge_offset
+                - 1
+            )
+        if (
+            edge_offset == degree - 1
+            and self.input_csr_graph["indices"][
+                input_indptr[node_idx] + edge_offset
+            ]
+            == node_idx
+        ):
+            return None
+        return self.csr_graph["indptr"][partition_idx]
+
+    def _clear_solve_cache(self, solve_cache: dict) -> None:
+        """
+        Function:
+
+        - Remove every cached solve result and stop sharing running solves with later solves.
+        - The caller must hold `solve_cache["lock"]`.
+        """
+        solve_cache["generation"] += 1
+        solve_cache["cache"].clear()
+        # Solves that start after a clear do not wait for solves that started before it
+        self._single_flight.forget()
+
+    def _get_origin_key(
+        self, origin_id: int | set[int] | dict[int, int | float]
+    ):
+        """
+        Function:
+
+        - Return a hashable key for an origin id, set of origin ids or dictionary of origin id: offset pairs.
+        """
+        if isinstance(origin_id, dict):
+            return frozenset(origin_id.items())
+        if isinstance(origin_id, set):
+            return frozenset(origin_id)
+        return origin_id
+
+    def _copy_solve_output(
+        self, output: dict, origin_id: int | set[int] | dict[int, int | float]
+    ) -> dict:
+        """
+        Function:
+
+        - Return a copy of a solve output that is shared with other calls such that each call can change its own output.
+        """
+        copied_output = dict(output)
+        copied_output["origin_id"] = (
+            origin_id if isinstance(origin_id, (int, dict)) else list(origin_id)
+        )
+        for key in ["predecessor", "distance_matrix", "path", "source_label"]:
+            values = output.get(key)
+            if isinstance(values, SparseArray):
+                copied_output[key] = SparseArray(
+                    values, default=values.default, size=values.size
+                )
+            elif isinstance(values, (list, array)):
+                copied_output[key] = values[:]
+        return copied_output
+
+    def _set_solve_destination(
+        self,
+        output: dict,
+        destination_id: int,
+        max_distance: int | float | None,
+    ) -> None:
+        """
+        Function:
+
+        - Set the `destination_id`, `path` and `length` of a full solve output (as `Bmssp._solve` would if given the destination).
+        """
+        distance_matrix = output["distance_matrix"]
+        if max_distance is None and distance_matrix[destination_id] == inf:
+            raise Exception(
+                "Something went wrong, the origin and destination nodes are not connected."
+            )
+        output["destination_id"] = destination_id
+        if (
+            isinstance(distance_matrix, SparseArray)
+            and destination_id not in distance_matrix
+        ):
+            # The destination is not within max_distance
+            output["path"] = None
+            output["length"] = float("inf")
+        else:
+            output["path"] = reconstruct_path(
+                destination_id=destination_id,
+                predecessor=output["predecessor"],
+            )
+            output["length"] = distance_matrix[destination_id]
+
+    def _mark_graph_changed(self) -> None:
+        """
+        Function:
+
+        - Remove every cached structure that depends on the edge weights after the graph is changed.
+        """
+        self._graph_version += 1
+        # Solves that start after a change do not wait for solves on the previous graph
+        self._single_flight.forget()
+        self._graph = None
+        self._reverse = None
+        self._landmarks = None
+        self._contraction_hierarchy = None
+        self._hub_labels = None
+
+    def _get_upper_bound(
+        self, max_distance: int | float | None
+    ) -> int | float | Decimal:
+        """
+        Function:
+
+        - Convert a `max_distance` (inclusive) into an exclusive upper bound on the distances used while solving.
+        - Distances are multiples of 10**-precision (except in lexicographic mode)
+          so the bound is the next representable distance above the rounded `max_distance`.
+        """
+        if max_distance is None or max_distance == float("inf"):
+            return inf
+        if max_distance < 0:
+            raise ValueError(
+                f"Your provided max_distance ({max_distance}) must be nonnegative"
+            )
+        if self.weight_mode == "lexicographic":
+            return nextafter(float(max_distance), float("inf"))
+        # Round the same way as the edge weights
+        max_distance = round(Decimal(max_distance), self.precision)
+        if self.weight_mode == "integer":
+            return (
+                int(max_distance.scaleb(self.precision)) + 1
+            ) * self.weight_scale
+        return max_distance + Decimal(10) ** -self.precision
+
+    def _solve(
+        self,
+        workspace: BmsspWorkspace,
+        origin_id: int | set[int] | dict[int, int | float],
+        destination_id: int | None,
+        data_structure,
+        pivot_relaxation_steps: int | None,
+        target_tree_depth: int | None,
+        early_termination: bool,
+        max_distance: int | float | None = None,
+        sparse: bool = False,
+        source_label: bool = False,
+    ) -> dict:
+        """
+        Function:
+
+        - Solve a single query using the given solver workspace.
+        - See `Bmssp.solve` for the arguments and returns.
+        """
+        self._input_check(origin_id=origin_id, destination_id=destination_id)
+        upper_bound = self._get_upper_bound(max_distance)
+
+        # Run the BMSSP Algorithm to relax as many edges as possible.
+        solver = self._get_core()(
+            graph=self.csr_graph,
+            origin_ids=self._get_origin_ids(origin_id),
+            counter_value=self.counter_value,
+            data_structure=data_structure,
+            pivot_relaxation_steps=pivot_relaxation_steps,
+            target_tree_depth=target_tree_depth,
+            workspace=workspace,
+            destination_id=destination_id if early_termination else None,
+            upper_bound=upper_bound,
+            track_source_labels=source_label,
+        )
+        if destination_id is not None and max_distance is None:
+            if solver.counter_distance_matrix[destination_id] == float("inf"):
+                raise Exception(
+                    "Something went wrong, the origin and destination nodes are not connected."
+                )
+
+        # When the solve only touched a small part of the graph, only convert the touched nodes
+        node_ids = None
+        key_matrix = solver.counter_and_edge_distance_matrix
+        if max_distance is not None:
+            # Only return the (original) nodes that are complete within the bound
+            key_bound = solver.upper_bound
+            node_ids = [
+                node_idx
+                for node_idx in dict.fromkeys(solver.touched_nodes)
+                if node_idx < self.original_graph_len
+                and key_matrix[node_idx] < key_bound
+            ]
+        elif sparse or solver.is_destination_complete:
+            node_ids = [
+                node_idx
+                for node_idx in dict.fromkeys(solver.touched_nodes)
+                if node_idx < self.original_graph_len
+            ]
+        elif len(solver.touched_nodes) < self.original_graph_len // 4:
+            node_ids = {
+                node_idx
+                for node_idx in solver.touched_nodes
+                if node_idx < self.original_graph_len
+            }
+        if solver.is_destination_complete:
+            # Nodes past the destination may not be complete when the solve stopped early
+            # They are returned as unreached (inf / -1) instead of with a tentative distance
+            destination_key = key_matrix[destination_id]
+            node_ids = [
+                node_idx
+                for node_idx in node_ids
+                if key_matrix[node_idx] <= destination_key
+            ]
+        sparse = sparse or max_distance is not None
+
+        if self.use_constant_degree_graph:
+            converted_outputs = convert_from_constant_degree(
+                distance_matrix=solver.counter_distance_matrix,
+                predecessor_matrix=solver.predecessor,
+                constant_degree_dict=self.constant_degree_dict,
+                node_ids=node_ids,
+                sparse=sparse,
+            )
+            predecessor = converted_outputs["predecessor_matrix"]
+            distance_matrix = converted_outputs["distance_matrix"]
+        elif sparse:
+            predecessor = {
+                node_idx: solver.predecessor[node_idx] for node_idx in node_ids
+            }
+            distance_matrix = {
+                node_idx: solver.counter_distance_matrix[node_idx]
+                for node_idx in node_ids
+            }
+        elif node_ids is None:
+            # Copy the predecessor since the workspace is reused by later solves
+            predecessor = list(solver.predecessor)
+            distance_matrix = solver.counter_distance_matrix
+        else:
+            predecessor = [-1] * self.original_graph_len
+            for node_idx in node_ids:
+                predecessor[node_idx] = solver.predecessor[node_idx]
+            distance_matrix = solver.counter_distance_matrix
+
+        # Remove counter values from distance matrix
+        convert_distance = self._get_distance_converter()
+        # Nodes that are not reached have an inf distance (a Decimal inf unless lexicographic)
+        unreached_distance = (
+            float("inf") if self.weight_mode == "lexicographic" else inf
+        )
+        if sparse:
+            if convert_distance is not None:
+                distance_matrix = {
+                    node_idx: (
+                        convert_distance(distance)
+                        if distance != inf
+                        else distance
+                    )
+                    for node_idx, distance in distance_matrix.items()
+                }
+            distance_matrix = SparseArray(
+                distance_matrix,
+                default=unreached_distance,
+                size=self.original_graph_len,
+            )
+            predecessor = SparseArray(
+                predecessor, default=-1, size=self.original_graph_len
+            )
+        elif node_ids is not None:
+            raw_distance_matrix = distance_matrix
+            distance_matrix = [unreached_distance] * self.original_graph_len
+            for node_idx in node_ids:
+                distance = raw_distance_matrix[node_idx]
+                distance_matrix[node_idx] = (
+                    convert_distance(distance)
+                    if convert_distance and distance != inf
+                    else distance
+                )
+        elif convert_distance is None:
+            distance_matrix = list(distance_matrix)
+        else:
+            distance_matrix = [
+                convert_distance(i) if i != inf else i for i in distance_matrix
+            ]
+
+        if sparse and destination_id not in distance_matrix:
+            # The destination is not within max_distance
+            path = None
+            length = float("inf") if destination_id is not None else None
+        else:
+            path = (
+                reconstruct_path(
+                    destination_id=destination_id, predecessor=predecessor
+                )
+                if destination_id is not None
+                else None
+            )
+            length = (
+                distance_matrix[destination_id]
+                if destination_id is not None
+                else None
+            )
+        output = {
+            "origin_id": (
+                origin_id
+                if isinstance(origin_id, (int, dict))
+                else list(origin_id)
+            ),
+            "destination_id": destination_id,
+            "predecessor": predecessor,
+            "distance_matrix": distance_matrix,
+            "path": path,
+            "length": length,
+        }
+        if source_label:
+            # Original nodes keep their ids in the constant degree graph and inherit labels from their partition nodes
+            source_labels = solver.source_label
+            if sparse:
+                output["source_label"] = SparseArray(
+                    {
+                        node_idx: source_labels[node_idx]
+                        for node_idx in node_ids
+                    },
+                    default=-1,
+                    size=self.original_graph_len,
+                )
+            elif node_ids is None:
+                output["source_label"] = source_labels[
+                    : self.original_graph_len
+                ]
+            else:
+                output["source_label"] = [-1] * self.original_graph_len
+                for node_idx in node_ids:
+                    output["source_label"][node_idx] = source_labels[node_idx]
+        return output
+
+
+# State for each solve_many worker process (set by _init_solve_worker)
+_solve_worker_state = {}
+
+
+def _init_solve_worker(shared_memory_name: str, solve_kwargs: dict) -> None:
+    """
+    Function:
+
+    - Attach a solve_many worker process to the shared memory graph.
+    """
+    _solve_worker_state["bmssp"] = Bmssp.attach(shared_memory_name)
+    _solve_worker_state["solve_kwargs"] = solve_kwargs
+
+
+def _distance_table_worker_row(origin_id: int) -> array:
+    """
+    Function:
+
+    - Solve a single distance_table row in a worker process.
+    """
+    bmssp = _solve_worker_state["bmssp"]
+    workspace = bmssp._get_workspace()
+    try:
+        return bmssp._solve_distance_table_row(
+            workspace=workspace,
+            origin_id=origin_id,
+            **_solve_worker_state["solve_kwargs"],
+        )
+    finally:
+        bmssp._workspaces.append(workspace)
+
+
+def _all_pairs_worker_row(origin_id: int) -> tuple[array, array]:
+    """
+    Function:
+
+    - Solve a single all_pairs row in a worker process.
+    """
+    bmssp = _solve_worker_state["bmssp"]
+    workspace = bmssp._get_workspace()
+    try:
+        return bmssp._solve_all_pairs_row(
+            workspace=workspace,
+            origin_id=origin_id,
+            **_solve_worker_state["solve_kwargs"],
+        )
+    finally:
+        bmssp._workspaces.append(workspace)
+
+
+def _solve_worker_query(query: tuple) -> dict:
+    """
+    Function:
+
+    - Solve a single (origin_id, destination_id) query in a solve_many worker process.
+    """
+    origin_id, destination_id = query
+    return _solve_worker_state["bmssp"].solve(
+        origin_id=origin_id,
+        destination_id=destination_id,
+        **_solve_worker_state["solve_kwargs"],
+    )
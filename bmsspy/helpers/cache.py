@@ -0,0 +1,226 @@
+from collections import OrderedDict
+from threading import Event, Lock
+
+
+class ByteSizeLruCache:
+    def __init__(self, max_bytes: int):
+        """
+        Function:
+
+        - Initialize a least recently used cache that evicts entries by their total size in bytes instead of their count.
+
+        Required Arguments:
+
+        - `max_bytes`
+            - Type: int
+            - What: The largest total number of bytes to store
+            - Note: Entries larger than this are not stored.
+
+        Optional Arguments:
+
+        - None
+        """
+        if not isinstance(max_bytes, int) or max_bytes < 1:
+            raise ValueError(
+                f"Your provided max_bytes ({max_bytes}) must be a positive int"
+            )
+        self.max_bytes = max_bytes
+        self.num_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Maps each key to a (value, num_bytes) tuple from least to most recently used
+        self._entries = OrderedDict()
+        # Entries may be read and stored by concurrent solves
+        self._lock = Lock()
+
+    def get(self, key):
+        """
+        Function:
+
+        - Return the value stored for key (and mark it as the most recently used) or None if it is not stored.
+
+        Required Arguments:
+
+        - `key`
+            - Type: Any hashable
+            - What: The key to look up
+
+        Optional Arguments:
+
+        - None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, num_bytes: int) -> None:
+        """
+        Function:
+
+        - Store a value for key and evict the least recently used entries until the total size is at most `max_bytes`.
+
+        Required Arguments:
+
+        - `key`
+            - Type: Any hashable
+            - What: The key to store the value under
+        - `value`
+            - Type: Any
+            - What: The value to store
+        - `num_bytes`
+            - Type: int
+            - What: The size of the value in bytes
+
+        Optional Arguments:
+
+        - None
+        """
+        with self._lock:
+            if key in self._entries:
+                self.num_bytes -= self._entries.pop(key)[1]
+            if num_bytes > self.max_bytes:
+                return
+            self._entries[key] = (value, num_bytes)
+            self.num_bytes += num_bytes
+            while self.num_bytes > self.max_bytes:
+                self.num_bytes -= self._entries.popitem(last=False)[1][1]
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Function:
+
+        - Remove every entry (the hit, miss and eviction counts are kept).
+        """
+        with self._lock:
+            self._entries.clear()
+            self.num_bytes = 0
+
+    def get_info(self) -> dict:
+        """
+        Function:
+
+        - Return a dictionary with the `hits`, `misses`, `evictions`, number of `entries`, stored `bytes` and `max_bytes` of the cache.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.num_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+class SingleFlight:
+    def __init__(self):
+        """
+        Function:
+
+        - Initialize a single flight group that runs at most one call for each key at a time.
+            - Note: This is thread safe.
+        - Concurrent calls for a key that is already running wait for it to finish and share its result (or error) instead of running again.
+
+        Required Arguments:
+
+        - None
+
+        Optional Arguments:
+
+        - None
+        """
+        self.calls = 0
+        self.coalesced = 0
+        # Maps each running key to a dictionary with its `event`, `result` and `error`
+        self._in_flight = {}
+        self._lock = Lock()
+
+    def run(self, key, function) -> tuple:
+        """
+        Function:
+
+        - Run function (with no arguments) for key unless a call for key is already running, in which case wait for that call instead.
+
+        Required Arguments:
+
+        - `key`
+            - Type: Any hashable
+            - What: The key that identifies duplicate calls
+        - `function`
+            - Type: function
+            - What: The function to run
+
+        Optional Arguments:
+
+        - None
+
+        Returns:
+
+        - A tuple of the result of the call and whether it is shared with other calls
+            - Note: A shared result is used by every call that waited for it (and the call that ran it) so it should be copied before it is changed.
+        - Note: If the call raises an error, the same error is raised in every call that waited for it.
+        """
+        with self._lock:
+            in_flight = self._in_flight
+            call = in_flight.get(key)
+            if call is None:
+                call = {
+                    "event": Event(),
+                    "result": None,
+                    "error": None,
+                    "waiters": 0,
+                }
+                in_flight[key] = call
+                self.calls += 1
+                is_waiter = False
+            else:
+                call["waiters"] += 1
+                self.coalesced += 1
+                is_waiter = True
+        if is_waiter:
+            call["event"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"], True
+        try:
+            call["result"] = function()
+        except BaseException as error:
+            call["error"] = error
+            raise
+        finally:
+            with self._lock:
+                if in_flight.get(key) is call:
+                    del in_flight[key]
+                # No calls can wait for this call once it is removed
+                is_shared = call["waiters"] > 0
+            call["event"].set()
+        return call["result"], is_shared
+
+    def forget(self) -> None:
+        """
+        Function:
+
+        - Stop sharing the calls that are currently running such that later calls for the same keys run again.
+        """
+        with self._lock:
+            self._in_flight = {}
+
+    def get_info(self) -> dict:
+        """
+        Function:
+
+        - Return a dictionary with the number of `calls` run, the number of calls that were `coalesced` into a running call and the number of calls `in_flight`.
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._in_flight),
+            }
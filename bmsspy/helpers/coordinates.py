@@ -0,0 +1,99 @@
+from array import array
+from math import asin, cos, radians, sin, sqrt
+
+# The mean radius of the earth in kilometers
+EARTH_RADIUS_KM = 6371.0
+
+
+def coordinates_to_arrays(coordinates) -> tuple[array, array]:
+    """
+    Function:
+
+    - Convert a sequence of node coordinates into two parallel float64 arrays
+
+    Required Arguments:
+
+    - `coordinates`
+        - Type: Any sequence of (x, y) pairs or dictionaries with `latitude` and `longitude` keys
+        - What: The coordinates of each node in order of node id
+        - Note: Dictionaries (eg: scgraph geograph nodes) are converted to (latitude, longitude) pairs
+
+    Optional Arguments:
+
+    - None
+
+    Returns:
+
+    - A tuple of two float64 arrays (the x or latitude values and the y or longitude values)
+    """
+    x_values = array("d")
+    y_values = array("d")
+    for coordinate in coordinates:
+        if isinstance(coordinate, dict):
+            coordinate = (coordinate["latitude"], coordinate["longitude"])
+        x_value, y_value = coordinate
+        x_values.append(x_value)
+        y_values.append(y_value)
+    return x_values, y_values
+
+
+def haversine_distance(
+    latitude_a: float,
+    longitude_a: float,
+    latitude_b: float,
+    longitude_b: float,
+) -> float:
+    """
+    Function:
+
+    - Return the great circle distance in kilometers between two points given in degrees
+
+    Required Arguments:
+
+    - `latitude_a`, `longitude_a`
+        - Type: float
+        - What: The latitude and longitude of the first point in degrees
+    - `latitude_b`, `longitude_b`
+        - Type: float
+        - What: The latitude and longitude of the second point in degrees
+
+    Optional Arguments:
+
+    - None
+    """
+    latitude_a = radians(latitude_a)
+    latitude_b = radians(latitude_b)
+    half_latitude_delta = (latitude_b - latitude_a) / 2
+    half_longitude_delta = radians(longitude_b - longitude_a) / 2
+    haversine = (
+        sin(half_latitude_delta) ** 2
+        + cos(latitude_a) * cos(latitude_b) * sin(half_longitude_delta) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * asin(sqrt(min(1.0, haversine)))
+
+
+def euclidean_distance(
+    x_a: float,
+    y_a: float,
+    x_b: float,
+    y_b: float,
+) -> float:
+    """
+    Function:
+
+    - Return the straight line distance between two points in the same units as the points
+
+    Required Arguments:
+
+    - `x_a`, `y_a`
+        - Type: float
+        - What: The coordinates of the first point
+    - `x_b`, `y_b`
+        - Type: float
+        - What: The coordinates of the second point
+
+    Optional Arguments:
+
+    - None
+    """
+    return sqrt((x_b - x_a) ** 2 + (y_b - y_a) ** 2)
@@ -0,0 +1,374 @@
+from array import array
+from itertools import accumulate, chain, islice, repeat
+from math import ceil
+from operator import add, le, sub
+
+
+def graph_to_csr(graph: list[dict[int, int | float]]) -> dict:
+    """
+    Function:
+
+    - Convert an adjacency list graph into a CSR (compressed sparse row) graph
+    - Edges are stored in the same order they are iterated in the adjacency list graph
+
+    Required Arguments:
+
+    - `graph`:
+        - Type: list of dictionaries
+        - What: The input graph represented as a list of dictionaries where each index represents a node id.
+                Each dictionary contains neighboring node ids as keys and edge weights as values.
+
+    Optional Arguments:
+
+    - None
+
+    Returns:
+
+    - A dictionary with the following keys
+        - `indptr`: An array of length len(graph) + 1 where the edges of node i are stored at positions indptr[i] to indptr[i + 1]
+        - `indices`: An array of the destination node id for each edge position
+        - `weights`: A list of the edge weight for each edge position
+    """
+    indptr = array("q", [0])
+    indices = array("q")
+    weights = []
+    for neighbors in graph:
+        indices.extend(neighbors.keys())
+        weights.extend(neighbors.values())
+        indptr.append(len(indices))
+    return {
+        "indptr": indptr,
+        "indices": indices,
+        "weights": weights,
+    }
+
+
+def csr_to_graph(csr_graph: dict) -> list[dict[int, int | float]]:
+    """
+    Function:
+
+    - Convert a CSR (compressed sparse row) graph back into an adjacency list graph
+
+    Required Arguments:
+
+    - `csr_graph`:
+        - Type: dict
+        - What: A dictionary with `indptr`, `indices` and `weights` keys as returned by `graph_to_csr`
+
+    Optional Arguments:
+
+    - None
+
+    Returns:
+
+    - The graph represented as a list of dictionaries where each index represents a node id.
+    """
+    indptr = csr_graph["indptr"]
+    indices = csr_graph["indices"]
+    weights = csr_graph["weights"]
+    return [
+        dict(
+            zip(
+                indices[indptr[node_idx] : indptr[node_idx + 1]],
+                weights[indptr[node_idx] : indptr[node_idx + 1]],
+            )
+        )
+        for node_idx in range(len(indptr) - 1)
+    ]
+
+
+def to_array(typecode: str, values) -> array:
+    """
+    Function:
+
+    - Convert a sequence of numbers into an array with the given typecode
+    - Contiguous buffers with a matching item type (eg: numpy int64 or float64 arrays) are copied as raw bytes instead of item by item
+
+    Required Arguments:
+
+    - `typecode`
+        - Type: str
+        - What: The array typecode to convert to (eg: "q" for int64 or "d" for float64)
+    - `values`
+        - Type: Any sequence or buffer of numbers
+        - What: The values to convert
+
+    Optional Arguments:
+
+    - None
+    """
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    output = array(typecode)
+    try:
+        view = memoryview(values)
+    except TypeError:
+        output.extend(values)
+        return output
+    # Native int64 buffers are reported as "l" or "q" depending on the platform
+    compatible_formats = {"q": ("q", "l"), "d": ("d",)}.get(
+        typecode, (typecode,)
+    )
+    if (
+        view.ndim == 1
+        and view.c_contiguous
+        and view.itemsize == output.itemsize
+        and view.format.lstrip("@=<") in compatible_formats
+    ):
+        output.frombytes(view.cast("B"))
+    else:
+        output.extend(values)
+    return output
+
+
+def edge_arrays_to_csr(
+    origins, destinations, weights, num_nodes: int | None = None
+) -> dict:
+    """
+    Function:
+
+    - Convert parallel edge arrays (origin, destination, weight) into a CSR (compressed sparse row) graph
+    - Edges with the same origin keep their relative input order
+
+    Required Arguments:
+
+    - `origins`
+        - Type: Any sequence or buffer of ints
+        - What: The origin node id for each edge
+    - `destinations`
+        - Type: Any sequence or buffer of ints
+        - What: The destination node id for each edge
+    - `weights`
+        - Type: Any sequence or buffer of numbers
+        - What: The weight for each edge
+
+    Optional Arguments:
+
+    - `num_nodes`
+        - Type: int | None
+        - Default: None
+        - What: The number of nodes in the graph
+        - Note: If None, this is one more than the largest node id in origins or destinations
+
+    Returns:
+
+    - A dictionary with `indptr`, `indices` and `weights` keys (see `graph_to_csr`)
+    """
+    origins = to_array("q", origins)
+    destinations = to_array("q", destinations)
+    if not len(origins) == len(destinations) == len(weights):
+        raise ValueError(
+            "Your provided origins, destinations and weights must all be the same length"
+        )
+    if num_nodes is None:
+        num_nodes = (
+            max(max(origins, default=-1), max(destinations, default=-1)) + 1
+        )
+    counts = [0] * (num_nodes + 1)
+    for origin_idx in origins:
+        counts[origin_idx + 1] += 1
+    indptr = array("q", accumulate(counts))
+    # Edges that are already grouped by origin can be used as is
+    if all(map(le, origins, islice(origins, 1, None))):
+        return {
+            "indptr": indptr,
+            "indices": destinations,
+            "weights": weights,
+        }
+    # Otherwise use a stable counting sort by origin
+    positions = list(indptr[:-1])
+    indices = array("q", bytes(8 * len(origins)))
+    sorted_weights = [0] * len(origins)
+    for edge_idx, origin_idx in enumerate(origins):
+        position = positions[origin_idx]
+        positions[origin_idx] = position + 1
+        indices[position] = destinations[edge_idx]
+        sorted_weights[position] = weights[edge_idx]
+    return {
+        "indptr": indptr,
+        "indices": indices,
+        "weights": sorted_weights,
+    }
+
+
+def transpose_csr(csr_graph: dict) -> dict:
+    """
+    Function:
+
+    - Reverse every edge of a CSR (compressed sparse row) graph
+    - Edges into the same node keep the relative order of their origins
+
+    Required Arguments:
+
+    - `csr_graph`:
+        - Type: dict
+        - What: A dictionary with `indptr`, `indices` and `weights` keys as returned by `graph_to_csr`
+
+    Optional Arguments:
+
+    - None
+
+    Returns:
+
+    - A dictionary with `indptr`, `indices` and `weights` keys (see `graph_to_csr`) where each edge i -> j is replaced by j -> i
+    """
+    indptr = csr_graph["indptr"]
+    num_nodes = len(indptr) - 1
+    origins = array(
+        "q",
+        chain.from_iterable(
+            map(
+                repeat,
+                range(num_nodes),
+                map(sub, islice(indptr, 1, None), indptr),
+            )
+        ),
+    )
+    return edge_arrays_to_csr(
+        origins=csr_graph["indices"],
+        destinations=origins,
+        weights=csr_graph["weights"],
+        num_nodes=num_nodes,
+    )
+
+
+def csr_to_constant_out_degree(
+    csr_graph: dict, out_degree: int = 2, zero_weight=0
+) -> dict:
+    """
+    Function:
+
+    - Convert a CSR graph to a constant out-degree CSR graph with no more than `out_degree` outgoing edges per node
+    - This produces the same nodes and edge order as `convert_to_constant_out_degree` without building any per node dictionaries
+
+    Required Arguments:
+
+    - `csr_graph`:
+        - Type: dict
+        - What: A dictionary with `indptr`, `indices` and `weights` keys as returned by `graph_to_csr`
+
+    Optional Arguments:
+
+    - `out_degree`
+        - Type: int
+        - Default: 2
+        - What: The maximum number of outgoing edges per node
+    - `zero_weight`
+        - Type: int | float | Decimal
+        - Default: 0
+        - What: The weight to use for the edges that cycle connect each partitioned node
+
+    Returns:
+
+    - A dictionary with the following keys
+        - 'graph' (dict): The converted constant out-degree CSR graph.
+        - 'idx_map' (list of int): A mapping from all node indices to original node indices.
+        - 'original_graph_len' (int): The length of the original graph.
+    """
+    indptr = csr_graph["indptr"]
+    indices = csr_graph["indices"]
+    weights = csr_graph["weights"]
+    original_graph_len = len(indptr) - 1
+    idx_map = list(range(original_graph_len))
+    partition_size = out_degree - 1
+    # Only nodes with more than out_degree edges are partitioned
+    partitioned_ids = [
+        node_idx
+        for node_idx, degree in enumerate(
+            map(sub, islice(indptr, 1, None), indptr)
+        )
+        if degree > out_degree
+    ]
+
+    # Partition 0 of each node stays in place while new partitions are appended after all original nodes
+    head_indptr = array("q", [0])
+    head_indices = array("q")
+    head_weights = []
+    tail_lengths = []
+    tail_indices = array("q")
+    tail_weights = []
+    run_start = 0
+    for node_idx in partitioned_ids + [original_graph_len]:
+        # Copy each run of nodes that are not partitioned (and their edges) in bulk
+        if run_start < node_idx:
+            start = indptr[run_start]
+            end = indptr[node_idx]
+            head_indptr.extend(
+                map(
+                    add,
+                    indptr[run_start + 1 : node_idx + 1],
+                    repeat(len(head_indices) - start),
+                )
+            )
+            head_indices.extend(indices[start:end])
+            head_weights.extend(weights[start:end])
+        run_start = node_idx + 1
+        if node_idx == original_graph_len:
+            break
+        start = indptr[node_idx]
+        end = indptr[node_idx + 1]
+        num_partitions = ceil((end - start) / partition_size)
+        first_partition_idx = len(idx_map)
+        idx_map.extend(repeat(node_idx, num_partitions - 1))
+        # Cycle connect all partitions with zero-weight edges
+        # The first partition connects to a new partition node (which is never an input edge destination)
+        head_indices.extend(indices[start : start + partition_size])
+        head_indices.append(first_partition_idx)
+        head_weights.extend(weights[start : start + partition_size])
+        head_weights.append(zero_weight)
+        head_indptr.append(len(head_indices))
+        # The middle partitions each hold partition_size edges followed by a cycle edge to the next partition
+        num_middle_partitions = num_partitions - 2
+        middle_start = start + partition_size
+        middle_end = middle_start + num_middle_partitions * partition_size
+        if num_middle_partitions > 0:
+            middle_indices = [0] * (num_middle_partitions * out_degree)
+            middle_weights = [zero_weight] * (
+                num_middle_partitions * out_degree
+            )
+            for offset in range(partition_size):
+                middle_indices[offset::out_degree] = indices[
+                    middle_start + offset : middle_end : partition_size
+                ]
+                middle_weights[offset::out_degree] = weights[
+                    middle_start + offset : middle_end : partition_size
+                ]
+            middle_indices[partition_size::out_degree] = range(
+                first_partition_idx + 1,
+                first_partition_idx + 1 + num_middle_partitions,
+            )
+            tail_indices.extend(middle_indices)
+            tail_weights.extend(middle_weights)
+            tail_lengths.extend(repeat(out_degree, num_middle_partitions))
+        partition_start = middle_end
+        partition_end = end
+        tail_indices.extend(indices[partition_start:partition_end])
+        tail_weights.extend(weights[partition_start:partition_end])
+        # The last partition connects back to the original node which may already be an edge destination (a self loop)
+        partition_indices = list(indices[partition_start:partition_end])
+        if node_idx in partition_indices:
+            tail_weights[
+                len(tail_weights)
+                - len(partition_indices)
+                + partition_indices.index(node_idx)
+            ] = zero_weight
+            tail_lengths.append(len(partition_indices))
+        else:
+            tail_indices.append(node_idx)
+            tail_weights.append(zero_weight)
+            tail_lengths.append(len(partition_indices) + 1)
+
+    head_indptr.extend(
+        islice(accumulate(tail_lengths, initial=head_indptr[-1]), 1, None)
+    )
+    head_indices.extend(tail_indices)
+    head_weights.extend(tail_weights)
+    return {
+        "graph": {
+            "indptr": head_indptr,
+            "indices": head_indices,
+            "weights": head_weights,
+        },
+        "idx_map": idx_map,
+        "original_graph_len": original_graph_len,
+    }
@@ -75,7 +75,10 @@ def median_of_medians(
         extra = []
         # Allow for arrays not divisible by split_size
         if len_arr % split_size != 0:
-            extra = [median(arr[len_arr - (len_arr % split_size) :])]
+            # Use split=False so the extra median is always an element (int keys can exceed float precision)
+            extra = [
+                median(arr[len_arr - (len_arr % split_size) :], split=False)
+            ]
             arr = arr[: len_arr - (len_arr % split_size)]
         medians = [
             sorted(arr[i : i + split_size])[split_median_idx]
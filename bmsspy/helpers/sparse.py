@@ -0,0 +1,49 @@
+class SparseArray(dict):
+    def __init__(self, values=(), default=None, size: int = 0):
+        """
+        Function:
+
+        - Initialize a node indexed array that only stores the nodes that were reached by a solve.
+        - This is a dictionary of node id: value pairs that also supports list style lookups
+          such that any node id in range(size) that is not stored returns `default`.
+        - Iterating, `len` and `in` only cover the stored node ids (as with any dictionary).
+            - Use `to_list` to materialize the full dense array.
+
+        Required Arguments:
+
+        - None
+
+        Optional Arguments:
+
+        - `values`:
+            - Type: dict | iterable of (int, any) tuples
+            - Default: ()
+            - What: The node id: value pairs to store
+        - `default`:
+            - Type: any
+            - Default: None
+            - What: The value of every node id that is not stored
+        - `size`:
+            - Type: int
+            - Default: 0
+            - What: The length of the full dense array
+        """
+        super().__init__(values)
+        self.default = default
+        self.size = size
+
+    def __missing__(self, key: int):
+        if isinstance(key, int) and 0 <= key < self.size:
+            return self.default
+        raise IndexError(f"Node id ({key}) is out of range")
+
+    def to_list(self) -> list:
+        """
+        Function:
+
+        - Materialize the full dense array as a list of length `size`.
+        """
+        output = [self.default] * self.size
+        for key, value in self.items():
+            output[key] = value
+        return output
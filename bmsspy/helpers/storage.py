@@ -0,0 +1,444 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+
+# Layout (used for both files and shared memory):
+# - MAGIC
+# - header_struct (format version, header length)
+# - A utf-8 json header with the metadata and the offset of each array
+# - Each array stored as raw native bytes aligned to ARRAY_ALIGNMENT
+MAGIC = b"BMSSPY\x00\x00"
+FORMAT_VERSION = 1
+ARRAY_ALIGNMENT = 8
+header_struct = struct.Struct("<II")
+
+
+def pack_arrays(metadata: dict, arrays: dict[str, array]) -> tuple[int, list]:
+    """
+    Function:
+
+    - Lay out a dictionary of arrays and json serializable metadata in the versioned binary format
+
+    Required Arguments:
+
+    - `metadata`:
+        - Type: dict
+        - What: Any json serializable metadata to store with the arrays
+    - `arrays`:
+        - Type: dict of str: array
+        - What: A dictionary of arrays to store where each array must use a typecode that memoryview can cast to (eg: "q" or "d")
+
+    Optional Arguments:
+
+    - None
+
+    Returns:
+
+    - A tuple of (size, chunks)
+        - `size`: The total size in bytes
+        - `chunks`: A list of bytes-like objects to write in order (array data is not copied)
+    """
+    array_headers, data_size = get_array_headers(
+        {
+            name: (values.typecode, len(values))
+            for name, values in arrays.items()
+        }
+    )
+    chunks = [pack_header(metadata=metadata, array_headers=array_headers)]
+    for values in arrays.values():
+        data = memoryview(values).cast("B")
+        chunks.append(data)
+        chunks.append(b"\x00" * (-len(data) % ARRAY_ALIGNMENT))
+    return len(chunks[0]) + data_size, chunks
+
+
+def get_array_headers(
+    arrays: dict[str, tuple[str, int]],
+) -> tuple[dict[str, dict], int]:
+    """
+    Function:
+
+    - Return the header (typecode, offset and length) of each array and the total size in bytes of the array data
+
+    Required Arguments:
+
+    - `arrays`:
+        - Type: dict of str: (str, int)
+        - What: A dictionary of array name: (typecode, length) pairs in the order they are stored
+
+    Optional Arguments:
+
+    - None
+    """
+    array_headers = {}
+    offset = 0
+    for name, (typecode, length) in arrays.items():
+        array_headers[name] = {
+            "typecode": typecode,
+            "offset": offset,
+            "length": length,
+        }
+        size = length * array(typecode).itemsize
+        offset += size + (-size % ARRAY_ALIGNMENT)
+    return array_headers, offset
+
+
+def pack_header(
+    metadata: dict,
+    array_headers: dict[str, dict],
+    header_len: int | None = None,
+    reserved_len: int = 0,
+) -> bytes:
+    """
+    Function:
+
+    - Return the bytes stored before the array data (MAGIC, header_struct and the json header)
+
+    Required Arguments:
+
+    - `metadata`:
+        - Type: dict
+        - What: Any json serializable metadata to store with the arrays
+    - `array_headers`:
+        - Type: dict of str: dict
+        - What: The array headers returned by `get_array_headers`
+
+    Optional Arguments:
+
+    - `header_len`:
+        - Type: int | None
+        - Default: None
+        - What: The exact length of the json header (including padding) to use
+        - Note: This is used to rewrite the metadata of an existing file without moving its array data.
+        - Note: If None, the json header is only padded such that the array data is aligned to ARRAY_ALIGNMENT.
+    - `reserved_len`:
+        - Type: int
+        - Default: 0
+        - What: The number of extra bytes of padding to reserve such that the metadata can be rewritten with a longer value later
+        - Note: This is only used if `header_len` is None.
+    """
+    header = json.dumps(
+        {
+            "byteorder": sys.byteorder,
+            "metadata": metadata,
+            "arrays": array_headers,
+        }
+    ).encode("utf-8")
+    if header_len is None:
+        header += b" " * reserved_len
+        data_start = len(MAGIC) + header_struct.size + len(header)
+        header += b" " * (-data_start % ARRAY_ALIGNMENT)
+    elif len(header) > header_len:
+        raise ValueError(
+            f"The metadata needs {len(header)} bytes but only {header_len} bytes are reserved for it"
+        )
+    else:
+        header += b" " * (header_len - len(header))
+    return MAGIC + header_struct.pack(FORMAT_VERSION, len(header)) + header
+
+
+def unpack_arrays(buffer, source: str) -> tuple[dict, dict[str, memoryview]]:
+    """
+    Function:
+
+    - Return the metadata and views of each array stored in a buffer laid out by `pack_arrays`
+    - No array data is copied
+
+    Required Arguments:
+
+    - `buffer`:
+        - Type: Any bytes-like object (eg: mmap or memoryview)
+        - What: The buffer to read from
+    - `source`:
+        - Type: str
+        - What: A description of where the buffer came from for error messages
+
+    Optional Arguments:
+
+    - None
+
+    Returns:
+
+    - A tuple of (metadata, arrays)
+        - `metadata`: The metadata dictionary passed to `pack_arrays`
+        - `arrays`: A dictionary of memoryviews (one for each stored array)
+    """
+    view = memoryview(buffer)
+    if view[: len(MAGIC)] != MAGIC:
+        raise ValueError(f"The {source} is not a saved bmsspy graph")
+    format_version, header_len = header_struct.unpack_from(view, len(MAGIC))
+    if format_version != FORMAT_VERSION:
+        raise ValueError(
+            f"The {source} uses format version {format_version} but this version of bmsspy only supports format version {FORMAT_VERSION}"
+        )
+    header_start = len(MAGIC) + header_struct.size
+    header = json.loads(
+        bytes(view[header_start : header_start + header_len]).decode("utf-8")
+    )
+    if header["byteorder"] != sys.byteorder:
+        raise ValueError(
+            f"The {source} was saved on a {header['byteorder']} endian machine and can not be loaded on a {sys.byteorder} endian machine"
+        )
+    data_start = header_start + header_len
+    arrays = {}
+    for name, array_header in header["arrays"].items():
+        start = data_start + array_header["offset"]
+        itemsize = array(array_header["typecode"]).itemsize
+        arrays[name] = view[
+            start : start + array_header["length"] * itemsize
+        ].cast(array_header["typecode"])
+    return header["metadata"], arrays
+
+
+def write_arrays(path: str, metadata: dict, arrays: dict[str, array]) -> None:
+    """
+    Function:
+
+    - Write a dictionary of arrays and json serializable metadata to a versioned binary file
+
+    Required Arguments:
+
+    - `path`:
+        - Type: str
+        - What: The file path to write to
+    - `metadata`:
+        - Type: dict
+        - What: Any json serializable metadata to store with the arrays
+    - `arrays`:
+        - Type: dict of str: array
+        - What: See `pack_arrays`
+
+    Optional Arguments:
+
+    - None
+    """
+    _, chunks = pack_arrays(metadata=metadata, arrays=arrays)
+    with open(path, "wb") as file:
+        for chunk in chunks:
+            file.write(chunk)
+
+
+def read_arrays(path: str) -> tuple[dict, dict[str, memoryview], mmap.mmap]:
+    """
+    Function:
+
+    - Memory map a file written by `write_arrays` and return read only views of each stored array
+    - No array data is copied such that multiple processes that load the same file share the same physical pages
+
+    Required Arguments:
+
+    - `path`:
+        - Type: str
+        - What: The file path to read from
+
+    Optional Arguments:
+
+    - None
+
+    Returns:
+
+    - A tuple of (metadata, arrays, mapped_file)
+        - `metadata`: The metadata dictionary passed to `write_arrays`
+        - `arrays`: A dictionary of read only memoryviews (one for each stored array)
+        - `mapped_file`: The underlying mmap object which must be kept alive as long as the arrays are used
+    """
+    with open(path, "rb") as file:
+        mapped_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    metadata, arrays = unpack_arrays(mapped_file, source=f"file at {path}")
+    return metadata, arrays, mapped_file
+
+
+class ArrayFileWriter:
+    def __init__(
+        self,
+        path: str,
+        metadata: dict,
+        arrays: dict[str, tuple[str, int]],
+        reserved_len: int = 0,
+    ):
+        """
+        Function:
+
+        - Create a file in the format written by `write_arrays` whose arrays are filled in one chunk at a time with `ArrayFileWriter.write`
+        - Only the chunk being written is held in memory such that arrays larger than memory can be written
+
+        Required Arguments:
+
+        - `path`:
+            - Type: str
+            - What: The file path to write to
+        - `metadata`:
+            - Type: dict
+            - What: Any json serializable metadata to store with the arrays
+            - Note: This can be replaced with `ArrayFileWriter.set_metadata` until the writer is closed.
+        - `arrays`:
+            - Type: dict of str: (str, int)
+            - What: A dictionary of array name: (typecode, length) pairs in the order they are stored
+
+        Optional Arguments:
+
+        - `reserved_len`:
+            - Type: int
+            - Default: 0
+            - What: The number of extra bytes to reserve for metadata set with `ArrayFileWriter.set_metadata`
+        """
+        self.array_headers, data_size = get_array_headers(arrays)
+        header = pack_header(
+            metadata=metadata,
+            array_headers=self.array_headers,
+            reserved_len=reserved_len,
+        )
+        self.header_len = len(header) - len(MAGIC) - header_struct.size
+        self.data_start = len(header)
+        # The number of bytes written to each array so far
+        self.written = dict.fromkeys(self.array_headers, 0)
+        self.file = open(path, "w+b")
+        self.file.write(header)
+        self.file.truncate(len(header) + data_size)
+
+    def write(self, name: str, values: array) -> None:
+        """
+        Function:
+
+        - Write values directly after the values previously written to the array `name`
+
+        Required Arguments:
+
+        - `name`:
+            - Type: str
+            - What: The name of the array to write to
+        - `values`:
+            - Type: array
+            - What: The values to write
+            - Note: These must use the typecode of the array.
+
+        Optional Arguments:
+
+        - None
+        """
+        array_header = self.array_headers[name]
+        if values.typecode != array_header["typecode"]:
+            raise ValueError(
+                f"Your provided values use typecode {values.typecode} but the array {name} uses typecode {array_header['typecode']}"
+            )
+        data = memoryview(values).cast("B")
+        written = self.written[name]
+        if written + len(data) > array_header["length"] * values.itemsize:
+            raise ValueError(
+                f"Your provided values do not fit in the array {name} of length {array_header['length']}"
+            )
+        self.file.seek(self.data_start + array_header["offset"] + written)
+        self.file.write(data)
+        self.written[name] = written + len(data)
+
+    def set_metadata(self, metadata: dict) -> None:
+        """
+        Function:
+
+        - Replace the metadata stored in the file
+
+        Required Arguments:
+
+        - `metadata`:
+            - Type: dict
+            - What: Any json serializable metadata to store with the arrays
+            - Note: This must fit in the space of the original metadata plus `reserved_len`.
+
+        Optional Arguments:
+
+        - None
+        """
+        self.file.seek(0)
+        self.file.write(
+            pack_header(
+                metadata=metadata,
+                array_headers=self.array_headers,
+                header_len=self.header_len,
+            )
+        )
+
+    def close(self) -> None:
+        """
+        Function:
+
+        - Close the file
+        """
+        self.file.close()
+
+
+def write_arrays_to_shared_memory(
+    metadata: dict, arrays: dict[str, array], name: str | None = None
+) -> SharedMemory:
+    """
+    Function:
+
+    - Write a dictionary of arrays and json serializable metadata to a new shared memory block
+
+    Required Arguments:
+
+    - `metadata`:
+        - Type: dict
+        - What: Any json serializable metadata to store with the arrays
+    - `arrays`:
+        - Type: dict of str: array
+        - What: See `pack_arrays`
+
+    Optional Arguments:
+
+    - `name`:
+        - Type: str | None
+        - Default: None
+        - What: The name of the shared memory block to create
+        - Note: If None, a unique name is generated
+
+    Returns:
+
+    - The created SharedMemory object
+        - Note: The caller owns the shared memory block and must call `close()` and `unlink()` on it when it is no longer needed
+    """
+    size, chunks = pack_arrays(metadata=metadata, arrays=arrays)
+    shared_memory = SharedMemory(name=name, create=True, size=size)
+    position = 0
+    for chunk in chunks:
+        shared_memory.buf[position : position + len(chunk)] = chunk
+        position += len(chunk)
+    return shared_memory
+
+
+class SharedArrays:
+    def __init__(self, name: str):
+        """
+        Function:
+
+        - Attach to a shared memory block written by `write_arrays_to_shared_memory` and create read only views of each stored array
+        - No array data is copied such that all attached processes share the same physical pages
+
+        Required Arguments:
+
+        - `name`:
+            - Type: str
+            - What: The name of the shared memory block to attach to
+
+        Optional Arguments:
+
+        - None
+        """
+        try:
+            # Attached processes should never unlink the shared memory block when they exit
+            self.shared_memory = SharedMemory(name=name, track=False)
+        except TypeError:
+            # The track argument is only available in python 3.13+
+            self.shared_memory = SharedMemory(name=name)
+        self.metadata, self.arrays = unpack_arrays(
+            self.shared_memory.buf.toreadonly(),
+            source=f"shared memory block {name}",
+        )
+
+    def __del__(self):
+        # The shared memory block can only be closed once all views of it are released
+        for values in self.arrays.values():
+            values.release()
+        self.shared_memory.close()
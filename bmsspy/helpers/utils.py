@@ -1,9 +1,33 @@
 from copy import deepcopy
 from decimal import Decimal
 from math import ceil
+from struct import Struct
 
 inf = Decimal("Infinity")
 
+double_struct = Struct("<d")
+uint64_struct = Struct("<Q")
+
+
+def float_bits(value: float) -> int:
+    """
+    Function:
+
+    - Return the IEEE 754 bit pattern of a float as an unsigned int
+    - For nonnegative floats, the returned ints keep the same ordering as the floats themselves
+
+    Required Arguments:
+
+    - `value`
+        - Type: float
+        - What: The nonnegative float to convert
+
+    Optional Arguments:
+
+    - None
+    """
+    return uint64_struct.unpack(double_struct.pack(value))[0]
+
 
 def input_check(
     graph: list[dict[int, int | float]], origin_id: int, destination_id: int
@@ -216,7 +240,11 @@ def convert_to_constant_degree(graph: list[dict[int, int | float]]) -> dict:
 
 
 def convert_from_constant_degree(
-    distance_matrix, predecessor_matrix, constant_degree_dict
+    distance_matrix,
+    predecessor_matrix,
+    constant_degree_dict,
+    node_ids=None,
+    sparse=False,
 ):
     """
     Convert the distance and predecessor matrices from a constant degree graph back to the equivalent matrices for the original graph.
@@ -226,36 +254,58 @@ def convert_from_constant_degree(
     - distance_matrix (list of float): The distance matrix from the constant degree graph.
     - predecessor_matrix (list of int): The predecessor matrix from the constant degree graph.
     - constant_degree_dict (dict): The dictionary returned by `convert_to_constant_degree` function.
+    - node_ids (iterable of int | None): The original node ids to convert. If None, all nodes are converted.
+        - Nodes that are not converted are returned with an inf distance and a -1 predecessor.
+    - sparse (bool): If True, return dictionaries keyed by the converted node_ids instead of lists for the full original graph.
+        - Note: node_ids must be provided if sparse is True.
 
     Returns:
 
     - dict: A dictionary containing the converted distance and predecessor matrices.
-        - 'distance_matrix' (list of float): The converted distance matrix for the original graph.
-        - 'predecessor_matrix' (list of int): The converted predecessor matrix for the original graph.
+        - 'distance_matrix' (list of float | dict of int: float): The converted distance matrix for the original graph.
+        - 'predecessor_matrix' (list of int | dict of int: int): The converted predecessor matrix for the original graph.
     """
     cd_idx_map = constant_degree_dict["idx_map"]
     cd_original_graph_len = constant_degree_dict["original_graph_len"]
 
-    predecessor_matrix_converted = []
-    for loc_idx, node_idx in enumerate(
-        predecessor_matrix[:cd_original_graph_len]
-    ):
+    def get_predecessor(loc_idx):
+        node_idx = predecessor_matrix[loc_idx]
         while True:
             if node_idx == -1:
-                predecessor_matrix_converted.append(node_idx)
-                break
+                return node_idx
             else:
                 mapped_node_idx = cd_idx_map[node_idx]
                 if (
                     mapped_node_idx < cd_original_graph_len
                     and mapped_node_idx != loc_idx
                 ):
-                    predecessor_matrix_converted.append(mapped_node_idx)
-                    break
+                    return mapped_node_idx
                 else:
                     node_idx = predecessor_matrix[node_idx]
 
+    if node_ids is None:
+        return {
+            "distance_matrix": distance_matrix[:cd_original_graph_len],
+            "predecessor_matrix": [
+                get_predecessor(loc_idx)
+                for loc_idx in range(cd_original_graph_len)
+            ],
+        }
+    if sparse:
+        return {
+            "distance_matrix": {
+                loc_idx: distance_matrix[loc_idx] for loc_idx in node_ids
+            },
+            "predecessor_matrix": {
+                loc_idx: get_predecessor(loc_idx) for loc_idx in node_ids
+            },
+        }
+    distance_matrix_converted = [inf] * cd_original_graph_len
+    predecessor_matrix_converted = [-1] * cd_original_graph_len
+    for loc_idx in node_ids:
+        distance_matrix_converted[loc_idx] = distance_matrix[loc_idx]
+        predecessor_matrix_converted[loc_idx] = get_predecessor(loc_idx)
     return {
-        "distance_matrix": distance_matrix[:cd_original_graph_len],
+        "distance_matrix": distance_matrix_converted,
         "predecessor_matrix": predecessor_matrix_converted,
     }
@@ -0,0 +1,186 @@
+from array import array
+from heapq import heappush, heappop
+
+# Label distances are ints or floats (never Decimals) so a float inf is used
+inf = float("inf")
+
+
+def build_hub_labels(
+    graph: dict, reverse_graph: dict, order, convert_distance=None
+) -> dict:
+    """
+    Function:
+
+    - Build a hub labeling (two hop cover) of a graph with pruned landmark labeling.
+    - Hubs are processed in the given order. For each hub, a pruned Dijkstra search is run forward (for the in labels of the nodes it reaches)
+      and backward (for the out labels of the nodes that reach it).
+        - A node is pruned (not labeled or expanded) if the labels of the earlier hubs already give a distance that is no more than the search distance.
+        - Note: Important nodes (that many shortest paths pass through) should come first such that later searches are pruned early and labels stay small.
+    - The shortest distance from u to v is then the smallest out label distance of u to a hub plus the in label distance of v from the same hub (see `query_hub_labels`).
+
+    Required Arguments:
+
+    - `graph`
+        - Type: dict
+        - What: A CSR graph (with `indptr`, `indices` and `weights` keys)
+        - Note: The weights should be exact when summed in any order (eg: ints) such that pruning is exact.
+    - `reverse_graph`
+        - Type: dict
+        - What: The transposed CSR graph (with `indptr`, `indices` and `weights` keys)
+    - `order`
+        - Type: list[int]
+        - What: Every node id in the order they should be processed as hubs
+
+    Optional Arguments:
+
+    - `convert_distance`
+        - Type: function | None
+        - Default: None
+        - What: A function that converts each label distance to the float distance to store
+        - Note: If None, distances are stored as is.
+
+    Returns:
+
+    - A dictionary of flat arrays with the following keys
+        - `out_offsets`, `out_hubs` and `out_distances`: The out label of node i (the hubs it reaches and their distances) is stored at positions out_offsets[i] to out_offsets[i + 1]
+        - `in_offsets`, `in_hubs` and `in_distances`: The in label of node i (the hubs that reach it and their distances) is stored at positions in_offsets[i] to in_offsets[i + 1]
+        - Note: Hub ids are sorted in each label such that two labels are merged in a single pass.
+    """
+    graph_len = len(graph["indptr"]) - 1
+    # Labels store hub ranks while building such that they are sorted by rank
+    in_ranks = [[] for _ in range(graph_len)]
+    in_label_distances = [[] for _ in range(graph_len)]
+    out_ranks = [[] for _ in range(graph_len)]
+    out_label_distances = [[] for _ in range(graph_len)]
+    # The label distances of the current hub by hub rank (for pruning checks in O(label size))
+    hub_distances = [inf] * graph_len
+
+    for hub_rank, hub_idx in enumerate(order):
+        # The forward search labels the nodes the hub reaches and the backward search labels the nodes that reach the hub
+        for search_graph, hub_ranks, hub_label_distances, ranks, distances in [
+            (
+                graph,
+                out_ranks,
+                out_label_distances,
+                in_ranks,
+                in_label_distances,
+            ),
+            (
+                reverse_graph,
+                in_ranks,
+                in_label_distances,
+                out_ranks,
+                out_label_distances,
+            ),
+        ]:
+            indptr = search_graph["indptr"]
+            indices = search_graph["indices"]
+            weights = search_graph["weights"]
+            for rank, distance in zip(
+                hub_ranks[hub_idx], hub_label_distances[hub_idx]
+            ):
+                hub_distances[rank] = distance
+            search_distances = {hub_idx: 0}
+            heap = [(0, hub_idx)]
+            while heap:
+                distance, node_idx = heappop(heap)
+                if distance > search_distances[node_idx]:
+                    continue
+                # Prune nodes that are already covered by an earlier hub
+                if any(
+                    hub_distances[rank] + label_distance <= distance
+                    for rank, label_distance in zip(
+                        ranks[node_idx], distances[node_idx]
+                    )
+                ):
+                    continue
+                ranks[node_idx].append(hub_rank)
+                distances[node_idx].append(distance)
+                for edge_idx in range(indptr[node_idx], indptr[node_idx + 1]):
+                    connection_idx = indices[edge_idx]
+                    new_distance = distance + weights[edge_idx]
+                    if new_distance < search_distances.get(connection_idx, inf):
+                        search_distances[connection_idx] = new_distance
+                        heappush(heap, (new_distance, connection_idx))
+            for rank in hub_ranks[hub_idx]:
+                hub_distances[rank] = inf
+
+    hub_labels = {}
+    for direction, ranks, distances in [
+        ("out", out_ranks, out_label_distances),
+        ("in", in_ranks, in_label_distances),
+    ]:
+        offsets = array("q", [0])
+        hubs = array("q")
+        label_distances = array("d")
+        for node_idx in range(graph_len):
+            label = sorted(
+                zip(
+                    [order[rank] for rank in ranks[node_idx]],
+                    distances[node_idx],
+                )
+            )
+            # Free the build lists as each label is flattened
+            ranks[node_idx] = distances[node_idx] = None
+            for hub_idx, distance in label:
+                hubs.append(hub_idx)
+                label_distances.append(
+                    convert_distance(distance)
+                    if convert_distance is not None
+                    else distance
+                )
+            offsets.append(len(hubs))
+        hub_labels[direction + "_offsets"] = offsets
+        hub_labels[direction + "_hubs"] = hubs
+        hub_labels[direction + "_distances"] = label_distances
+    return hub_labels
+
+
+def query_hub_labels(
+    hub_labels: dict, origin_id: int, destination_id: int
+) -> float:
+    """
+    Function:
+
+    - Return the shortest distance from origin_id to destination_id by merging the out label of the origin with the in label of the destination.
+    - Returns inf if no hub is in both labels (the destination is not reachable from the origin).
+
+    Required Arguments:
+
+    - `hub_labels`
+        - Type: dict
+        - What: The hub labels as returned by `build_hub_labels`
+    - `origin_id`
+        - Type: int
+        - What: The id of the node to start from
+    - `destination_id`
+        - Type: int
+        - What: The id of the node to end at
+
+    Optional Arguments:
+
+    - None
+    """
+    out_hubs = hub_labels["out_hubs"]
+    out_distances = hub_labels["out_distances"]
+    in_hubs = hub_labels["in_hubs"]
+    in_distances = hub_labels["in_distances"]
+    out_idx = hub_labels["out_offsets"][origin_id]
+    out_end = hub_labels["out_offsets"][origin_id + 1]
+    in_idx = hub_labels["in_offsets"][destination_id]
+    in_end = hub_labels["in_offsets"][destination_id + 1]
+    best_distance = inf
+    while out_idx < out_end and in_idx < in_end:
+        out_hub = out_hubs[out_idx]
+        in_hub = in_hubs[in_idx]
+        if out_hub < in_hub:
+            out_idx += 1
+        elif out_hub > in_hub:
+            in_idx += 1
+        else:
+            distance = out_distances[out_idx] + in_distances[in_idx]
+            if distance < best_distance:
+                best_distance = distance
+            out_idx += 1
+            in_idx += 1
+    return best_distance
@@ -0,0 +1,57 @@
+# General Imports
+import random
+
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_random_graph
+
+print("\n===============\nBMSSP Weight Mode Tests:\n===============")
+
+
+def check_weight_mode(name, weight_mode, integer_weights=False):
+    failed = False
+    for seed in range(20):
+        if seed % 2 == 0:
+            get_weight = lambda: random.choice([0, 1, 2])
+        elif integer_weights:
+            get_weight = lambda: random.randint(1, 20)
+        else:
+            get_weight = None
+        graph = make_random_graph(50, 150, seed, get_weight=get_weight)
+        for use_constant_degree_graph in [True, False]:
+            expected = Bmssp(
+                graph, use_constant_degree_graph=use_constant_degree_graph
+            )
+            realized = Bmssp(
+                graph,
+                use_constant_degree_graph=use_constant_degree_graph,
+                weight_mode=weight_mode,
+            )
+            for origin_id in [0, {0, 7}]:
+                if expected.solve(origin_id) != realized.solve(origin_id):
+                    failed = True
+            if expected.solve(0, 9) != realized.solve(0, 9):
+                failed = True
+    if failed:
+        print(f"{name}: FAIL")
+    else:
+        print(f"{name}: PASS")
+
+
+check_weight_mode("BMSSP Integer Weight Mode Parity Test", "integer")
+# Integer weights are exact as floats so the lexicographic tie-breaking must match exactly
+check_weight_mode(
+    "BMSSP Lexicographic Weight Mode Parity Test",
+    "lexicographic",
+    integer_weights=True,
+)
+
+# Weights beyond the default precision should not be rounded in lexicographic mode
+output = Bmssp(
+    [{1: 0.1234567891, 2: 5}, {2: 0.1234567891}, {}],
+    weight_mode="lexicographic",
+).solve(0)
+if output["distance_matrix"] != [0, 0.1234567891, 0.1234567891 * 2]:
+    print("BMSSP Lexicographic No Rounding Test: FAIL")
+else:
+    print("BMSSP Lexicographic No Rounding Test: PASS")
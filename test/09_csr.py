@@ -0,0 +1,116 @@
+# Local Imports
+from bmsspy import Bmssp
+from bmsspy.helpers.csr import (
+    graph_to_csr,
+    csr_to_graph,
+    edge_arrays_to_csr,
+    csr_to_constant_out_degree,
+)
+from bmsspy.helpers.utils import convert_to_constant_out_degree
+
+print("\n===============\nCSR Graph Tests:\n===============")
+
+graph = [
+    {1: 1, 2: 1},
+    {2: 1, 3: 3},
+    {3: 1, 4: 2},
+    {4: 2},
+    {},
+]
+
+csr_graph = graph_to_csr(graph)
+if (
+    list(csr_graph["indptr"]) == [0, 2, 4, 6, 7, 7]
+    and list(csr_graph["indices"]) == [1, 2, 2, 3, 3, 4, 4]
+    and csr_graph["weights"] == [1, 1, 1, 3, 1, 2, 2]
+    and csr_to_graph(csr_graph) == graph
+):
+    print("CSR Conversion Test: PASS")
+else:
+    print("CSR Conversion Test: FAIL")
+
+# Edge id adjustments are based on the CSR edge position
+bmssp_graph = Bmssp(graph, use_constant_degree_graph=False)
+key_adjustments = [
+    key_weight - weight
+    for key_weight, weight in zip(
+        bmssp_graph.csr_graph["key_weights"], bmssp_graph.csr_graph["weights"]
+    )
+]
+if key_adjustments == sorted(set(key_adjustments)) and all(
+    adjustment < bmssp_graph.counter_value for adjustment in key_adjustments
+):
+    print("CSR Edge Id Adjustment Test: PASS")
+else:
+    print("CSR Edge Id Adjustment Test: FAIL")
+
+# Unsorted edge arrays are grouped by origin while keeping their relative order
+edge_csr_graph = edge_arrays_to_csr(
+    origins=[3, 0, 1, 2, 0, 1, 2],
+    destinations=[4, 1, 2, 3, 2, 3, 4],
+    weights=[2, 1, 1, 1, 1, 3, 2],
+    num_nodes=5,
+)
+if csr_to_graph(edge_csr_graph) == graph:
+    print("CSR Edge Arrays Test: PASS")
+else:
+    print("CSR Edge Arrays Test: FAIL")
+
+# The CSR constant degree conversion must match the adjacency list conversion
+large_degree_graph = [
+    {1: 1, 2: 2, 3: 3, 4: 4, 5: 5},
+    {0: 1, 2: 1, 3: 1, 4: 1, 5: 1, 6: 1},
+    {6: 2},
+    {0: 1, 1: 1, 2: 1},
+    {},
+    {0: 1, 1: 1, 2: 1, 3: 1},
+    {5: 1},
+]
+expected = convert_to_constant_out_degree(
+    [dict(neighbors) for neighbors in large_degree_graph], out_degree=2
+)
+realized = csr_to_constant_out_degree(
+    graph_to_csr(large_degree_graph), out_degree=2
+)
+if (
+    csr_to_graph(realized["graph"]) == expected["graph"]
+    and realized["idx_map"] == expected["idx_map"]
+    and realized["original_graph_len"] == expected["original_graph_len"]
+):
+    print("CSR Constant Degree Test: PASS")
+else:
+    print("CSR Constant Degree Test: FAIL")
+
+# Solving from CSR or edge arrays should match solving from the adjacency list
+expected = Bmssp(large_degree_graph).solve(0, 6)
+large_degree_csr_graph = graph_to_csr(large_degree_graph)
+from_csr = Bmssp.from_csr(
+    indptr=large_degree_csr_graph["indptr"],
+    indices=large_degree_csr_graph["indices"],
+    data=large_degree_csr_graph["weights"],
+)
+from_edge_arrays = Bmssp.from_edge_arrays(
+    origins=[
+        origin_idx
+        for origin_idx, neighbors in enumerate(large_degree_graph)
+        for _ in neighbors
+    ],
+    destinations=[
+        destination_idx
+        for neighbors in large_degree_graph
+        for destination_idx in neighbors
+    ],
+    weights=[
+        weight
+        for neighbors in large_degree_graph
+        for weight in neighbors.values()
+    ],
+)
+if (
+    from_csr.solve(0, 6) == expected
+    and from_edge_arrays.solve(0, 6) == expected
+    and from_csr.graph == Bmssp(large_degree_graph).graph
+):
+    print("CSR Entrypoint Test: PASS")
+else:
+    print("CSR Entrypoint Test: FAIL")
@@ -0,0 +1,70 @@
+# General Imports
+import os
+import random
+import tempfile
+
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_random_graph
+
+print("\n===============\nBMSSP Save and Load Tests:\n===============")
+
+graph = make_random_graph(
+    60, 240, 0, get_weight=lambda: round(random.random() * 10, 8)
+)
+
+with tempfile.TemporaryDirectory() as temp_dir:
+    path = os.path.join(temp_dir, "graph.bmssp")
+
+    failed = False
+    for weight_mode in ["decimal", "integer", "lexicographic"]:
+        for use_constant_degree_graph in [True, False]:
+            expected = Bmssp(
+                graph,
+                use_constant_degree_graph=use_constant_degree_graph,
+                weight_mode=weight_mode,
+            )
+            expected.save(path)
+            realized = Bmssp.load(path)
+            for origin_id in [0, {0, 7}]:
+                if expected.solve(origin_id) != realized.solve(origin_id):
+                    failed = True
+            if expected.solve(0, 9) != realized.solve(0, 9):
+                failed = True
+            if expected.graph != realized.graph:
+                failed = True
+            # Loaded graphs can be saved again
+            realized.save(path)
+            if Bmssp.load(path).solve(3, 11) != expected.solve(3, 11):
+                failed = True
+    if failed:
+        print("BMSSP Save and Load Parity Test: FAIL")
+    else:
+        print("BMSSP Save and Load Parity Test: PASS")
+
+    # Integer weights that do not fit in 64 bits are rebuilt when loading
+    expected = Bmssp(
+        [{1: 10**12, 2: 1}, {0: 1}, {1: 10**11}], weight_mode="integer"
+    )
+    expected.save(path)
+    if Bmssp.load(path).solve(0) == expected.solve(0):
+        print("BMSSP Save and Load Large Integer Test: PASS")
+    else:
+        print("BMSSP Save and Load Large Integer Test: FAIL")
+
+    # Loaded graphs should set every attribute that a built graph sets
+    expected = Bmssp(graph)
+    expected.save(path)
+    if set(vars(expected)) <= set(vars(Bmssp.load(path))):
+        print("BMSSP Save and Load Attributes Test: PASS")
+    else:
+        print("BMSSP Save and Load Attributes Test: FAIL")
+
+    # Unsupported files should raise a clear error
+    with open(path, "wb") as file:
+        file.write(b"not a graph")
+    try:
+        Bmssp.load(path)
+        print("BMSSP Load Invalid File Test: FAIL")
+    except ValueError:
+        print("BMSSP Load Invalid File Test: PASS")
@@ -0,0 +1,43 @@
+# General Imports
+from multiprocessing import Pool
+
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_random_graph
+
+
+def attach_and_solve(args):
+    name, origin_id = args
+    return Bmssp.attach(name).solve(origin_id)
+
+
+if __name__ == "__main__":
+    print("\n===============\nBMSSP Shared Memory Tests:\n===============")
+
+    graph = make_random_graph(60, 240, 1)
+
+    failed = False
+    for weight_mode in ["decimal", "integer", "lexicographic"]:
+        expected = Bmssp(graph, weight_mode=weight_mode)
+        shared_memory = expected.to_shared_memory()
+        try:
+            with Pool(2) as pool:
+                realized = pool.map(
+                    attach_and_solve,
+                    [(shared_memory.name, origin_id) for origin_id in range(4)],
+                )
+            if realized != [
+                expected.solve(origin_id) for origin_id in range(4)
+            ]:
+                failed = True
+            attached = Bmssp.attach(shared_memory.name)
+            if attached.graph != expected.graph:
+                failed = True
+            del attached
+        finally:
+            shared_memory.close()
+            shared_memory.unlink()
+    if failed:
+        print("BMSSP Shared Memory Parity Test: FAIL")
+    else:
+        print("BMSSP Shared Memory Parity Test: PASS")
@@ -0,0 +1,51 @@
+# General Imports
+import random
+
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_random_graph
+
+print("\n===============\nBMSSP Workspace Tests:\n===============")
+
+graph = make_random_graph(
+    80, 300, 2, get_weight=lambda: random.choice([0, 1, 2, 3.5])
+)
+
+failed = False
+for weight_mode in ["decimal", "integer", "lexicographic"]:
+    for use_constant_degree_graph in [True, False]:
+        reused = Bmssp(
+            graph,
+            use_constant_degree_graph=use_constant_degree_graph,
+            weight_mode=weight_mode,
+        )
+        first_output = reused.solve(0)
+        first_output_copy = {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in first_output.items()
+        }
+        # Back to back solves (including different recursion depths) reuse the same workspace
+        for origin_id, target_tree_depth in [
+            (5, None),
+            ({3, 40}, 1),
+            (79, None),
+        ]:
+            realized = reused.solve(
+                origin_id, target_tree_depth=target_tree_depth
+            )
+            expected = Bmssp(
+                graph,
+                use_constant_degree_graph=use_constant_degree_graph,
+                weight_mode=weight_mode,
+            ).solve(origin_id, target_tree_depth=target_tree_depth)
+            if realized != expected:
+                failed = True
+        # Earlier outputs must not be changed by later solves
+        if first_output != first_output_copy:
+            failed = True
+        if len(reused._workspaces) != 1:
+            failed = True
+if failed:
+    print("BMSSP Workspace Reuse Test: FAIL")
+else:
+    print("BMSSP Workspace Reuse Test: PASS")
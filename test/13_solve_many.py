@@ -0,0 +1,35 @@
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_random_graph
+
+print("\n===============\nBMSSP Solve Many Tests:\n===============")
+
+graph = make_random_graph(60, 200, 3)
+
+failed = False
+for weight_mode in ["decimal", "integer", "lexicographic"]:
+    bmssp_graph = Bmssp(graph, weight_mode=weight_mode)
+    origin_ids = [0, 4, {2, 9}, 33]
+    destination_ids = [5, None, 40, 33]
+    # Results are yielded lazily in order
+    results = bmssp_graph.solve_many(origin_ids)
+    if next(results) != bmssp_graph.solve(0):
+        failed = True
+    if list(results) != [bmssp_graph.solve(i) for i in origin_ids[1:]]:
+        failed = True
+    if list(bmssp_graph.solve_many(origin_ids, destination_ids)) != [
+        bmssp_graph.solve(origin_id, destination_id)
+        for origin_id, destination_id in zip(origin_ids, destination_ids)
+    ]:
+        failed = True
+if failed:
+    print("BMSSP Solve Many Parity Test: FAIL")
+else:
+    print("BMSSP Solve Many Parity Test: PASS")
+
+# Mismatched origin and destination lengths should raise an error
+try:
+    list(Bmssp(graph).solve_many([0, 1], [2]))
+    print("BMSSP Solve Many Length Check Test: FAIL")
+except ValueError:
+    print("BMSSP Solve Many Length Check Test: PASS")
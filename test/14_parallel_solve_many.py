@@ -0,0 +1,35 @@
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_random_graph
+
+if __name__ == "__main__":
+    print(
+        "\n===============\nBMSSP Parallel Solve Many Tests:\n==============="
+    )
+
+    graph = make_random_graph(60, 200, 4)
+
+    failed = False
+    for weight_mode in ["decimal", "integer", "lexicographic"]:
+        bmssp_graph = Bmssp(graph, weight_mode=weight_mode)
+        origin_ids = list(range(0, 60, 6))
+        destination_ids = [None, 7, None, 12, None, 30, None, 2, 3, None]
+        expected = list(bmssp_graph.solve_many(origin_ids, destination_ids))
+        realized = list(
+            bmssp_graph.solve_many(
+                origin_ids, destination_ids, processes=2, chunk_size=3
+            )
+        )
+        if realized != expected:
+            failed = True
+        realized = list(
+            bmssp_graph.solve_many(origin_ids, processes=2, ordered=False)
+        )
+        if sorted(realized, key=lambda output: output["origin_id"]) != list(
+            bmssp_graph.solve_many(origin_ids)
+        ):
+            failed = True
+    if failed:
+        print("BMSSP Parallel Solve Many Test: FAIL")
+    else:
+        print("BMSSP Parallel Solve Many Test: PASS")
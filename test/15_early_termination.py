@@ -0,0 +1,66 @@
+# General Imports
+import random
+
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_random_graph
+
+print("\n===============\nBMSSP Early Termination Tests:\n===============")
+
+failed = False
+for seed in range(20):
+    graph = make_random_graph(
+        80,
+        240,
+        seed,
+        get_weight=lambda: random.choice(
+            [0, 1, 2, round(random.random() * 5, 3)]
+        ),
+    )
+    for weight_mode in ["decimal", "integer", "lexicographic"]:
+        for use_constant_degree_graph in [True, False]:
+            bmssp_graph = Bmssp(
+                graph,
+                use_constant_degree_graph=use_constant_degree_graph,
+                weight_mode=weight_mode,
+            )
+            for origin_id, destination_id in [(1, 9), (40, 3), ({2, 60}, 79)]:
+                expected = bmssp_graph.solve(origin_id, destination_id)
+                realized = bmssp_graph.solve(
+                    origin_id, destination_id, early_termination=True
+                )
+                if (expected["path"], expected["length"]) != (
+                    realized["path"],
+                    realized["length"],
+                ):
+                    failed = True
+                # Nodes closer than the destination keep their final values and all others are unreached
+                for node_idx in range(80):
+                    distance = realized["distance_matrix"][node_idx]
+                    if distance == float("inf"):
+                        if (
+                            realized["predecessor"][node_idx] != -1
+                            or expected["distance_matrix"][node_idx]
+                            < expected["length"]
+                        ):
+                            failed = True
+                    elif (
+                        distance != expected["distance_matrix"][node_idx]
+                        or realized["predecessor"][node_idx]
+                        != expected["predecessor"][node_idx]
+                    ):
+                        failed = True
+if failed:
+    print("BMSSP Early Termination Parity Test: FAIL")
+else:
+    print("BMSSP Early Termination Parity Test: PASS")
+
+# A short trip on a long chain should not touch the rest of the graph
+chain_graph = [{idx + 1: 1} for idx in range(9999)] + [{}]
+output = Bmssp(chain_graph, use_constant_degree_graph=False).solve(
+    0, 5, early_termination=True
+)
+if output["length"] == 5 and output["distance_matrix"][5000] == float("inf"):
+    print("BMSSP Early Termination Search Ball Test: PASS")
+else:
+    print("BMSSP Early Termination Search Ball Test: FAIL")
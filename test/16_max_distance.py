@@ -0,0 +1,73 @@
+# General Imports
+import random
+
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_random_graph
+
+print("\n===============\nBMSSP Max Distance Tests:\n===============")
+
+failed = False
+for seed in range(10):
+    graph = make_random_graph(
+        120,
+        360,
+        seed,
+        get_weight=lambda: random.choice(
+            [0, 1, 2, round(random.random() * 5, 3)]
+        ),
+        ring=False,
+    )
+    for weight_mode in ["decimal", "integer", "lexicographic"]:
+        for use_constant_degree_graph in [True, False]:
+            bmssp_graph = Bmssp(
+                graph,
+                use_constant_degree_graph=use_constant_degree_graph,
+                weight_mode=weight_mode,
+            )
+            expected = bmssp_graph.solve(0)
+            distances = sorted(
+                distance
+                for distance in expected["distance_matrix"]
+                if distance != float("inf")
+            )
+            # Include bounds that fall exactly on a node distance
+            for max_distance in [0, 1.5, distances[len(distances) // 2], 1000]:
+                realized = bmssp_graph.solve(0, max_distance=max_distance)
+                expected_node_ids = {
+                    node_idx
+                    for node_idx, distance in enumerate(
+                        expected["distance_matrix"]
+                    )
+                    if distance <= max_distance
+                }
+                if set(realized["distance_matrix"]) != expected_node_ids:
+                    failed = True
+                for node_idx in expected_node_ids:
+                    if (
+                        realized["distance_matrix"][node_idx]
+                        != expected["distance_matrix"][node_idx]
+                        or realized["predecessor"][node_idx]
+                        != expected["predecessor"][node_idx]
+                    ):
+                        failed = True
+if failed:
+    print("BMSSP Max Distance Parity Test: FAIL")
+else:
+    print("BMSSP Max Distance Parity Test: PASS")
+
+# A bounded solve on a long chain should only return the nodes within the bound
+chain_graph = [{idx + 1: 1} for idx in range(9999)] + [{}]
+bmssp_graph = Bmssp(chain_graph, use_constant_degree_graph=False)
+within = bmssp_graph.solve(0, 5, max_distance=5)
+outside = bmssp_graph.solve(0, 6, max_distance=5)
+if (
+    within["distance_matrix"] == {idx: float(idx) for idx in range(6)}
+    and within["path"] == [0, 1, 2, 3, 4, 5]
+    and within["length"] == 5
+    and outside["path"] is None
+    and outside["length"] == float("inf")
+):
+    print("BMSSP Max Distance Search Ball Test: PASS")
+else:
+    print("BMSSP Max Distance Search Ball Test: FAIL")
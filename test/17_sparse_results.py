@@ -0,0 +1,85 @@
+# General Imports
+import pickle
+import random
+
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_random_graph
+from bmsspy.helpers.sparse import SparseArray
+
+print("\n===============\nBMSSP Sparse Result Tests:\n===============")
+
+failed = False
+for seed in range(10):
+    graph = make_random_graph(
+        120,
+        240,
+        seed,
+        get_weight=lambda: random.choice(
+            [0, 1, 2, round(random.random() * 5, 3)]
+        ),
+        ring=False,
+    )
+    for weight_mode in ["decimal", "integer", "lexicographic"]:
+        for use_constant_degree_graph in [True, False]:
+            bmssp_graph = Bmssp(
+                graph,
+                use_constant_degree_graph=use_constant_degree_graph,
+                weight_mode=weight_mode,
+            )
+            for origin_id in [0, {5, 60}]:
+                expected = bmssp_graph.solve(origin_id)
+                realized = bmssp_graph.solve(origin_id, sparse=True)
+                if (
+                    realized["distance_matrix"].to_list()
+                    != expected["distance_matrix"]
+                    or realized["predecessor"].to_list()
+                    != expected["predecessor"]
+                    or any(
+                        distance == float("inf")
+                        for distance in realized["distance_matrix"].values()
+                    )
+                ):
+                    failed = True
+if failed:
+    print("BMSSP Sparse Result Parity Test: FAIL")
+else:
+    print("BMSSP Sparse Result Parity Test: PASS")
+
+# Missing nodes use the dense defaults and out of range nodes raise an error
+sparse_array = SparseArray({1: 2.0}, default=float("inf"), size=3)
+try:
+    sparse_array[3]
+    out_of_range_raised = False
+except IndexError:
+    out_of_range_raised = True
+if (
+    sparse_array[0] == float("inf")
+    and sparse_array[1] == 2.0
+    and 0 not in sparse_array
+    and len(sparse_array) == 1
+    and sparse_array.to_list() == [float("inf"), 2.0, float("inf")]
+    and pickle.loads(pickle.dumps(sparse_array)).to_list()
+    == sparse_array.to_list()
+    and out_of_range_raised
+):
+    print("BMSSP Sparse Array Test: PASS")
+else:
+    print("BMSSP Sparse Array Test: FAIL")
+
+# A local query on a long chain should only store the reached nodes
+chain_graph = [{idx + 1: 1} for idx in range(9999)] + [{}]
+output = Bmssp(chain_graph, use_constant_degree_graph=False).solve(
+    9990, 9995, sparse=True
+)
+if (
+    len(output["distance_matrix"]) == 10
+    and len(output["predecessor"]) == 10
+    and output["distance_matrix"][0] == float("inf")
+    and output["predecessor"][0] == -1
+    and output["path"] == [9990, 9991, 9992, 9993, 9994, 9995]
+    and output["length"] == 5
+):
+    print("BMSSP Sparse Result Search Ball Test: PASS")
+else:
+    print("BMSSP Sparse Result Search Ball Test: FAIL")
@@ -0,0 +1,72 @@
+# General Imports
+import random
+
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_random_graph
+from bmsspy.helpers.utils import reconstruct_path
+
+print("\n===============\nBMSSP Solve Nearest Tests:\n===============")
+
+failed = False
+for seed in range(10):
+    graph = make_random_graph(
+        150,
+        400,
+        seed,
+        get_weight=lambda: random.choice(
+            [0, 1, 2, round(random.random() * 5, 3)]
+        ),
+        ring=False,
+    )
+    target_ids = random.sample(range(150), 20)
+    for weight_mode in ["decimal", "integer", "lexicographic"]:
+        for use_constant_degree_graph in [True, False]:
+            bmssp_graph = Bmssp(
+                graph,
+                use_constant_degree_graph=use_constant_degree_graph,
+                weight_mode=weight_mode,
+            )
+            for origin_id in [0, {3, 77}]:
+                expected = bmssp_graph.solve(origin_id)
+                expected_lengths = sorted(
+                    expected["distance_matrix"][target_id]
+                    for target_id in target_ids
+                    if expected["distance_matrix"][target_id] != float("inf")
+                )
+                for k in [1, 3, 7, 25]:
+                    realized = bmssp_graph.solve_nearest(
+                        origin_id, target_ids, k
+                    )
+                    if [
+                        output["length"] for output in realized
+                    ] != expected_lengths[:k]:
+                        failed = True
+                    for output in realized:
+                        if output["path"] != reconstruct_path(
+                            output["destination_id"], expected["predecessor"]
+                        ):
+                            failed = True
+if failed:
+    print("BMSSP Solve Nearest Parity Test: FAIL")
+else:
+    print("BMSSP Solve Nearest Parity Test: PASS")
+
+# The closest targets on a long chain should be found without solving the rest of the chain
+chain_graph = [{idx + 1: 1} for idx in range(9999)] + [{}]
+bmssp_graph = Bmssp(chain_graph, use_constant_degree_graph=False)
+output = bmssp_graph.solve_nearest(
+    10, [9000, 15, 5, 12, 30], k=2, return_paths=False
+)
+touched_nodes = bmssp_graph._workspaces[0].touched_nodes
+if (
+    output
+    == [
+        {"destination_id": 12, "length": 2.0, "path": None},
+        {"destination_id": 15, "length": 5.0, "path": None},
+    ]
+    and len(touched_nodes) < 100
+):
+    print("BMSSP Solve Nearest Search Ball Test: PASS")
+else:
+    print("BMSSP Solve Nearest Search Ball Test: FAIL")
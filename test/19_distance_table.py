@@ -0,0 +1,60 @@
+# General Imports
+import random
+
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_random_graph
+
+if __name__ == "__main__":
+    print("\n===============\nBMSSP Distance Table Tests:\n===============")
+
+    failed = False
+    parallel_failed = False
+    for seed in range(8):
+        graph = make_random_graph(
+            150,
+            350,
+            seed,
+            get_weight=lambda: random.choice(
+                [0, 1, 2, round(random.random() * 5, 3)]
+            ),
+            ring=False,
+        )
+        for weight_mode in ["decimal", "integer", "lexicographic"]:
+            for use_constant_degree_graph in [True, False]:
+                bmssp_graph = Bmssp(
+                    graph,
+                    use_constant_degree_graph=use_constant_degree_graph,
+                    weight_mode=weight_mode,
+                )
+                # Include repeated origins and destinations
+                origin_ids = random.sample(range(150), 6) + [3, 3]
+                destination_ids = random.sample(range(150), 9) + [3]
+                realized = bmssp_graph.distance_table(
+                    origin_ids, destination_ids
+                )
+                for origin_id, row in zip(origin_ids, realized, strict=True):
+                    expected = bmssp_graph.solve(origin_id)["distance_matrix"]
+                    if list(row) != [
+                        float(expected[destination_id])
+                        for destination_id in destination_ids
+                    ]:
+                        failed = True
+                if realized[-1] is realized[-2]:
+                    failed = True
+                if seed == 0:
+                    parallel_realized = bmssp_graph.distance_table(
+                        origin_ids, destination_ids, processes=2, chunk_size=2
+                    )
+                    if [list(row) for row in parallel_realized] != [
+                        list(row) for row in realized
+                    ]:
+                        parallel_failed = True
+    if failed:
+        print("BMSSP Distance Table Parity Test: FAIL")
+    else:
+        print("BMSSP Distance Table Parity Test: PASS")
+    if parallel_failed:
+        print("BMSSP Distance Table Parallel Test: FAIL")
+    else:
+        print("BMSSP Distance Table Parallel Test: PASS")
@@ -0,0 +1,80 @@
+# General Imports
+import random
+
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_random_graph
+
+print("\n===============\nBMSSP Origin Offset Tests:\n===============")
+
+# Solving with origin offsets should match adding a super source with an edge of length offset to each origin
+failed = False
+for seed in range(10):
+    graph = make_random_graph(
+        120,
+        300,
+        seed,
+        get_weight=lambda: round(random.random() * 5 + 0.001, 3),
+        ring=False,
+    )
+    # Include repeated offsets and offsets larger than the shortest distance from another origin
+    origin_offsets = {
+        origin_idx: random.choice([0, 3, round(random.random() * 6, 3)])
+        for origin_idx in random.sample(range(120), 5)
+    }
+    super_source_graph = [dict(neighbors) for neighbors in graph] + [
+        dict(origin_offsets)
+    ]
+    for weight_mode in ["decimal", "integer", "lexicographic"]:
+        for use_constant_degree_graph in [True, False]:
+            expected = Bmssp(
+                super_source_graph,
+                use_constant_degree_graph=use_constant_degree_graph,
+                weight_mode=weight_mode,
+            ).solve(120)
+            realized = Bmssp(
+                graph,
+                use_constant_degree_graph=use_constant_degree_graph,
+                weight_mode=weight_mode,
+            ).solve(origin_offsets)
+            for realized_distance, expected_distance in zip(
+                realized["distance_matrix"], expected["distance_matrix"][:120]
+            ):
+                if (
+                    realized_distance != expected_distance
+                    and abs(realized_distance - expected_distance) > 1e-9
+                ):
+                    failed = True
+            if realized["predecessor"] != [
+                -1 if predecessor == 120 else predecessor
+                for predecessor in expected["predecessor"][:120]
+            ]:
+                failed = True
+if failed:
+    print("BMSSP Origin Offset Parity Test: FAIL")
+else:
+    print("BMSSP Origin Offset Parity Test: PASS")
+
+# Origins with the same offset (eg: a set of origins) must not tie with each other
+failed = False
+for seed in range(10):
+    graph = make_random_graph(
+        120,
+        300,
+        seed,
+        get_weight=lambda: round(random.random() * 5 + 0.001, 3),
+        ring=False,
+    )
+    origin_ids = set(random.sample(range(120), 5))
+    super_source_graph = [dict(neighbors) for neighbors in graph] + [
+        dict.fromkeys(origin_ids, 0)
+    ]
+    for weight_mode in ["decimal", "integer", "lexicographic"]:
+        expected = Bmssp(super_source_graph, weight_mode=weight_mode).solve(120)
+        realized = Bmssp(graph, weight_mode=weight_mode).solve(origin_ids)
+        if realized["distance_matrix"] != expected["distance_matrix"][:120]:
+            failed = True
+if failed:
+    print("BMSSP Multiple Origin Tie Test: FAIL")
+else:
+    print("BMSSP Multiple Origin Tie Test: PASS")
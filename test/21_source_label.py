@@ -0,0 +1,80 @@
+# General Imports
+import random
+
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_random_graph
+
+print("\n===============\nBMSSP Source Label Tests:\n===============")
+
+
+def get_chain_source(node_id, predecessor):
+    # Walk the predecessor chain back to the origin that the path starts from
+    while predecessor[node_id] != -1:
+        node_id = predecessor[node_id]
+    return node_id
+
+
+# Each label should be the origin found by walking the predecessor chain back from the node
+failed = False
+for seed in range(10):
+    graph = make_random_graph(
+        150,
+        350,
+        seed,
+        get_weight=lambda: random.choice(
+            [0, 1, 2, round(random.random() * 5, 3)]
+        ),
+        ring=False,
+    )
+    origin_ids = set(random.sample(range(150), 6))
+    origin_offsets = {
+        origin_idx: random.choice([0, 2]) for origin_idx in origin_ids
+    }
+    for weight_mode in ["decimal", "integer", "lexicographic"]:
+        for use_constant_degree_graph in [True, False]:
+            bmssp_graph = Bmssp(
+                graph,
+                use_constant_degree_graph=use_constant_degree_graph,
+                weight_mode=weight_mode,
+            )
+            for origin_id in [7, origin_ids, origin_offsets]:
+                output = bmssp_graph.solve(origin_id, source_label=True)
+                expected_source_label = [
+                    (
+                        get_chain_source(node_id, output["predecessor"])
+                        if distance != float("inf")
+                        else -1
+                    )
+                    for node_id, distance in enumerate(
+                        output["distance_matrix"]
+                    )
+                ]
+                if output["source_label"] != expected_source_label:
+                    failed = True
+                if (
+                    output["distance_matrix"]
+                    != bmssp_graph.solve(origin_id)["distance_matrix"]
+                ):
+                    failed = True
+if failed:
+    print("BMSSP Source Label Parity Test: FAIL")
+else:
+    print("BMSSP Source Label Parity Test: PASS")
+
+# Labels should follow the sparse and max_distance outputs
+chain_graph = [{idx + 1: 1, idx - 1: 1} for idx in range(1, 99)]
+chain_graph = [{1: 1}] + chain_graph + [{98: 1}]
+bmssp_graph = Bmssp(chain_graph, use_constant_degree_graph=False)
+dense_output = bmssp_graph.solve({10, 51}, source_label=True)
+bounded_output = bmssp_graph.solve({10, 51}, max_distance=3, source_label=True)
+if (
+    dense_output["source_label"] == [10] * 31 + [51] * 69
+    and dict(bounded_output["source_label"])
+    == {idx: 10 for idx in range(7, 14)} | {idx: 51 for idx in range(48, 55)}
+    and bounded_output["source_label"][0] == -1
+    and "source_label" not in bmssp_graph.solve(10)
+):
+    print("BMSSP Source Label Sparse Test: PASS")
+else:
+    print("BMSSP Source Label Sparse Test: FAIL")
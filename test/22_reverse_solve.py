@@ -0,0 +1,93 @@
+# General Imports
+import os
+import random
+import tempfile
+
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_random_graph
+
+print("\n===============\nBMSSP Reverse Solve Tests:\n===============")
+
+# Reverse solves should match forward solves on a manually reversed graph
+failed = False
+for seed in range(8):
+    graph = make_random_graph(
+        120,
+        300,
+        seed,
+        get_weight=lambda: random.choice(
+            [0, 1, 2, round(random.random() * 5, 3)]
+        ),
+        ring=False,
+    )
+    reversed_graph = [{} for _ in range(120)]
+    for origin_idx, neighbors in enumerate(graph):
+        for destination_idx, weight in neighbors.items():
+            reversed_graph[destination_idx][origin_idx] = weight
+    for weight_mode in ["decimal", "integer", "lexicographic"]:
+        for use_constant_degree_graph in [True, False]:
+            bmssp_graph = Bmssp(
+                graph,
+                use_constant_degree_graph=use_constant_degree_graph,
+                weight_mode=weight_mode,
+            )
+            reversed_bmssp_graph = Bmssp(
+                reversed_graph,
+                use_constant_degree_graph=use_constant_degree_graph,
+                weight_mode=weight_mode,
+            )
+            for origin_id in [0, 55, {3, 90}]:
+                realized = bmssp_graph.solve(origin_id, direction="reverse")
+                expected = reversed_bmssp_graph.solve(origin_id)
+                if (
+                    realized["distance_matrix"] != expected["distance_matrix"]
+                    or realized["predecessor"] != expected["predecessor"]
+                ):
+                    failed = True
+                # Each reverse distance is the forward distance from that node to the origin
+                if origin_id == 0:
+                    for node_id in random.sample(range(120), 5):
+                        forward_distance = bmssp_graph.solve(node_id)[
+                            "distance_matrix"
+                        ][0]
+                        if forward_distance != realized["distance_matrix"][
+                            node_id
+                        ] and (
+                            abs(
+                                forward_distance
+                                - realized["distance_matrix"][node_id]
+                            )
+                            > 1e-9
+                        ):
+                            failed = True
+if failed:
+    print("BMSSP Reverse Solve Parity Test: FAIL")
+else:
+    print("BMSSP Reverse Solve Parity Test: PASS")
+
+# The reversed graph is built once, shared by solve_many and available for loaded graphs
+graph = [{1: 1, 2: 4}, {2: 1}, {3: 1}, {}]
+bmssp_graph = Bmssp(graph)
+reverse_bmssp_graph = bmssp_graph.reverse
+many_outputs = list(bmssp_graph.solve_many([3, 2], [0, 0], direction="reverse"))
+with tempfile.TemporaryDirectory() as temp_dir:
+    path = os.path.join(temp_dir, "graph.bmssp")
+    bmssp_graph.save(path)
+    loaded_output = Bmssp.load(path).solve(3, 0, direction="reverse")
+try:
+    bmssp_graph.solve(0, direction="backward")
+    direction_raised = False
+except ValueError:
+    direction_raised = True
+if (
+    bmssp_graph.reverse is reverse_bmssp_graph
+    and reverse_bmssp_graph.reverse is bmssp_graph
+    and [output["length"] for output in many_outputs] == [3, 2]
+    and [output["path"] for output in many_outputs] == [[3, 2, 1, 0], [2, 1, 0]]
+    and loaded_output["distance_matrix"] == many_outputs[0]["distance_matrix"]
+    and direction_raised
+):
+    print("BMSSP Reverse Solve Cache Test: PASS")
+else:
+    print("BMSSP Reverse Solve Cache Test: FAIL")
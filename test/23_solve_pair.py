@@ -0,0 +1,88 @@
+# General Imports
+import random
+
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_random_graph
+from bmsspy.bidirectional import BidirectionalCore
+
+print("\n===============\nBMSSP Solve Pair Tests:\n===============")
+
+# Bidirectional solves should return the same path and length as forward solves
+failed = False
+for seed in range(8):
+    graph = make_random_graph(
+        150,
+        400,
+        seed,
+        get_weight=lambda: random.choice(
+            [0, 1, 2, round(random.random() * 5, 3)]
+        ),
+        ring=False,
+    )
+    for weight_mode in ["decimal", "integer", "lexicographic"]:
+        for use_constant_degree_graph in [True, False]:
+            bmssp_graph = Bmssp(
+                graph,
+                use_constant_degree_graph=use_constant_degree_graph,
+                weight_mode=weight_mode,
+            )
+            origin_id = random.randrange(150)
+            expected = bmssp_graph.solve(origin_id)
+            for destination_id in random.sample(range(150), 10) + [origin_id]:
+                if expected["distance_matrix"][destination_id] == float("inf"):
+                    continue
+                expected_pair = bmssp_graph.solve(origin_id, destination_id)
+                realized = bmssp_graph.solve_pair(origin_id, destination_id)
+                if (
+                    realized["path"] != expected_pair["path"]
+                    or realized["length"] != expected_pair["length"]
+                ):
+                    failed = True
+
+if failed:
+    print("BMSSP Solve Pair Parity Test: FAIL")
+else:
+    print("BMSSP Solve Pair Parity Test: PASS")
+
+# The transposed graph is built once and disconnected nodes raise an error
+graph = [{1: 1, 2: 4}, {2: 1}, {3: 1}, {}, {}]
+bmssp_graph = Bmssp(graph)
+output = bmssp_graph.solve_pair(0, 3)
+reverse_csr_graph = bmssp_graph._reverse_csr_graph
+bmssp_graph.solve_pair(1, 3)
+try:
+    bmssp_graph.solve_pair(0, 4)
+    disconnected_raised = False
+except Exception:
+    disconnected_raised = True
+if (
+    output
+    == {"origin_id": 0, "destination_id": 3, "path": [0, 1, 2, 3], "length": 3}
+    and bmssp_graph._reverse_csr_graph is reverse_csr_graph
+    and disconnected_raised
+):
+    print("BMSSP Solve Pair Cache Test: PASS")
+else:
+    print("BMSSP Solve Pair Cache Test: FAIL")
+
+# A query on a long chain should only settle the nodes between the origin and destination
+chain_graph = [{idx + 1: 1, idx - 1: 1} for idx in range(1, 9999)]
+chain_graph = [{1: 1}] + chain_graph + [{9998: 1}]
+bmssp_graph = Bmssp(chain_graph, use_constant_degree_graph=False)
+output = bmssp_graph.solve_pair(5000, 5010)
+solver = BidirectionalCore(
+    graph=bmssp_graph.csr_graph,
+    reverse_graph=bmssp_graph._get_reverse_csr_graph(),
+    origin_id=5000,
+    destination_id=5010,
+)
+if (
+    output["path"] == list(range(5000, 5011))
+    and output["length"] == 10
+    and not solver.is_tie_unresolved
+    and solver.settled_count < 40
+):
+    print("BMSSP Solve Pair Search Ball Test: PASS")
+else:
+    print("BMSSP Solve Pair Search Ball Test: FAIL")
@@ -0,0 +1,103 @@
+# General Imports
+import os
+import random
+import tempfile
+
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_grid_graph, make_random_graph
+from bmsspy.astar import AStarCore
+
+print("\n===============\nBMSSP Landmark Tests:\n===============")
+
+# Landmark (ALT) solves should return the same path and length as forward solves
+failed = False
+for seed in range(8):
+    graph = make_random_graph(
+        150,
+        400,
+        seed,
+        get_weight=lambda: random.choice(
+            [0, 1, 2, round(random.random() * 5, 3)]
+        ),
+        ring=False,
+    )
+    for weight_mode in ["decimal", "integer", "lexicographic"]:
+        for use_constant_degree_graph in [True, False]:
+            bmssp_graph = Bmssp(
+                graph,
+                use_constant_degree_graph=use_constant_degree_graph,
+                weight_mode=weight_mode,
+            )
+            bmssp_graph.build_landmarks(num_landmarks=4)
+            origin_id = random.randrange(150)
+            expected = bmssp_graph.solve(origin_id)
+            for destination_id in random.sample(range(150), 10) + [origin_id]:
+                if expected["distance_matrix"][destination_id] == float("inf"):
+                    continue
+                expected_pair = bmssp_graph.solve(origin_id, destination_id)
+                realized = bmssp_graph.solve_pair(origin_id, destination_id)
+                if (
+                    realized["path"] != expected_pair["path"]
+                    or realized["length"] != expected_pair["length"]
+                ):
+                    failed = True
+if failed:
+    print("BMSSP Landmark Parity Test: FAIL")
+else:
+    print("BMSSP Landmark Parity Test: PASS")
+
+# Landmark tables are float32, persist with the graph and prune the search on long queries
+random.seed(0)
+grid_size = 40
+grid_graph = make_grid_graph(
+    grid_size, lambda: round(random.random() * 5 + 1, 3)
+)
+bmssp_graph = Bmssp(grid_graph, use_constant_degree_graph=False)
+origin_id, destination_id = 0, grid_size**2 - 1
+expected = bmssp_graph.solve(origin_id, destination_id)
+bmssp_graph.build_landmarks(num_landmarks=4)
+solver = AStarCore(
+    graph=bmssp_graph.csr_graph,
+    reverse_graph=bmssp_graph._get_reverse_csr_graph(),
+    origin_id=origin_id,
+    destination_id=destination_id,
+    heuristic=bmssp_graph._get_landmark_heuristic(destination_id),
+)
+with tempfile.TemporaryDirectory() as temp_dir:
+    path = os.path.join(temp_dir, "graph.bmssp")
+    bmssp_graph.save(path)
+    loaded_graph = Bmssp.load(path)
+    loaded_output = loaded_graph.solve_pair(origin_id, destination_id)
+    loaded_landmark_ids = list(loaded_graph._landmarks["ids"])
+if (
+    bmssp_graph._landmarks["forward"].typecode == "f"
+    and len(bmssp_graph._landmarks["forward"]) == 4 * grid_size**2
+    and len(set(bmssp_graph._landmarks["ids"])) == 4
+    and loaded_landmark_ids == list(bmssp_graph._landmarks["ids"])
+    and loaded_output["path"] == expected["path"]
+    and loaded_output["length"] == expected["length"]
+    and solver.settled_count < grid_size**2 / 4
+):
+    print("BMSSP Landmark Table Test: PASS")
+else:
+    print("BMSSP Landmark Table Test: FAIL")
+
+# Landmarks prove that disconnected destinations can not be reached without searching
+disconnected_graph = [{1: 1}, {0: 1}, {3: 1}, {2: 1}]
+bmssp_graph = Bmssp(disconnected_graph)
+bmssp_graph.build_landmarks(num_landmarks=2)
+try:
+    bmssp_graph.solve_pair(0, 3)
+    disconnected_raised = False
+except Exception:
+    disconnected_raised = True
+if disconnected_raised and sorted(bmssp_graph._landmarks["ids"]) in [
+    [0, 2],
+    [0, 3],
+    [1, 2],
+    [1, 3],
+]:
+    print("BMSSP Landmark Disconnected Test: PASS")
+else:
+    print("BMSSP Landmark Disconnected Test: FAIL")
@@ -0,0 +1,126 @@
+# General Imports
+import os
+import random
+import tempfile
+
+# Local Imports
+from bmsspy import Bmssp
+from bmsspy.astar import AStarCore
+from bmsspy.helpers.coordinates import haversine_distance
+from helpers.random_graph import make_grid_graph
+
+print("\n===============\nBMSSP Coordinate Tests:\n===============")
+
+
+# Euclidean coordinate solves should return the same path and length as forward solves
+failed = False
+for seed in range(4):
+    random.seed(seed)
+    grid_size = 12
+    # Nodes are spaced 1 unit apart and every weight is at least 1
+    graph = make_grid_graph(grid_size, lambda: random.choice([1, 2, 3]))
+    coordinates = [
+        (row, col) for row in range(grid_size) for col in range(grid_size)
+    ]
+    for weight_mode in ["decimal", "integer", "lexicographic"]:
+        for use_constant_degree_graph in [True, False]:
+            bmssp_graph = Bmssp(
+                graph,
+                use_constant_degree_graph=use_constant_degree_graph,
+                weight_mode=weight_mode,
+            )
+            bmssp_graph.set_coordinates(coordinates, metric="euclidean")
+            origin_id = random.randrange(grid_size**2)
+            for destination_id in random.sample(range(grid_size**2), 10):
+                expected = bmssp_graph.solve(origin_id, destination_id)
+                realized = bmssp_graph.solve_pair(origin_id, destination_id)
+                if (
+                    realized["path"] != expected["path"]
+                    or realized["length"] != expected["length"]
+                ):
+                    failed = True
+if failed:
+    print("BMSSP Coordinate Euclidean Parity Test: FAIL")
+else:
+    print("BMSSP Coordinate Euclidean Parity Test: PASS")
+
+# Haversine coordinates (as geograph style dictionaries) with a declared scale prune the search
+random.seed(0)
+grid_size = 30
+# Nodes are spaced 0.1 degrees apart (up to ~11.1 km) and weights are travel times in hours up to 100 km/h
+coordinates = [
+    {"latitude": 40 + row * 0.1, "longitude": -75 + col * 0.1}
+    for row in range(grid_size)
+    for col in range(grid_size)
+]
+graph = [{} for _ in range(grid_size**2)]
+for row in range(grid_size):
+    for col in range(grid_size):
+        node_idx = row * grid_size + col
+        for row_step, col_step in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+            if (
+                0 <= row + row_step < grid_size
+                and 0 <= col + col_step < grid_size
+            ):
+                connection_idx = (row + row_step) * grid_size + col + col_step
+                distance = haversine_distance(
+                    coordinates[node_idx]["latitude"],
+                    coordinates[node_idx]["longitude"],
+                    coordinates[connection_idx]["latitude"],
+                    coordinates[connection_idx]["longitude"],
+                )
+                # Round up such that the rounded weight is never faster than 100 km/h
+                graph[node_idx][connection_idx] = (
+                    int(distance / random.choice([80, 90, 100]) * 10**5 + 1)
+                    / 10**5
+                )
+bmssp_graph = Bmssp(graph, use_constant_degree_graph=False, precision=5)
+bmssp_graph.set_coordinates(coordinates, metric="haversine", scale=1 / 100)
+# Queries along a row are where the straight line bound is tightest
+origin_id = grid_size // 2 * grid_size
+destination_id = origin_id + grid_size - 1
+expected = bmssp_graph.solve(origin_id, destination_id)
+solver = AStarCore(
+    graph=bmssp_graph.csr_graph,
+    reverse_graph=bmssp_graph._get_reverse_csr_graph(),
+    origin_id=origin_id,
+    destination_id=destination_id,
+    heuristic=bmssp_graph._get_pair_heuristic(destination_id),
+)
+realized = bmssp_graph.solve_pair(origin_id, destination_id)
+with tempfile.TemporaryDirectory() as temp_dir:
+    path = os.path.join(temp_dir, "graph.bmssp")
+    bmssp_graph.save(path)
+    loaded_graph = Bmssp.load(path)
+    loaded_output = loaded_graph.solve_pair(origin_id, destination_id)
+    loaded_coordinates = loaded_graph._coordinates
+if (
+    realized["path"] == expected["path"]
+    and realized["length"] == expected["length"]
+    and loaded_output["path"] == expected["path"]
+    and loaded_output["length"] == expected["length"]
+    and loaded_coordinates["metric"] == "haversine"
+    and loaded_coordinates["scale"] == 1 / 100
+    and list(loaded_coordinates["x"]) == list(bmssp_graph._coordinates["x"])
+    and solver.settled_count < grid_size**2 / 4
+):
+    print("BMSSP Coordinate Haversine Test: PASS")
+else:
+    print("BMSSP Coordinate Haversine Test: FAIL")
+
+# Invalid coordinate inputs raise errors
+bmssp_graph = Bmssp([{1: 1}, {}])
+raised = 0
+for kwargs in [
+    {"coordinates": [(0, 0)]},
+    {"coordinates": [(0, 0), (1, 0)], "metric": "manhattan"},
+    {"coordinates": [(0, 0), (1, 0)], "scale": -1},
+]:
+    try:
+        bmssp_graph.set_coordinates(**kwargs)
+    except ValueError:
+        raised += 1
+if raised == 3 and bmssp_graph._coordinates is None:
+    print("BMSSP Coordinate Input Test: PASS")
+else:
+    print("BMSSP Coordinate Input Test: FAIL")
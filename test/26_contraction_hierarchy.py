@@ -0,0 +1,126 @@
+# General Imports
+import os
+import random
+import tempfile
+
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_grid_graph, make_random_graph
+from bmsspy.contraction import ContractionHierarchyCore
+
+print("\n===============\nBMSSP Contraction Hierarchy Tests:\n===============")
+
+# Contraction hierarchy solves should return the same path and distances as BMSSP solves
+failed = False
+for seed in range(8):
+    graph = make_random_graph(
+        150,
+        400,
+        seed,
+        get_weight=lambda: random.choice(
+            [0, 1, 2, round(random.random() * 5, 3)]
+        ),
+        ring=False,
+    )
+    for weight_mode in ["decimal", "integer", "lexicographic"]:
+        for use_constant_degree_graph in [True, False]:
+            bmssp_graph = Bmssp(
+                graph,
+                use_constant_degree_graph=use_constant_degree_graph,
+                weight_mode=weight_mode,
+            )
+            origin_id = random.randrange(150)
+            expected = bmssp_graph.solve(origin_id)
+            for destination_id in random.sample(range(150), 10) + [origin_id]:
+                if expected["distance_matrix"][destination_id] == float("inf"):
+                    continue
+                expected_pair = bmssp_graph.solve(origin_id, destination_id)
+                realized = bmssp_graph.solve(
+                    origin_id, destination_id, engine="contraction_hierarchy"
+                )
+                if (
+                    realized["path"] != expected_pair["path"]
+                    or realized["length"] != expected_pair["length"]
+                    or any(
+                        realized["distance_matrix"][node_idx]
+                        != expected["distance_matrix"][node_idx]
+                        for node_idx in realized["path"]
+                    )
+                    or realized["predecessor"][destination_id]
+                    != expected_pair["predecessor"][destination_id]
+                ):
+                    failed = True
+            if (weight_mode == "lexicographic") != (
+                bmssp_graph._contraction_hierarchy is None
+            ):
+                failed = True
+if failed:
+    print("BMSSP Contraction Hierarchy Parity Test: FAIL")
+else:
+    print("BMSSP Contraction Hierarchy Parity Test: PASS")
+
+# The hierarchy persists with the graph and settles few nodes on long queries
+random.seed(0)
+grid_size = 30
+grid_graph = make_grid_graph(
+    grid_size, lambda: round(random.random() * 5 + 1, 3)
+)
+bmssp_graph = Bmssp(grid_graph, use_constant_degree_graph=False)
+bmssp_graph.build_contraction_hierarchy()
+queries = [(0, grid_size**2 - 1), (grid_size - 1, grid_size**2 - grid_size)]
+expected = [bmssp_graph.solve(*query) for query in queries]
+settled_counts = [
+    ContractionHierarchyCore(
+        graph=bmssp_graph.csr_graph,
+        hierarchy=bmssp_graph._contraction_hierarchy,
+        origin_id=origin_id,
+        destination_id=destination_id,
+    ).settled_count
+    for origin_id, destination_id in queries
+]
+with tempfile.TemporaryDirectory() as temp_dir:
+    path = os.path.join(temp_dir, "graph.bmssp")
+    bmssp_graph.save(path)
+    loaded_graph = Bmssp.load(path)
+    loaded_outputs = list(
+        loaded_graph.solve_many(*zip(*queries), engine="contraction_hierarchy")
+    )
+    loaded_edge_weights = loaded_graph._contraction_hierarchy["edge_weights"]
+if (
+    all(
+        loaded_output["path"] == expected_output["path"]
+        and loaded_output["length"] == expected_output["length"]
+        for loaded_output, expected_output in zip(loaded_outputs, expected)
+    )
+    and loaded_edge_weights
+    == bmssp_graph._contraction_hierarchy["edge_weights"]
+    and max(settled_counts) < grid_size**2 / 4
+):
+    print("BMSSP Contraction Hierarchy Storage Test: PASS")
+else:
+    print("BMSSP Contraction Hierarchy Storage Test: FAIL")
+
+# Invalid engines and queries raise errors
+bmssp_graph = Bmssp([{1: 1}, {}, {}])
+raised = 0
+for kwargs in [
+    {"origin_id": 0, "destination_id": 1, "engine": "hub_labels"},
+    {"origin_id": 0, "engine": "contraction_hierarchy"},
+    {
+        "origin_id": {0, 1},
+        "destination_id": 1,
+        "engine": "contraction_hierarchy",
+    },
+]:
+    try:
+        bmssp_graph.solve(**kwargs)
+    except ValueError:
+        raised += 1
+try:
+    bmssp_graph.solve(0, 2, engine="contraction_hierarchy")
+except Exception:
+    raised += 1
+if raised == 4:
+    print("BMSSP Contraction Hierarchy Input Test: PASS")
+else:
+    print("BMSSP Contraction Hierarchy Input Test: FAIL")
@@ -0,0 +1,109 @@
+# General Imports
+import math
+import os
+import random
+import tempfile
+
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_grid_graph, make_random_graph
+
+print("\n===============\nBMSSP Hub Label Tests:\n===============")
+
+# Hub label distances should match the distances of BMSSP solves
+failed = False
+for seed in range(4):
+    graph = make_random_graph(
+        100,
+        300,
+        seed,
+        get_weight=lambda: random.choice(
+            [0, 1, 2, round(random.random() * 5, 3)]
+        ),
+        ring=False,
+    )
+    for weight_mode in ["decimal", "integer", "lexicographic"]:
+        for use_constant_degree_graph in [True, False]:
+            bmssp_graph = Bmssp(
+                graph,
+                use_constant_degree_graph=use_constant_degree_graph,
+                weight_mode=weight_mode,
+            )
+            bmssp_graph.build_hub_labels(num_samples=4)
+            for origin_id in random.sample(range(100), 5):
+                expected = bmssp_graph.solve(origin_id)["distance_matrix"]
+                for destination_id in range(100):
+                    realized = bmssp_graph.solve_distance(
+                        origin_id, destination_id
+                    )
+                    if weight_mode == "lexicographic":
+                        if not math.isclose(realized, expected[destination_id]):
+                            failed = True
+                    elif realized != expected[destination_id]:
+                        failed = True
+if failed:
+    print("BMSSP Hub Label Parity Test: FAIL")
+else:
+    print("BMSSP Hub Label Parity Test: PASS")
+
+# Labels are sorted flat arrays that persist with the graph and report their size
+random.seed(0)
+grid_size = 15
+grid_graph = make_grid_graph(
+    grid_size, lambda: round(random.random() * 5 + 1, 3)
+)
+bmssp_graph = Bmssp(grid_graph)
+bmssp_graph.build_hub_labels()
+hub_labels = bmssp_graph._hub_labels
+memory_usage = bmssp_graph.get_hub_label_memory_usage()
+queries = [(0, grid_size**2 - 1), (grid_size - 1, grid_size**2 - grid_size)]
+expected = [bmssp_graph.solve(*query)["length"] for query in queries]
+with tempfile.TemporaryDirectory() as temp_dir:
+    path = os.path.join(temp_dir, "graph.bmssp")
+    bmssp_graph.save(path)
+    loaded_graph = Bmssp.load(path)
+    loaded_distances = [
+        loaded_graph.solve_distance(*query) for query in queries
+    ]
+    loaded_memory_usage = loaded_graph.get_hub_label_memory_usage()
+if (
+    all(
+        list(hub_labels[direction + "_hubs"][start:end])
+        == sorted(hub_labels[direction + "_hubs"][start:end])
+        for direction in ["out", "in"]
+        for start, end in zip(
+            hub_labels[direction + "_offsets"],
+            hub_labels[direction + "_offsets"][1:],
+        )
+    )
+    and hub_labels["out_distances"].typecode == "d"
+    and loaded_distances == expected
+    and loaded_memory_usage == memory_usage
+    and memory_usage["num_entries"]
+    == len(hub_labels["out_hubs"]) + len(hub_labels["in_hubs"])
+    and memory_usage["total_bytes"]
+    == sum(len(values) * values.itemsize for values in hub_labels.values())
+    and memory_usage["max_label_size"] < grid_size**2
+):
+    print("BMSSP Hub Label Storage Test: PASS")
+else:
+    print("BMSSP Hub Label Storage Test: FAIL")
+
+# Unreachable destinations have an inf distance and labels must be built first
+bmssp_graph = Bmssp([{1: 1}, {}, {}])
+try:
+    bmssp_graph.solve_distance(0, 1)
+    raised = False
+except ValueError:
+    raised = True
+bmssp_graph.build_hub_labels()
+if (
+    raised
+    and bmssp_graph.solve_distance(0, 1) == 1
+    and bmssp_graph.solve_distance(0, 0) == 0
+    and bmssp_graph.solve_distance(0, 2) == float("inf")
+    and bmssp_graph.solve_distance(1, 0) == float("inf")
+):
+    print("BMSSP Hub Label Input Test: PASS")
+else:
+    print("BMSSP Hub Label Input Test: FAIL")
@@ -0,0 +1,116 @@
+# General Imports
+import math
+import os
+import random
+import tempfile
+
+# Local Imports
+from bmsspy import Bmssp, AllPairs
+from helpers.random_graph import make_random_graph
+
+print("\n===============\nBMSSP All Pairs Tests:\n===============")
+
+graph = make_random_graph(
+    60,
+    180,
+    0,
+    get_weight=lambda: random.choice([0, 1, 2, round(random.random() * 5, 3)]),
+    ring=False,
+)
+
+# All pairs distances and paths should match BMSSP solves
+failed = False
+for weight_mode in ["decimal", "integer", "lexicographic"]:
+    for use_constant_degree_graph in [True, False]:
+        bmssp_graph = Bmssp(
+            graph,
+            use_constant_degree_graph=use_constant_degree_graph,
+            weight_mode=weight_mode,
+        )
+        all_pairs = bmssp_graph.all_pairs()
+        for origin_id in random.sample(range(60), 5):
+            expected = bmssp_graph.solve(origin_id)
+            for destination_id in range(60):
+                expected_distance = expected["distance_matrix"][destination_id]
+                if expected_distance == float("inf"):
+                    if (
+                        all_pairs.distance(origin_id, destination_id)
+                        != float("inf")
+                        or all_pairs.path(origin_id, destination_id) is not None
+                    ):
+                        failed = True
+                    continue
+                # Distances are stored as float32
+                if not math.isclose(
+                    all_pairs.distance(origin_id, destination_id),
+                    expected_distance,
+                    rel_tol=1e-6,
+                ) or all_pairs.path(origin_id, destination_id) != (
+                    bmssp_graph.solve(origin_id, destination_id)["path"]
+                ):
+                    failed = True
+if failed:
+    print("BMSSP All Pairs Parity Test: FAIL")
+else:
+    print("BMSSP All Pairs Parity Test: PASS")
+
+# Quantized oracles are saved to a memory mapped file
+bmssp_graph = Bmssp(graph)
+all_pairs = bmssp_graph.all_pairs()
+with tempfile.TemporaryDirectory() as temp_dir:
+    path = os.path.join(temp_dir, "all_pairs.bmssp")
+    quantized_all_pairs = bmssp_graph.all_pairs(path=path, quantize=True)
+    loaded_all_pairs = AllPairs.load(path)
+    pairs = [
+        (origin_id, destination_id)
+        for origin_id in range(60)
+        for destination_id in range(60)
+    ]
+    quantized_failed = any(
+        (
+            abs(loaded_all_pairs.distance(*pair) - all_pairs.distance(*pair))
+            > loaded_all_pairs.distance_step
+            if all_pairs.distance(*pair) != float("inf")
+            else loaded_all_pairs.distance(*pair) != float("inf")
+        )
+        for pair in pairs
+    ) or any(
+        loaded_all_pairs.path(*pair) != all_pairs.path(*pair) for pair in pairs
+    )
+    is_memory_mapped = isinstance(quantized_all_pairs.distances, memoryview)
+    try:
+        graph_path = os.path.join(temp_dir, "graph.bmssp")
+        Bmssp(graph).save(graph_path)
+        AllPairs.load(graph_path)
+        raised = False
+    except ValueError:
+        raised = True
+    del quantized_all_pairs, loaded_all_pairs
+if (
+    not quantized_failed
+    and is_memory_mapped
+    and raised
+    and all_pairs.distances.typecode == "f"
+):
+    print("BMSSP All Pairs Storage Test: PASS")
+else:
+    print("BMSSP All Pairs Storage Test: FAIL")
+
+# Oracles written row by row to a file should match oracles built in memory
+failed = False
+with tempfile.TemporaryDirectory() as temp_dir:
+    path = os.path.join(temp_dir, "all_pairs.bmssp")
+    for quantize in [False, True]:
+        expected = bmssp_graph.all_pairs(quantize=quantize)
+        realized = bmssp_graph.all_pairs(path=path, quantize=quantize)
+        if (
+            realized.distance_step != expected.distance_step
+            or list(realized.distances) != list(expected.distances)
+            or list(realized.predecessors) != list(expected.predecessors)
+        ):
+            failed = True
+        del realized
+if failed:
+    print("BMSSP All Pairs Streaming Test: FAIL")
+else:
+    print("BMSSP All Pairs Streaming Test: PASS")
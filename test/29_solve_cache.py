@@ -0,0 +1,182 @@
+# General Imports
+import random
+
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_random_graph
+
+print("\n===============\nBMSSP Solve Cache Tests:\n===============")
+
+graph = make_random_graph(
+    80,
+    240,
+    0,
+    get_weight=lambda: random.choice([0, 1, 2, round(random.random() * 5, 3)]),
+    ring=False,
+)
+
+# Cached solves (hits and misses) should match uncached solves
+failed = False
+origins = [0, 7, {3, 11}, {5: 0.5, 9: 0}, 0, {3, 11}, {5: 0.5, 9: 0}]
+for weight_mode in ["decimal", "integer", "lexicographic"]:
+    for use_constant_degree_graph in [True, False]:
+        bmssp_graph = Bmssp(
+            graph,
+            use_constant_degree_graph=use_constant_degree_graph,
+            weight_mode=weight_mode,
+        )
+        cached_graph = Bmssp(
+            graph,
+            use_constant_degree_graph=use_constant_degree_graph,
+            weight_mode=weight_mode,
+        )
+        cached_graph.set_solve_cache()
+        for origin_id in origins:
+            if cached_graph.solve(origin_id) != bmssp_graph.solve(origin_id):
+                failed = True
+            expected = bmssp_graph.solve(origin_id)
+            for destination_id in range(80):
+                if expected["distance_matrix"][destination_id] == float("inf"):
+                    continue
+                for early_termination in [True, False]:
+                    if cached_graph.solve(
+                        origin_id,
+                        destination_id,
+                        early_termination=early_termination,
+                    ) != bmssp_graph.solve(origin_id, destination_id):
+                        failed = True
+        if cached_graph.get_solve_cache_info()["misses"] != 4:
+            failed = True
+if failed:
+    print("BMSSP Solve Cache Parity Test: FAIL")
+else:
+    print("BMSSP Solve Cache Parity Test: PASS")
+
+# Unreachable destinations should raise from a cached solve
+bmssp_graph = Bmssp(graph)
+bmssp_graph.set_solve_cache()
+unreachable_ids = [
+    node_idx
+    for node_idx, distance in enumerate(bmssp_graph.solve(0)["distance_matrix"])
+    if distance == float("inf")
+]
+try:
+    bmssp_graph.solve(0, unreachable_ids[0])
+    print("BMSSP Solve Cache Unreachable Test: FAIL")
+except Exception:
+    print("BMSSP Solve Cache Unreachable Test: PASS")
+
+# Entries should be evicted (least recently used first) by their size in bytes
+bmssp_graph = Bmssp(graph)
+# Each entry stores an int32 predecessor and a float64 distance per node
+entry_bytes = 80 * (4 + 8)
+bmssp_graph.set_solve_cache(max_bytes=2 * entry_bytes)
+bmssp_graph.solve(0)
+bmssp_graph.solve(1)
+bmssp_graph.solve(0)
+bmssp_graph.solve(2)
+bmssp_graph.solve(0)
+info = bmssp_graph.get_solve_cache_info()
+if {
+    key: info[key]
+    for key in ["hits", "misses", "evictions", "entries", "bytes", "max_bytes"]
+} == {
+    "hits": 2,
+    "misses": 3,
+    "evictions": 1,
+    "entries": 2,
+    "bytes": 2 * entry_bytes,
+    "max_bytes": 2 * entry_bytes,
+}:
+    print("BMSSP Solve Cache Eviction Test: PASS")
+else:
+    print("BMSSP Solve Cache Eviction Test: FAIL")
+
+# Changing an edge weight in place should clear the cache
+failed = False
+for weight_mode in ["decimal", "integer", "lexicographic"]:
+    for use_constant_degree_graph in [True, False]:
+        bmssp_graph = Bmssp(
+            graph,
+            use_constant_degree_graph=use_constant_degree_graph,
+            weight_mode=weight_mode,
+        )
+        bmssp_graph.set_solve_cache()
+        path = bmssp_graph.solve(0, 4)["path"]
+        # Block the first edge of the shortest path
+        bmssp_graph.update_edge_weight(path[0], path[1], 1000)
+        changed_graph = [dict(neighbors) for neighbors in graph]
+        changed_graph[path[0]][path[1]] = 1000
+        expected = Bmssp(
+            changed_graph,
+            use_constant_degree_graph=use_constant_degree_graph,
+            weight_mode=weight_mode,
+        ).solve(0, 4)
+        if (
+            bmssp_graph.solve(0, 4) != expected
+            or expected["path"] == path
+            or bmssp_graph.get_solve_cache_info()["misses"] != 2
+            or bmssp_graph.get_solve_cache_info()["entries"] != 1
+        ):
+            failed = True
+if failed:
+    print("BMSSP Solve Cache Invalidation Test: FAIL")
+else:
+    print("BMSSP Solve Cache Invalidation Test: PASS")
+
+# Changed edge weights should match a graph built with the same weights
+failed = False
+# Add a self loop to a node with more than 2 edges such that it is partitioned in the constant degree graph
+self_loop_idx = next(
+    node_idx for node_idx, neighbors in enumerate(graph) if len(neighbors) > 2
+)
+changed_graph = [dict(neighbors) for neighbors in graph]
+changed_graph[self_loop_idx][self_loop_idx] = 1
+edges = [
+    (origin_idx, destination_idx)
+    for origin_idx, neighbors in enumerate(changed_graph)
+    for destination_idx in neighbors
+]
+for weight_mode in ["decimal", "integer", "lexicographic"]:
+    for use_constant_degree_graph in [True, False]:
+        bmssp_graph = Bmssp(
+            changed_graph,
+            use_constant_degree_graph=use_constant_degree_graph,
+            weight_mode=weight_mode,
+        )
+        expected_graph = [dict(neighbors) for neighbors in changed_graph]
+        for origin_idx, destination_idx in random.sample(edges, 40) + [
+            (self_loop_idx, self_loop_idx)
+        ]:
+            weight = random.choice([0, 1, round(random.random() * 5, 3)])
+            bmssp_graph.update_edge_weight(origin_idx, destination_idx, weight)
+            expected_graph[origin_idx][destination_idx] = weight
+        expected_bmssp_graph = Bmssp(
+            expected_graph,
+            use_constant_degree_graph=use_constant_degree_graph,
+            weight_mode=weight_mode,
+        )
+        if bmssp_graph.graph != expected_bmssp_graph.graph:
+            failed = True
+        for origin_id in random.sample(range(80), 5):
+            if bmssp_graph.solve(origin_id) != expected_bmssp_graph.solve(
+                origin_id
+            ):
+                failed = True
+            if bmssp_graph.solve(
+                origin_id, direction="reverse"
+            ) != expected_bmssp_graph.solve(origin_id, direction="reverse"):
+                failed = True
+# Edges that are not in the graph can not be changed
+missing_idx = next(
+    node_idx for node_idx in range(80) if node_idx not in changed_graph[1]
+)
+try:
+    bmssp_graph.update_edge_weight(1, missing_idx, 1)
+    failed = True
+except ValueError:
+    pass
+if failed:
+    print("BMSSP Update Edge Weight Test: FAIL")
+else:
+    print("BMSSP Update Edge Weight Test: PASS")
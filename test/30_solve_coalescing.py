@@ -0,0 +1,178 @@
+# General Imports
+import random
+import threading
+import time
+
+# Local Imports
+from bmsspy import Bmssp
+from helpers.random_graph import make_random_graph
+
+print("\n===============\nBMSSP Solve Coalescing Tests:\n===============")
+
+graph = make_random_graph(
+    200, 800, 0, get_weight=lambda: round(random.random() * 5, 3), ring=False
+)
+
+
+def run_burst(bmssp_graph, queries):
+    """
+    Run each query (a dictionary of solve arguments) in its own thread at the same time and return the results (or errors) in order.
+    """
+    barrier = threading.Barrier(len(queries))
+    results = [None] * len(queries)
+
+    def worker(query_idx, query):
+        barrier.wait()
+        try:
+            results[query_idx] = bmssp_graph.solve(**query)
+        except Exception as error:
+            results[query_idx] = error
+
+    threads = [
+        threading.Thread(target=worker, args=(query_idx, query))
+        for query_idx, query in enumerate(queries)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def slow_down_solves(bmssp_graph, delay=0.5):
+    """
+    Make every full solve take at least delay seconds such that concurrent solves overlap.
+    """
+    solve = bmssp_graph._solve
+
+    def slow_solve(**kwargs):
+        time.sleep(delay)
+        return solve(**kwargs)
+
+    bmssp_graph._solve = slow_solve
+
+
+# Concurrent solves for the same origin should share a single solve
+expected_graph = Bmssp(graph)
+expected = expected_graph.solve(0)
+destination_ids = [
+    destination_id
+    for destination_id in range(200)
+    if expected["distance_matrix"][destination_id] != float("inf")
+][:8]
+queries = (
+    [{"origin_id": 0, "destination_id": i} for i in destination_ids]
+    + [{"origin_id": 0}] * 4
+    + [{"origin_id": 1}] * 4
+)
+bmssp_graph = Bmssp(graph)
+bmssp_graph.set_solve_cache()
+slow_down_solves(bmssp_graph)
+results = run_burst(bmssp_graph, queries)
+cache_info = bmssp_graph.get_solve_cache_info()
+info = bmssp_graph.get_solve_coalescing_info()
+if (
+    all(
+        result == expected_graph.solve(**query)
+        for query, result in zip(queries, results)
+    )
+    and info == {"solves": 2, "coalesced": len(queries) - 2, "in_flight": 0}
+    and cache_info["misses"] == len(queries)
+    and cache_info["entries"] == 2
+):
+    print("BMSSP Solve Coalescing Test: PASS")
+else:
+    print("BMSSP Solve Coalescing Test: FAIL")
+
+# Concurrent solves should be shared without a solve cache
+queries = (
+    [{"origin_id": 0, "destination_id": i} for i in destination_ids]
+    + [{"origin_id": 0}] * 4
+    + [
+        {
+            "origin_id": 0,
+            "destination_id": destination_ids[-1],
+            "early_termination": True,
+        }
+    ]
+    * 2
+    + [{"origin_id": 0, "sparse": True}] * 2
+    + [{"origin_id": {3, 11}, "source_label": True}] * 2
+)
+bmssp_graph = Bmssp(graph)
+slow_down_solves(bmssp_graph)
+results = run_burst(bmssp_graph, queries)
+info = bmssp_graph.get_solve_coalescing_info()
+failed = info != {"solves": 4, "coalesced": len(queries) - 4, "in_flight": 0}
+for query, result in zip(queries, results):
+    if result != expected_graph.solve(**query):
+        failed = True
+# Each call should get its own copy of the shared result
+results[8]["predecessor"][0] = -2
+results[8]["distance_matrix"][0] = -2
+if results[9]["predecessor"][0] != -1 or results[9]["distance_matrix"][0] != 0:
+    failed = True
+if failed:
+    print("BMSSP Solve Coalescing Without Cache Test: FAIL")
+else:
+    print("BMSSP Solve Coalescing Without Cache Test: PASS")
+
+# Errors from a shared solve should be raised in every waiting solve
+bmssp_graph = Bmssp(graph)
+bmssp_graph.set_solve_cache()
+
+
+def failing_solve(**kwargs):
+    time.sleep(0.5)
+    raise RuntimeError("Solve failed")
+
+
+bmssp_graph._solve = failing_solve
+results = run_burst(bmssp_graph, [{"origin_id": 0}] * 4)
+info = bmssp_graph.get_solve_coalescing_info()
+if (
+    all(isinstance(result, RuntimeError) for result in results)
+    and info == {"solves": 1, "coalesced": 3, "in_flight": 0}
+    and bmssp_graph.get_solve_cache_info()["entries"] == 0
+):
+    print("BMSSP Solve Coalescing Error Test: PASS")
+else:
+    print("BMSSP Solve Coalescing Error Test: FAIL")
+
+# Solves that were running during a clear should not be cached or shared with later solves
+bmssp_graph = Bmssp(graph)
+bmssp_graph.set_solve_cache()
+slow_down_solves(bmssp_graph)
+first_thread = threading.Thread(target=bmssp_graph.solve, args=(0,))
+first_thread.start()
+time.sleep(0.1)
+bmssp_graph.clear_solve_cache()
+bmssp_graph.solve(0)
+first_thread.join()
+info = bmssp_graph.get_solve_coalescing_info()
+if (
+    info["solves"] == 2
+    and info["coalesced"] == 0
+    and bmssp_graph.get_solve_cache_info()["entries"] == 1
+):
+    print("BMSSP Solve Coalescing Clear Test: PASS")
+else:
+    print("BMSSP Solve Coalescing Clear Test: FAIL")
+
+# Solves that were running during a graph change should not be cached
+bmssp_graph = Bmssp(graph)
+bmssp_graph.set_solve_cache()
+slow_down_solves(bmssp_graph)
+path = expected_graph.solve(0, destination_ids[-1])["path"]
+first_thread = threading.Thread(target=bmssp_graph.solve, args=(0,))
+first_thread.start()
+time.sleep(0.1)
+bmssp_graph.update_edge_weight(path[0], path[1], 1000)
+first_thread.join()
+entries = bmssp_graph.get_solve_cache_info()["entries"]
+changed_graph = [dict(neighbors) for neighbors in graph]
+changed_graph[path[0]][path[1]] = 1000
+if entries == 0 and bmssp_graph.solve(0) == Bmssp(changed_graph).solve(0):
+    print("BMSSP Solve Coalescing Graph Change Test: PASS")
+else:
+    print("BMSSP Solve Coalescing Graph Change Test: FAIL")
@@ -0,0 +1,83 @@
+# General Imports
+import random
+
+
+def make_random_graph(num_nodes, num_edges, seed, get_weight=None, ring=True):
+    """
+    Function:
+
+    - Return a random list of dictionaries graph.
+
+    Required Arguments:
+
+    - `num_nodes`
+        - Type: int
+        - What: The number of nodes in the graph
+    - `num_edges`
+        - Type: int
+        - What: The number of random edges to try to add
+        - Note: Self loops are skipped and repeated edges overwrite the earlier weight.
+    - `seed`
+        - Type: int
+        - What: The seed for the random module
+
+    Optional Arguments:
+
+    - `get_weight`
+        - Type: function | None
+        - Default: None
+        - What: A function with no arguments that returns the weight of each random edge
+        - Note: If None, weights are random floats from 0 to 10 rounded to 3 decimal places.
+    - `ring`
+        - Type: bool
+        - Default: True
+        - What: Whether to start from a ring of weight 10 edges (node i to node i + 1) such that every node is reachable from every other node
+        - Note: If False, some nodes may not be reachable from others.
+    """
+    if get_weight is None:
+        get_weight = lambda: round(random.random() * 10, 3)
+    random.seed(seed)
+    if ring:
+        # Start from a ring so every node is reachable from every other node
+        graph = [{(idx + 1) % num_nodes: 10} for idx in range(num_nodes)]
+    else:
+        graph = [{} for _ in range(num_nodes)]
+    for _ in range(num_edges):
+        origin_idx = random.randrange(num_nodes)
+        destination_idx = random.randrange(num_nodes)
+        if origin_idx != destination_idx:
+            graph[origin_idx][destination_idx] = get_weight()
+    return graph
+
+
+def make_grid_graph(grid_size, get_weight):
+    """
+    Function:
+
+    - Return a square grid list of dictionaries graph where node row * grid_size + col is connected to each of its (up to 4) neighbors.
+
+    Required Arguments:
+
+    - `grid_size`
+        - Type: int
+        - What: The number of rows (and columns) in the grid
+    - `get_weight`
+        - Type: function
+        - What: A function with no arguments that returns the weight of each edge
+
+    Optional Arguments:
+
+    - None
+    """
+    graph = [{} for _ in range(grid_size**2)]
+    for row in range(grid_size):
+        for col in range(grid_size):
+            for row_step, col_step in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+                if (
+                    0 <= row + row_step < grid_size
+                    and 0 <= col + col_step < grid_size
+                ):
+                    graph[row * grid_size + col][
+                        (row + row_step) * grid_size + col + col_step
+                    ] = get_weight()
+    return graph